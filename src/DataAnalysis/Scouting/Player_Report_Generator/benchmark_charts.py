@@ -0,0 +1,124 @@
+"""
+File: benchmark_charts.py
+
+Description:
+Benchmarks drawing the charts of one player report.
+
+session: draws them once on a new figure per chart and once redrawn in a single
+ChartSession, and prints the time and memory of each way along with whether both
+gave the same pixels.
+tiers: draws them in every format and dpi of CHART_TIERS plus svg, and prints the
+time and the size of the files of each.
+
+    python benchmark_charts.py [session|tiers] [player_file.csv] [output_directory]
+
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import numpy as np
+from PIL import Image
+from player_data_analyzer import generate_player_report, PLAYER_DATA_DIRECTORY
+# The charting package is shared by the report generators of Scouting/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from charting import create_bar_chart, ChartSession, ChartRenderer, CHART_TIERS
+
+PLAYER_FILE = os.path.join(PLAYER_DATA_DIRECTORY, 'Matt_Caggiano.csv')
+OUTPUT_DIRECTORY = 'chart_benchmark'
+
+
+class ChartRecorder:
+    """Stands in for a ChartRenderer and keeps the charts of a report instead of drawing them."""
+    def __init__(self):
+        self.charts = []
+
+    def submit(self, data_dict, section, y_max, title, output_filename='bar_chart.png'):
+        self.charts.append((data_dict, section, y_max, title, os.path.basename(output_filename)))
+
+def draw_charts(charts, output_directory, session=None):
+    """
+    Draws every chart into the output directory.
+
+    Returns:
+    - (seconds, peak): Wall time and peak traced memory in bytes, peak is 0 unless tracemalloc is tracing.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    for data_dict, section, y_max, title, filename in charts:
+        create_bar_chart(data_dict, section, y_max, title, os.path.join(output_directory, filename), session=session)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+    return seconds, peak
+
+def same_pixels(first_directory, second_directory, filenames):
+    # Filenames whose images differ between both directories
+    different = []
+    for filename in filenames:
+        first = np.asarray(Image.open(os.path.join(first_directory, filename)))
+        second = np.asarray(Image.open(os.path.join(second_directory, filename)))
+        if first.shape != second.shape or not np.array_equal(first, second):
+            different.append(filename)
+    return different
+
+def record_charts(player_file, output_directory):
+    # Charts of the player's report
+    recorder = ChartRecorder()
+    generate_player_report(player_file, output_directory, recorder)
+    return recorder.charts
+
+def benchmark_session(player_file, output_directory):
+    charts = record_charts(player_file, output_directory)
+    filenames = [chart[-1] for chart in charts]
+
+    figure_directory = os.path.join(output_directory, 'figure')
+    session_directory = os.path.join(output_directory, 'session')
+
+    figure_seconds, _ = draw_charts(charts, figure_directory)
+    session = ChartSession()
+    session_seconds, _ = draw_charts(charts, session_directory, session)
+
+    tracemalloc.start()
+    _, figure_peak = draw_charts(charts, figure_directory)
+    _, session_peak = draw_charts(charts, session_directory, session)
+    tracemalloc.stop()
+    session.close()
+
+    different = same_pixels(figure_directory, session_directory, filenames)
+    print(f"{len(charts)} charts of {os.path.basename(player_file)}")
+    print(f"{'Mode':<12}{'Seconds':>10}{'ms/chart':>10}{'Peak MB':>10}")
+    for mode, seconds, peak in [('figure', figure_seconds, figure_peak), ('session', session_seconds, session_peak)]:
+        print(f"{mode:<12}{seconds:>10.2f}{1000 * seconds / len(charts):>10.1f}{peak / 2**20:>10.1f}")
+    print(f"Pixel-identical: {not different}" + (f" ({len(different)} differ: {different[:5]})" if different else ''))
+
+
+def benchmark_tiers(player_file, output_directory):
+    charts = record_charts(player_file, output_directory)
+    tiers = [(tier, output_format, dpi) for tier, (output_format, dpi) in CHART_TIERS.items()] + [('svg', 'svg', 300)]
+
+    print(f"{len(charts)} charts of {os.path.basename(player_file)}")
+    print(f"{'Tier':<10}{'Format':>8}{'Dpi':>6}{'Seconds':>10}{'ms/chart':>10}{'KB/chart':>10}{'Total MB':>10}")
+    for tier, output_format, dpi in tiers:
+        tier_directory = os.path.join(output_directory, tier)
+        os.makedirs(tier_directory, exist_ok=True)
+        start = time.perf_counter()
+        with ChartRenderer(workers=0, reuse_figure=True, output_format=output_format, dpi=dpi) as renderer:
+            for data_dict, section, y_max, title, filename in charts:
+                renderer.submit(data_dict, section, y_max, title, os.path.join(tier_directory, filename))
+        seconds = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(tier_directory, filename)) for filename in os.listdir(tier_directory))
+        print(f"{tier:<10}{output_format:>8}{dpi:>6}{seconds:>10.2f}{1000 * seconds / len(charts):>10.1f}"
+              f"{size / 1024 / len(charts):>10.1f}{size / 2**20:>10.2f}")
+
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'session'
+    player_file = sys.argv[2] if len(sys.argv) > 2 else PLAYER_FILE
+    output_directory = sys.argv[3] if len(sys.argv) > 3 else OUTPUT_DIRECTORY
+    if mode == 'tiers':
+        benchmark_tiers(player_file, output_directory)
+    else:
+        benchmark_session(player_file, output_directory)
@@ -0,0 +1,14 @@
+"""
+Charting shared by the Player_Report_Generator and Team_Offense_Generator reports.
+matplotlib is imported lazily, with the Agg backend, the first time a chart is drawn.
+"""
+
+from .bar_chart import (
+    CHART_TIERS,
+    ChartRenderer,
+    ChartSession,
+    chart_content_hash,
+    chart_is_current,
+    create_bar_chart,
+    validate_chart,
+)
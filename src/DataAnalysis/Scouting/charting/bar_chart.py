@@ -0,0 +1,383 @@
+"""
+File: bar_chart.py
+
+Description:
+Bar charts of the player and team scouting reports. matplotlib is only imported
+once a chart is drawn, so importing this module stays cheap for runs and tools
+that never draw one.
+
+"""
+
+import os
+import hashlib
+
+# Bump when the look of the charts changes so every cached chart is redrawn
+CHART_VERSION = 1
+
+# (output format, dpi) of each chart tier, dpi only matters for the text of vector formats
+CHART_TIERS = {
+    'draft': ('png', 100),     # Fast and light, for checking a report
+    'standard': ('png', 300),  # What every report used to get
+    'final': ('pdf', 300),     # Vector charts for the printed packets
+}
+
+# Metadata entry each format keeps the content hash of a chart in
+HASH_METADATA_KEYS = {'png': 'ChartHash', 'pdf': 'Subject', 'svg': 'Description'}
+
+def load_pyplot():
+    """
+    Imports matplotlib.pyplot with the non-interactive Agg backend the first time a chart is drawn.
+
+    Returns:
+    - plt: The matplotlib.pyplot module.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def use_chart_style(plt):
+    """
+    Applies the seaborn darkgrid style of the charts. matplotlib 3.6 renamed it to
+    'seaborn-v0_8-darkgrid' and later versions removed the old name.
+    """
+    if 'seaborn-v0_8-darkgrid' in plt.style.available:
+        plt.style.use('seaborn-v0_8-darkgrid')
+    else:
+        plt.style.use('seaborn-darkgrid')
+
+def create_bar_chart(data_dict, section, y_max, title, output_filename='bar_chart.png', content_hash=None, session=None, dpi=300):
+    """
+    Creates a professional-looking bar chart from a dictionary of key-value pairs with a color scheme
+    based on the provided section number and sets the Y-axis limit based on y_max.
+    
+    Parameters:
+    - data_dict (dict): Dictionary containing key-value pairs to plot.
+    - section (int): An integer between 1 and 9 determining the color scheme.
+    - y_max (int): Y-axis limit. Must be one of [15, 25, 50, 100, 150, 200].
+    - title (str): The title of the bar chart.
+    - output_filename (str): The filename to save the bar chart image, its extension (png, pdf or svg) sets the format.
+    - content_hash (str): Optional chart_content_hash stored in the image so unchanged charts can be skipped.
+    - session (ChartSession): Optional session whose figure is redrawn instead of creating a new one.
+    - dpi (int): Resolution of png images.
+    """
+    validate_chart(data_dict, section, y_max, title)
+    plt = load_pyplot()
+
+    # Define color schemes for sections 1-9
+    color_schemes = {
+        1: ['#1f77b4'] * len(data_dict),  # Blue
+        2: ['#ff7f0e'] * len(data_dict),  # Orange
+        3: ['#2ca02c'] * len(data_dict),  # Green
+        4: ['#d62728'] * len(data_dict),  # Red
+        5: ['#9467bd'] * len(data_dict),  # Purple
+        6: ['#8c564b'] * len(data_dict),  # Brown
+        7: ['#e377c2'] * len(data_dict),  # Pink
+        8: ['#7f7f7f'] * len(data_dict),  # Gray
+        9: ['#bcbd22'] * len(data_dict),  # Olive
+    }
+
+    # Alternatively, use different colors for each bar within a section
+    # Uncomment the following block if you prefer varied colors within a section
+    """
+    color_schemes = {
+        1: list(mcolors.TABLEAU_COLORS.values()),
+        2: list(mcolors.CSS4_COLORS.values()),
+        3: list(mcolors.XKCD_COLORS.values()),
+        4: list(mcolors.BASE_COLORS.values()),
+        5: list(mcolors.CSS4_COLORS.values()),
+        6: list(mcolors.TABLEAU_COLORS.values()),
+        7: list(mcolors.XKCD_COLORS.values()),
+        8: list(mcolors.BASE_COLORS.values()),
+        9: list(mcolors.TABLEAU_COLORS.values()),
+    }
+    # Cycle through colors if there are more bars than colors available
+    colors = [color_schemes[section][i % len(color_schemes[section])] for i in range(len(data_dict))]
+    """
+    
+    # Function to wrap labels
+    def wrap_label(label):
+        return '\n'.join(label.split('-'))
+    
+    # Assign colors based on the section
+    colors = color_schemes[section]
+
+    # Extract keys and values
+    keys = list(data_dict.keys())
+    values = list(data_dict.values())
+    
+    # Wrap labels if they exceed max_char
+    wrapped_keys = [wrap_label(label) for label in keys]
+
+    # Determine rotation angle
+    rotation_angle = should_rotate_labels(wrapped_keys)
+
+    if session is None:
+        # Create the bar chart with a professional style
+        use_chart_style(plt)  # Professional-looking style
+
+        plt.figure(figsize=(12, 8))  # Larger figure size for better visibility
+    else:
+        session.clear()
+    bars = plt.bar(wrapped_keys, values, color=colors, edgecolor='black')
+
+    # Add title and labels with larger fonts
+    plt.title(title, fontsize=22, fontweight='bold')
+    plt.xlabel('Categories', fontsize=20, fontweight='bold', labelpad=20)
+    plt.ylabel('Total Plays', fontsize=20, fontweight='bold', labelpad=20)
+
+    # Set Y-axis limit based on y_max
+    plt.ylim(0, y_max)
+
+    # Customize tick labels with larger fonts
+    plt.xticks(fontsize=17, rotation=rotation_angle)  # Rotate x labels if they are long
+    plt.yticks(fontsize=17)
+
+    # Add value labels on top of each bar with enhanced styling
+    for bar in bars:
+        height = bar.get_height()
+        # Only annotate if the bar height is within the y_max
+        if height <= y_max:
+            plt.annotate(f'{height}',
+                         xy=(bar.get_x() + bar.get_width() / 2, height),
+                         xytext=(0, 8),  
+                         textcoords="offset points",
+                         ha='center', va='bottom',
+                         fontsize=18, fontweight='bold', color='black')
+        else:
+            plt.annotate('N/A',
+                         xy=(bar.get_x() + bar.get_width() / 2, y_max),
+                         xytext=(0, 8),
+                         textcoords="offset points",
+                         ha='center', va='bottom',
+                         fontsize=18, fontweight='bold', color='red')
+
+    # Add gridlines for better readability
+    plt.grid(axis='y', linestyle='--', alpha=0.7)
+
+    # Improve layout
+    plt.tight_layout()
+
+    # Ensure the output directory exists
+    output_dir = os.path.dirname(output_filename)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Save the plot to a file with high resolution
+    metadata = {HASH_METADATA_KEYS[chart_format(output_filename)]: content_hash} if content_hash else None
+    plt.savefig(output_filename, dpi=dpi, bbox_inches='tight', metadata=metadata)
+    if session is None:
+        plt.close()
+    print(f'Bar chart saved as {output_filename}')
+    
+    
+def validate_chart(data_dict, section, y_max, title):
+    """
+    Raises the same errors as create_bar_chart for arguments it cannot draw, so
+    queued charts fail when they are submitted instead of inside a worker.
+    """
+    if not isinstance(data_dict, dict):
+        raise TypeError("data_dict must be a dictionary.")
+
+    if not isinstance(section, int) or not (1 <= section <= 9):
+        raise ValueError("section must be an integer between 1 and 9.")
+
+    if not isinstance(y_max, int) or y_max not in [15, 25, 50, 100, 150, 200]:
+        raise ValueError("y_max must be an integer and one of the following values: 15, 25, 50, 100, 150, 200.")
+
+    if not isinstance(title, str):
+        raise TypeError("title must be a string.")
+
+def chart_format(output_filename):
+    # Image format of a chart file, from its extension
+    return os.path.splitext(output_filename)[1].lstrip('.').lower()
+
+def remove_other_formats(output_filename):
+    """
+    Removes the copies of a chart in the other formats, so a report folder never holds
+    a stale chart that pdflatex would pick over the new one (it tries .pdf before .png).
+    """
+    base, extension = os.path.splitext(output_filename)
+    for other_format in HASH_METADATA_KEYS:
+        other_filename = base + '.' + other_format
+        if other_filename != base + extension and os.path.isfile(other_filename):
+            os.remove(other_filename)
+
+def chart_content_hash(data_dict, section, y_max, title, dpi=300):
+    """
+    Hashes everything a bar chart is drawn from.
+    
+    Returns:
+    - content_hash (str): sha256 hex digest of the chart content.
+    """
+    content = repr((CHART_VERSION, list(data_dict.items()), section, y_max, title, dpi))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def chart_is_current(output_filename, content_hash):
+    """
+    Checks whether the image at output_filename was drawn from the same content.
+    """
+    if not os.path.isfile(output_filename):
+        return False
+    if chart_format(output_filename) != 'png':
+        # Vector formats keep the hash as plain text in their metadata
+        with open(output_filename, 'rb') as f:
+            return content_hash.encode('ascii') in f.read()
+    from PIL import Image
+    try:
+        with Image.open(output_filename) as image:
+            return image.info.get('ChartHash') == content_hash
+    except OSError:
+        return False
+
+class ChartSession:
+    """
+    Keeps one figure and axes that create_bar_chart redraws each chart on, so the
+    style is applied and the figure created once for many charts instead of once per chart.
+    Charts drawn in a session are pixel-identical to the ones drawn on a new figure.
+    """
+    def __init__(self):
+        plt = load_pyplot()
+        use_chart_style(plt)  # Professional-looking style
+        self.figure = plt.figure(figsize=(12, 8))
+        self.axes = self.figure.add_subplot()
+        self.subplot_params = {name: getattr(self.figure.subplotpars, name)
+                               for name in ['left', 'bottom', 'right', 'top', 'wspace', 'hspace']}
+
+    def clear(self):
+        """Makes the session figure current with empty axes at their initial position."""
+        load_pyplot().figure(self.figure.number)
+        self.axes.clear()
+        # clear keeps the data limits, a chart without bars would be scaled to the previous one
+        self.axes.relim()
+        # Undoes the tight_layout of the previous chart
+        self.figure.subplots_adjust(**self.subplot_params)
+
+    def close(self):
+        load_pyplot().close(self.figure)
+
+# Session of a rendering worker that reuses its figure
+chart_session = None
+
+def start_chart_worker(reuse_figure=False):
+    """Switches a rendering worker to the non-interactive Agg backend and opens its session."""
+    global chart_session
+    load_pyplot()
+    if reuse_figure:
+        chart_session = ChartSession()
+
+def render_chart(data_dict, section, y_max, title, output_filename, content_hash, dpi):
+    # Chart job of a rendering worker
+    create_bar_chart(data_dict, section, y_max, title, output_filename, content_hash, chart_session, dpi)
+
+class ChartRenderer:
+    """
+    Queues bar charts and renders them across a process pool using the Agg backend.
+    A chart whose image already holds the same content hash is skipped.
+    
+    submit takes the same arguments as create_bar_chart. Errors of a chart are raised
+    by submit for invalid arguments and by wait or close for rendering errors.
+    Charts are written in the renderer's format, whatever the extension of their filename,
+    and their copies in the other formats are removed.
+    
+    Parameters:
+    - workers (int): Number of rendering processes (defaults to the number of cores).
+      0 renders every chart in the calling process as soon as it is submitted.
+    - reuse_figure (bool): Redraw one ChartSession figure per process instead of creating a figure per chart.
+    - tier (str): Key of CHART_TIERS giving the output format and dpi.
+    - output_format (str): 'png', 'pdf' or 'svg', overrides the format of the tier.
+    - dpi (int): Overrides the dpi of the tier.
+    """
+    def __init__(self, workers=None, reuse_figure=False, tier='standard', output_format=None, dpi=None):
+        tier_format, tier_dpi = CHART_TIERS[tier]
+        self.output_format = output_format or tier_format
+        if self.output_format not in HASH_METADATA_KEYS:
+            raise ValueError(f"output_format must be one of: {', '.join(HASH_METADATA_KEYS)}.")
+        self.dpi = dpi or tier_dpi
+        self.executor = None
+        self.session = None
+        if workers != 0:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=workers, initializer=start_chart_worker,
+                                                initargs=(reuse_figure,))
+        elif reuse_figure:
+            self.session = ChartSession()
+        self.futures = []
+        self.rendered = 0
+        self.skipped = 0
+
+    def submit(self, data_dict, section, y_max, title, output_filename='bar_chart.png'):
+        validate_chart(data_dict, section, y_max, title)
+        output_filename = os.path.splitext(output_filename)[0] + '.' + self.output_format
+        remove_other_formats(output_filename)
+        content_hash = chart_content_hash(data_dict, section, y_max, title, self.dpi)
+        if chart_is_current(output_filename, content_hash):
+            self.skipped += 1
+            return
+        
+        self.rendered += 1
+        if self.executor is None:
+            create_bar_chart(data_dict, section, y_max, title, output_filename, content_hash, self.session, self.dpi)
+        else:
+            self.futures.append(self.executor.submit(render_chart, data_dict, section, y_max, title,
+                                                     output_filename, content_hash, self.dpi))
+
+    def wait(self):
+        """Waits for every queued chart, raising the first rendering error."""
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+            if self.session is not None:
+                self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+        if self.session is not None:
+            self.session.close()
+    
+    
+def should_rotate_labels(labels, max_labels=5):
+    """
+    Determines whether to rotate x-axis labels based on their length and count.
+    
+    Parameters:
+    - labels (list): List of label strings.
+    - max_length (int): Maximum allowed length before rotation.
+    - max_labels (int): Maximum allowed number of labels before rotation.
+    
+    Returns:
+    - rotation_angle (int): Angle to rotate labels. 0 means no rotation.
+    """
+    # Check if number of labels exceeds the threshold
+    if len(labels) > max_labels:
+        return 45  # Vertical rotation
+    
+    return 0  # No rotation
+
+# Example usage
+if __name__ == "__main__":
+    sample_data = {
+        'Category A': 23,
+        'Category B': 17,
+        'Category C': 35,
+        'Category D': 29,
+        'Category E': 12
+    }
+
+    section_number = 3  # Choose a number between 1 and 9
+    y_axis_max = 50      # Choose one of the following values: 25, 50, 100, 150
+    create_bar_chart(sample_data, section_number, y_axis_max, 'sample_bar_chart.png')
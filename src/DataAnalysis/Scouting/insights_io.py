@@ -0,0 +1,218 @@
+"""
+Insights files shared by the Player_Report_Generator and Team_Offense_Generator reports.
+NaN values are written as '-' and values of keys containing '%' are rounded to two
+decimal places, in the JSON the reports read or in the compact and msgpack modes.
+"""
+
+import math
+from json.encoder import encode_basestring_ascii
+
+# Optional faster and binary encoders of the compact and msgpack insights modes,
+# listed under Optional dependencies in the README (pip install orjson msgpack)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def replace_nan_and_round_percentages(obj):
+    """
+    Recursively traverse the input object, replacing NaN values with '-'
+    and rounding numeric values to two decimal places for keys containing '%'.
+    
+    Args:
+        obj (dict or list or other): The input data structure.
+        
+    Returns:
+        The processed data structure with NaNs replaced and percentages rounded.
+    """
+    if isinstance(obj, dict):
+        new_dict = {}
+        for key, value in obj.items():
+            if '%' in key:
+                # Handle keys containing '%'
+                if isinstance(value, float):
+                    if math.isnan(value):
+                        new_dict[key] = '-'
+                    else:
+                        new_dict[key] = round(value, 2)
+                elif isinstance(value, str):
+                    if value.strip().lower() == 'nan':
+                        new_dict[key] = '-'
+                    else:
+                        try:
+                            # Attempt to convert to float and round
+                            numeric_value = float(value)
+                            new_dict[key] = round(numeric_value, 2)
+                        except ValueError:
+                            # If conversion fails, retain original value
+                            new_dict[key] = value
+                elif isinstance(value, int):
+                    # Convert integer to float and round
+                    new_dict[key] = round(float(value), 2)
+                elif isinstance(value, (dict, list)):
+                    # Recursively process nested structures
+                    new_dict[key] = replace_nan_and_round_percentages(value)
+                else:
+                    # For other types, retain original value
+                    new_dict[key] = value
+            else:
+                # Handle keys not containing '%'
+                if isinstance(value, float):
+                    if math.isnan(value):
+                        new_dict[key] = '-'
+                    else:
+                        new_dict[key] = value
+                elif isinstance(value, str):
+                    if value.strip().lower() == 'nan':
+                        new_dict[key] = '-'
+                    else:
+                        new_dict[key] = value
+                elif isinstance(value, (dict, list)):
+                    # Recursively process nested structures
+                    new_dict[key] = replace_nan_and_round_percentages(value)
+                else:
+                    new_dict[key] = value
+        return new_dict
+    elif isinstance(obj, list):
+        return [replace_nan_and_round_percentages(item) for item in obj]
+    else:
+        # For non-dict and non-list items, handle NaN replacements if necessary
+        if isinstance(obj, float):
+            if math.isnan(obj):
+                return '-'
+            else:
+                return obj
+        elif isinstance(obj, str):
+            if obj.strip().lower() == 'nan':
+                return '-'
+            else:
+                return obj
+        else:
+            return obj
+
+# Output modes of write_insights_to_json
+INSIGHTS_MODES = ['compatible', 'compact', 'msgpack']
+
+def insights_json(obj, indent=4):
+    """
+    Serializes insights to the same JSON text as replace_nan_and_round_percentages
+    followed by json.dump, in one pass: NaN values become '-' and values of keys
+    containing '%' are rounded to two decimal places while the text is built.
+
+    Args:
+        obj (dict or list or other): The insights.
+        indent (int): Spaces per indentation level, None for compact JSON without whitespace.
+
+    Returns:
+        str: The JSON text.
+    """
+    chunks = []
+    if indent is None:
+        encode_insight_value(obj, False, chunks, '', '', ':')
+    else:
+        encode_insight_value(obj, False, chunks, '\n', ' ' * indent, ': ')
+    return ''.join(chunks)
+
+def encode_insight_value(value, percent, chunks, newline, indent, key_separator):
+    # Appends the JSON text of a value, percent is True for the value of a key containing '%'
+    if isinstance(value, dict):
+        if not value:
+            chunks.append('{}')
+            return
+        inner = newline + indent
+        separator = '{' + inner
+        for key, item in value.items():
+            item_percent = '%' in key
+            chunks.append(separator)
+            chunks.append(encode_basestring_ascii(key))
+            chunks.append(key_separator)
+            encode_insight_value(item, item_percent, chunks, inner, indent, key_separator)
+            separator = ',' + inner
+        chunks.append(newline + '}')
+    elif isinstance(value, list):
+        if not value:
+            chunks.append('[]')
+            return
+        inner = newline + indent
+        separator = '[' + inner
+        for item in value:
+            chunks.append(separator)
+            encode_insight_value(item, False, chunks, inner, indent, key_separator)
+            separator = ',' + inner
+        chunks.append(newline + ']')
+    else:
+        chunks.append(encode_insight_scalar(value, percent))
+
+def encode_insight_scalar(value, percent):
+    # JSON text of a value that is not a dict or a list, with the rules of replace_nan_and_round_percentages
+    if isinstance(value, str):
+        if value.strip().lower() == 'nan':
+            return '"-"'
+        if percent:
+            try:
+                return encode_insight_float(round(float(value), 2))
+            except ValueError:
+                pass
+        return encode_basestring_ascii(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return '"-"'
+        return encode_insight_float(round(value, 2) if percent else value)
+    if percent and isinstance(value, int):
+        return encode_insight_float(round(float(value), 2))
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
+
+def encode_insight_float(value):
+    # Same text as the json module gives a float
+    if value != value:
+        return 'NaN'
+    if value == math.inf:
+        return 'Infinity'
+    if value == -math.inf:
+        return '-Infinity'
+    return float.__repr__(value)
+
+def write_insights_to_json(insights, output_file, mode='compatible'):
+    """
+    Writes the insights with NaN values replaced and percentages rounded.
+
+    Args:
+        insights (dict): A dictionary containing categorized insights.
+        output_file (str): The path to the output file.
+        mode (str): 'compatible' for the indented JSON the reports read, 'compact' for JSON
+            without whitespace (with orjson when it is installed) or 'msgpack' for binary
+            msgpack (needs the msgpack package).
+    """
+    if mode == 'compatible':
+        with open(output_file, 'w') as f:
+            f.write(insights_json(insights))
+    elif mode == 'compact':
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(replace_nan_and_round_percentages(insights), option=orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_file, 'w') as f:
+                f.write(insights_json(insights, indent=None))
+    elif mode == 'msgpack':
+        if msgpack is None:
+            raise ImportError("The msgpack insights mode needs the msgpack package (pip install msgpack).")
+        with open(output_file, 'wb') as f:
+            f.write(msgpack.packb(replace_nan_and_round_percentages(insights)))
+    else:
+        raise ValueError(f"mode must be one of: {', '.join(INSIGHTS_MODES)}.")
+
+def insights_filename(name, mode='compatible'):
+    # File name of an insights file written in the given mode
+    return f"{name}.msgpack" if mode == 'msgpack' else f"{name}.json"
@@ -0,0 +1,339 @@
+"""
+Stat specs shared by the Player_Report_Generator and Team_Offense_Generator reports.
+The grouped statistics of every spec of a report are aggregated together by a
+StatBatch, and run_stat_spec turns the aggregated rows into the insight of a spec.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from charting import create_bar_chart
+
+# Aggregation of every efficiency statistic
+STAT_AGGREGATIONS = {
+    'TotalPlays': 'sum',
+    'Total3ptShots': 'sum',
+    'Total3ptMakes': 'sum',
+    '3pt%': 'mean',
+    'Total2ptShots': 'sum',
+    'Total2ptMakes': 'sum',
+    '2pt%': 'mean',
+    'TotalMidRangeShots': 'sum',
+    'TotalMidRangeMakes': 'sum',
+    'MidRange%': 'mean',
+    'EFG%': 'mean',
+    'Turnover': 'sum',
+    'Foul': 'sum'
+}
+MEAN_COLUMNS = [column for column, aggregation in STAT_AGGREGATIONS.items() if aggregation == 'mean']
+
+# Shooting percentages and the makes and shots they are taken from
+SHOOTING_PERCENTAGES = [
+    ('3pt%', 'Total3ptMakes', 'Total3ptShots'),
+    ('2pt%', 'Total2ptMakes', 'Total2ptShots'),
+    ('MidRange%', 'TotalMidRangeMakes', 'TotalMidRangeShots')
+]
+
+
+def totals_chart_spec(bars, chart):
+    """
+    Chart of the total plays of efficiency specs written earlier in the same insight.
+
+    Args:
+        bars (list): (label, efficiency key) of each bar.
+        chart (tuple): The chart.
+    """
+    return {'kind': 'totals_chart', 'bars': bars, 'chart': chart}
+
+
+class StatBatch:
+    """
+    Row selections of a whole report, aggregated together with the statistics of
+    compute_grouped_statistics in a single groupby on (selection, group).
+
+    A selection is a list of row positions of the data and the column its rows are grouped by.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.selections = []
+        self.ids = {}
+        self.frame_means = set()
+
+    def add(self, positions, group, frame_means=False):
+        """
+        Adds a selection, or finds the same one added before.
+
+        Args:
+            positions (np.ndarray): Row positions of the data, in order.
+            group (str): Column the rows are grouped by.
+            frame_means (bool): Also take the means of each group the way DataFrame.agg
+                                does for a single frame, as the player report's find_player_efficiency used to.
+
+        Returns:
+            int: Id of the selection.
+        """
+        key = (positions.tobytes(), group)
+        if key not in self.ids:
+            self.ids[key] = len(self.selections)
+            self.selections.append((positions, group))
+        if frame_means:
+            self.frame_means.add(self.ids[key])
+        return self.ids[key]
+
+    def aggregate(self):
+        """Runs the groupby of every selection added so far."""
+        lengths = [len(positions) for positions, _ in self.selections]
+        positions = np.concatenate([positions for positions, _ in self.selections] + [np.empty(0, dtype=np.intp)])
+        batch = self.data.iloc[positions][list(STAT_AGGREGATIONS)].reset_index(drop=True)
+        batch['Selection'] = np.repeat(np.arange(len(self.selections)), lengths)
+        batch['Group'] = np.concatenate([self.data[group].to_numpy(dtype=object)[positions]
+                                         for positions, group in self.selections] + [np.empty(0, dtype=object)])
+
+        # Groups come out sorted, like the groupby of compute_grouped_statistics
+        grouped = batch.groupby(['Selection', 'Group'])
+        aggregated = grouped.agg(STAT_AGGREGATIONS)
+        self.stats = [{} for _ in self.selections]
+        self.records = [{} for _ in self.selections]
+        for ((selection, group), row), record in zip(aggregated.to_dict('index').items(), statistic_records(aggregated)):
+            self.stats[selection][group] = row
+            self.records[selection][group] = record
+
+        # Groupby means are summed differently than the means of a single frame
+        framed = aggregated[aggregated.index.get_level_values('Selection').isin(list(self.frame_means))].copy()
+        members = grouped.indices
+        for column in MEAN_COLUMNS:
+            values = batch[column]
+            framed[column] = [values.iloc[members[index]].mean() for index in framed.index]
+        self.frame_records = {index: record for index, record in zip(framed.index, statistic_records(framed))}
+
+    def groups(self, selection):
+        """
+        Returns the aggregated rows of a selection.
+
+        Args:
+            selection (int): Id of the selection.
+
+        Returns:
+            dict: Aggregated row of each group, in sorted group order.
+        """
+        return self.stats[selection]
+
+    def statistics(self, selection):
+        """
+        Returns the efficiency statistics of a selection.
+
+        Args:
+            selection (int): Id of the selection.
+
+        Returns:
+            dict: Statistics of each group, in sorted group order.
+        """
+        return self.records[selection]
+
+    def frame_statistics(self, selection, group):
+        """
+        Returns the efficiency statistics of one group of a selection added with frame_means.
+
+        Args:
+            selection (int): Id of the selection.
+            group: Value of the group.
+
+        Returns:
+            dict: The statistics.
+        """
+        return self.frame_records[(selection, group)]
+
+
+def run_stat_spec(spec, selection, batch: StatBatch, efficiencies, output_directory, renderer=None):
+    """
+    Computes an efficiency, proportion or totals chart spec from the aggregated batch and draws its chart.
+
+    Args:
+        spec (dict): The spec.
+        selection (dict): Selection ids of the spec.
+        batch (StatBatch): The aggregated batch.
+        efficiencies (dict): Efficiency statistics of the section so far, by key.
+        output_directory (str): Directory to save the charts in.
+        renderer (ChartRenderer): Optional renderer the charts are queued on.
+
+    Returns:
+        The insight of the spec, None if it does not write one.
+    """
+    kind = spec['kind']
+    if kind == 'efficiency':
+        # Only the last group is kept, as in compute_grouped_statistics
+        records = list(batch.statistics(selection['rows']).values())
+        stats_dict = last_group_statistics(records, spec['label'], spec['key'])
+        efficiencies[spec['key']] = stats_dict
+        return stats_dict if spec['output'] else None
+
+    if kind == 'proportion':
+        proportion_dict = label_proportions(spec['labels'], spec['sourcefiles'], batch.groups(selection['rows']))
+        if spec['chart']:
+            draw_proportion_chart(proportion_dict, spec['chart'], output_directory, renderer)
+        if not spec['output']:
+            return None
+        return [proportion_dict] if spec['as_list'] else proportion_dict
+
+    if kind == 'totals_chart':
+        totals_dict = {}
+        for label, key in spec['bars']:
+            totals_dict[label] = efficiencies[key][key]['TotalPlays'] if key in efficiencies[key] else 0
+        draw_chart(totals_dict, spec['chart'], output_directory, renderer)
+    return None
+
+def sourcefile_totals(groups, sourcefiles):
+    # Total plays of each SourceFile from a selection grouped by 'SourceFile'
+    return [groups[sourcefile]['TotalPlays'] if sourcefile in groups else 0 for sourcefile in sourcefiles]
+
+def label_proportions(labels, sourcefiles, groups):
+    """
+    Builds the proportions dictionary of a proportion spec.
+
+    Args:
+        labels (list): Label of each SourceFile, SourceFiles with the same label are added up.
+        sourcefiles (list): SourceFile values.
+        groups (dict): Aggregated rows of the selection by SourceFile.
+
+    Returns:
+        dict: Proportion of each label and the 'Total Plays'.
+    """
+    proportions = play_proportions(sourcefile_totals(groups, sourcefiles))
+    proportion_dict = {}
+    for label, proportion in zip(labels, proportions):
+        proportion_dict[label] = proportion_dict[label] + proportion if label in proportion_dict else proportion
+    proportion_dict['Total Plays'] = proportions[-1]
+    return proportion_dict
+
+def draw_proportion_chart(proportion_dict, chart, output_directory, renderer=None):
+    # Charts the number of plays behind each proportion
+    total_plays = proportion_dict['Total Plays']
+    data_to_plot = {
+        key: int(proportion_dict[key] * total_plays)
+        for key in proportion_dict if key != 'Total Plays'
+    }
+    draw_chart(data_to_plot, chart, output_directory, renderer)
+
+def draw_chart(data_dict, chart, output_directory, renderer=None):
+    # Queues the chart on the renderer if there is one, otherwise draws it right away
+    filename, section, y_max, title = chart
+    draw = renderer.submit if renderer else create_bar_chart
+    draw(
+        data_dict=data_dict,
+        section=section,
+        y_max=y_max,
+        title=title,
+        output_filename=os.path.join(output_directory, filename)
+    )
+
+
+def statistic_records(grouped_stats):
+    """
+    Builds the efficiency statistics of every aggregated row at once. Shooting percentages
+    are taken from the makes and shots when there are shots, the mean percentage otherwise.
+
+    Args:
+        grouped_stats (pd.DataFrame): Rows aggregated with STAT_AGGREGATIONS.
+
+    Returns:
+        list: Statistics dictionary of each row, in order.
+    """
+    columns = {}
+    for column, aggregation in STAT_AGGREGATIONS.items():
+        values = grouped_stats[column].to_numpy()
+        columns[column] = values.astype(np.int64) if aggregation == 'sum' else values.astype(np.float64)
+
+    for percentage, makes, shots in SHOOTING_PERCENTAGES:
+        has_shots = columns[shots] != 0
+        ratio = np.divide(grouped_stats[makes].to_numpy(dtype=np.float64), grouped_stats[shots].to_numpy(dtype=np.float64),
+                          out=np.zeros(len(has_shots)), where=has_shots)
+        columns[percentage] = np.where(has_shots, ratio * 100, columns[percentage])
+
+    return pd.DataFrame(columns).to_dict('records')
+
+def compute_grouped_statistics(df, label, playertype, key):
+    """
+    Groups efficiency statistics by a player or team column and returns a dictionary with the aggregated statistics.
+
+    :param df: Input DataFrame containing basketball statistics data.
+    :param label: Fields written ahead of the statistics, {'StatDescription': ...} or {'File': ...}.
+    :param playertype: Column the rows are grouped by.
+    :param key: Key of the statistics.
+    :return: Dictionary with the statistics of the last group under the key.
+    """
+
+    # Group by the player or team column and aggregate statistics
+    grouped_stats = df.groupby(playertype).agg(STAT_AGGREGATIONS)
+
+    # Only the last group is kept under the key
+    return last_group_statistics(statistic_records(grouped_stats), label, key)
+
+def last_group_statistics(records, label, key):
+    # Statistics dictionary of compute_grouped_statistics from the records of the sorted groups
+    stats_dict = {}
+    if records:
+        stats_dict[key] = {**label, **records[-1]}
+    return stats_dict
+
+def compute_grouped_statistics_for_keys(df, requests):
+    """
+    Computes compute_grouped_statistics for many keys at once, with a single groupby
+    over all of their rows.
+
+    :param df: Input DataFrame containing basketball statistics data.
+    :param requests: List of (key, sourcefiles, label, playertype), one per statistic.
+    :return: Dictionary of the grouped statistics dictionary of each key.
+    """
+    batch = StatBatch(df)
+    selections = []
+    for key, sourcefiles, label, playertype in requests:
+        if isinstance(sourcefiles, str):
+            sourcefiles = [sourcefiles]
+        positions = np.flatnonzero(df['SourceFile'].isin(sourcefiles).to_numpy())
+        selections.append((key, label, batch.add(positions, playertype)))
+    batch.aggregate()
+
+    return {
+        key: last_group_statistics(list(batch.statistics(selection).values()), label, key)
+        for key, label, selection in selections
+    }
+
+def play_proportions(play_totals):
+    """
+    Turns play totals into proportions of their sum.
+
+    :param play_totals: List of total plays.
+    :return: List of proportions followed by the total of all plays.
+    """
+    total_plays_all = 0
+    for total_plays in play_totals:
+        total_plays_all += total_plays
+
+    # Calculate the proportions for each total
+    proportions = [float(total) / float(total_plays_all) if total_plays_all > 0 else 0 for total in play_totals]
+
+    # Convert total_plays_all to native int before appending
+    proportions.append(int(total_plays_all))
+
+    return proportions
+
+def find_play_proportions(df, sourcefile_list):
+    """
+    Finds the total play proportions based on the given 'SourceFile' value lists.
+
+    :param df: Input DataFrame containing the data.
+    :param sourcefile_list: List containing 'SourceFile' values.
+    :return: List of proportions of total plays for each 'SourceFile' value.
+    """
+    play_totals = []
+
+    # Calculate the total plays for each 'SourceFile' value
+    for sourcefile in sourcefile_list:
+        filtered_df = df[df['SourceFile'] == sourcefile]
+        if filtered_df.empty:
+            play_totals.append(0)
+            continue
+        play_totals.append(filtered_df['TotalPlays'].sum())
+
+    return play_proportions(play_totals)
@@ -1,25 +1,47 @@
 import pandas as pd
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 #   Run in Terminal in order get all data seperated.
 #   python seperate_player_data.py player_cut_basket_efficiency.csv player_cut_efficiency.csv player_cut_flash_efficiency.csv player_cut_screen_efficiency.csv player_handoffs_bhleft_dribble_efficiency.csv player_handoffs_bhleft_efficiency.csv player_handoffs_bhleft_stationary_efficiency.csv player_handoffs_bhright_dribble_efficiency.csv player_handoffs_bhright_efficiency.csv player_handoffs_bhright_stationary_efficiency.csv player_handoffs_dribble_efficiency.csv player_handoffs_efficiency.csv player_handoffs_stationary_efficiency.csv player_handoffs_top_dribble_efficiency.csv player_handoffs_top_efficiency.csv player_handoffs_top_stationary_efficiency.csv player_iso_efficiency.csv player_iso_left_efficiency.csv player_iso_right_efficiency.csv player_iso_top_efficiency.csv player_misc_efficiency.csv player_offscreens_curl_efficiency.csv player_offscreens_efficiency.csv player_offscreens_flare_efficiency.csv player_offscreens_leftshoulder_curl_efficiency.csv player_offscreens_leftshoulder_efficiency.csv player_offscreens_leftshoulder_straight_efficiency.csv player_offscreens_rightshoulder_curl_efficiency.csv player_offscreens_rightshoulder_efficiency.csv player_offscreens_rightshoulder_flare_efficiency.csv player_offscreens_rightshoulder_straight_efficiency.csv player_offscreens_straight_efficiency.csv player_pnr_bhhigh_efficiency.csv player_pnr_bhhigh_offpick_efficiency.csv player_pnr_bhhigh_rejectpick_efficiency.csv player_pnr_bhleft_efficiency.csv player_pnr_bhleft_offpick_efficiency.csv player_pnr_bhleft_rejectpick_efficiency.csv player_pnr_bhright_efficiency.csv player_pnr_bhright_offpick_efficiency.csv player_pnr_bhright_rejectpick_efficiency.csv player_pnr_efficiency.csv player_pnr_offpick_efficiency.csv player_pnr_rejectpick_efficiency.csv player_post_efficiency.csv player_post_faceup_efficiency.csv player_post_leftblock_efficiency.csv player_post_leftblock_faceup_efficiency.csv player_post_leftblock_leftshoulder_efficiency.csv player_post_leftblock_rightshoulder_efficiency.csv player_post_leftshoulder_efficiency.csv player_post_middle_efficiency.csv player_post_middle_faceup_efficiency.csv player_post_middle_leftshoulder_efficiency.csv player_post_middle_rightshoulder_efficiency.csv player_post_rightblock_efficiency.csv player_post_rightblock_faceup_efficiency.csv player_post_rightblock_leftshoulder_efficiency.csv player_post_rightblock_rightshoulder_efficiency.csv player_post_rightshoulder_efficiency.csv player_rollman_efficiency.csv player_rollman_leftdrive_efficiency.csv player_rollman_leftdrive_pop_efficiency.csv player_rollman_leftdrive_slip_efficiency.csv player_rollman_pop_efficiency.csv player_rollman_rightdrive_efficiency.csv player_rollman_rightdrive_pop_efficiency.csv player_rollman_rightdrive_slip_efficiency.csv player_rollman_roll_efficiency.csv player_rollman_slip_efficiency.csv player_spotup_drive_efficiency.csv player_spotup_efficiency.csv player_spotup_jumpshot_efficiency.csv player_spotup_leftdrive_efficiency.csv player_spotup_rightdrive_efficiency.csv player_spotup_straightdrive_efficiency.csv player_transition_bh_efficiency.csv player_transition_leakouts_efficiency.csv player_transition_leftwing_efficiency.csv player_transition_rightwing_efficiency.csv player_transition_trailer_efficiency.csv playerefficiency.csv playerefficiencyleft.csv playerefficiencyright.csv twoplayer_bhhigh_rollmanpops_efficiency.csv twoplayer_iso_cut_efficiency.csv twoplayer_iso_spotupdrives_efficiency.csv twoplayer_iso_spotupjumpers_efficiency.csv twoplayer_pnr_cut_efficiency.csv twoplayer_pnr_spotupdrives_efficiency.csv twoplayer_pnr_spotupsdrives_efficiency.csv twoplayer_pnr_spotupsjumpers_efficiency.csv twoplayer_pnrbhhigh_cuts_efficiency.csv twoplayer_pnrbhhigh_rollman_efficiency.csv twoplayer_pnrbhhigh_rollmanpops_efficiency.csv twoplayer_pnrbhhigh_rollmanrolls_efficiency.csv twoplayer_pnrbhhigh_rollmanslips_efficiency.csv twoplayer_pnrbhhigh_spotupdrives_efficiency.csv twoplayer_pnrbhhigh_spotupjumper_efficiency.csv twoplayer_pnrbhleft_cuts_efficiency.csv twoplayer_pnrbhleft_rollman_efficiency.csv twoplayer_pnrbhleft_rollmanpops_efficiency.csv twoplayer_pnrbhleft_rollmanrolls_efficiency.csv twoplayer_pnrbhleft_rollmanslips_efficiency.csv twoplayer_pnrbhleft_spotupdrives_efficiency.csv twoplayer_pnrbhleft_spotupjumper_efficiency.csv twoplayer_pnrbhright_cuts_efficiency.csv twoplayer_pnrbhright_rollman_efficiency.csv twoplayer_pnrbhright_rollmanpops_efficiency.csv twoplayer_pnrbhright_rollmanrolls_efficiency.csv twoplayer_pnrbhright_rollmanslips_efficiency.csv twoplayer_pnrbhright_spotupdrives_efficiency.csv twoplayer_pnrbhright_spotupjumper_efficiency.csv twoplayer_post_cut_efficiency.csv twoplayer_post_spotupdrive_efficiency.csv twoplayer_post_spotupjumper_efficiency.csv player_data
 
-def combine_and_split_player_data(file_list, output_directory):
-    # Create an empty DataFrame to store the combined data
-    combined_df = pd.DataFrame()
+# Player columns a row is filed under, in the order their rows are written to a player file
+PLAYER_COLUMNS = ['Player', 'PrimaryPlayer', 'SecondaryPlayer']
 
-    # Process each file in the file list
+# Number of player files written at the same time
+EXPORT_THREADS = 8
+
+
+def read_efficiency_files(file_list, output_directory, loaded_frames=None):
+    """
+    Reads every efficiency csv file and combines them with a single concat.
+
+    Parameters:
+    - file_list: Names of the efficiency csv files.
+    - output_directory: Directory holding the files.
+    - loaded_frames: Optional dictionary mapping file names to DataFrames already read, such as
+                     the ones returned by export_efficiency.py, those files are not read again.
+
+    Returns:
+    - combined_df: DataFrame of all rows, with the name of their file in 'SourceFile'.
+    """
+    frames = []
     for file in file_list:
         try:
-            # Use the full path for each file
-            file = os.path.join(output_directory, file)
-            df = pd.read_csv(file)
+            if loaded_frames is not None and file in loaded_frames:
+                df = loaded_frames[file]
+            else:
+                # Use the full path for each file
+                file = os.path.join(output_directory, file)
+                df = pd.read_csv(file)
             if df.empty:
                 print(f"Skipping empty file: {file}")
                 continue
-            df['SourceFile'] = file.split('/')[-1]
-            combined_df = pd.concat([combined_df, df], ignore_index=True)
+            # Files written by export_efficiency.py already name their source
+            if 'SourceFile' not in df.columns:
+                df['SourceFile'] = file.split('/')[-1]
+            frames.append(df)
             
         except pd.errors.EmptyDataError:
             print(f"Error: {file} is empty or not formatted correctly. Skipping this file.")
@@ -29,66 +51,89 @@ def combine_and_split_player_data(file_list, output_directory):
             print(f"Unexpected error with file {file}: {e}. Skipping this file.")
             continue
 
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+def strip_text_columns(df):
+    """
+    Strips surrounding whitespace from every string, only looking at object columns.
+
+    Parameters:
+    - df: DataFrame to normalize in place.
+    """
+    for column in df.select_dtypes(include=['object']).columns:
+        values = df[column]
+        if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            df[column] = values.str.strip()
+        else:
+            # Mixed column, leave anything that is not a string untouched
+            is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+            df[column] = values.where(~is_text, values[is_text].str.strip())
+
+def player_file_path(team, player, output_directory):
+    """Path of the csv file of a player, team and player names made safe for the file system"""
+    # Replace spaces and slashes in team and player names with underscores for directory and file naming
+    team_directory = team.replace(' ', '_').replace('/', '_')
+    player_filename = player.replace(' ', '_') + '.csv'
+    return os.path.join(output_directory, team_directory, player_filename)
+
+def combine_and_split_player_data(file_list, output_directory, loaded_frames=None):
+    combined_df = read_efficiency_files(file_list, output_directory, loaded_frames)
+
     # Normalize data
-    combined_df = combined_df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
+    strip_text_columns(combined_df)
 
     # Remove duplicates
-    combined_df = combined_df.drop_duplicates()
-
-    # Check for the presence of 'Player', 'PrimaryPlayer', and 'SecondaryPlayer' columns
-    if 'Player' in combined_df.columns:
-        player_column = 'Player'
-        grouped_players = combined_df.groupby(['Team', player_column])
-        
-        # Export player data to respective CSV files for 'Player' column
-        for (team, player), group in grouped_players:
-            export_player_data(team, player, group, output_directory)
-    
-    # Check for the presence of 'PrimaryPlayer' and 'SecondaryPlayer'
+    combined_df = combined_df.drop_duplicates().reset_index(drop=True)
+
+    # A row belongs to its 'Player', or to both its 'PrimaryPlayer' and 'SecondaryPlayer'
+    player_columns = [column for column in PLAYER_COLUMNS[:1] if column in combined_df.columns]
     if 'PrimaryPlayer' in combined_df.columns and 'SecondaryPlayer' in combined_df.columns:
-        # Process 'PrimaryPlayer' column
-        primary_grouped = combined_df.groupby(['Team', 'PrimaryPlayer'])
-        
-        for (team, player), group in primary_grouped:
-            export_player_data(team, player, group, output_directory)
-        
-        # Process 'SecondaryPlayer' column
-        secondary_grouped = combined_df.groupby(['Team', 'SecondaryPlayer'])
-        
-        for (team, player), group in secondary_grouped:
-            export_player_data(team, player, group, output_directory)
+        player_columns += PLAYER_COLUMNS[1:]
+    if not player_columns:
+        return
+
+    # One (row, player) entry per player a row is filed under, all grouped at once
+    memberships = pd.concat([
+        pd.DataFrame({'Row': combined_df.index, 'Team': combined_df['Team'],
+                      'Name': combined_df[column], 'Role': role})
+        for role, column in enumerate(player_columns)
+    ], ignore_index=True).dropna(subset=['Team', 'Name'])
+    memberships['File'] = [player_file_path(team, player, output_directory)
+                           for team, player in zip(memberships['Team'], memberships['Name'])]
+    memberships = memberships.sort_values(['Role', 'Row'], kind='stable')
+
+    # Export player data, every player file is written exactly once
+    groups = [(group['Team'].iat[0], group['Name'].iat[0], combined_df.loc[group['Row']])
+              for _, group in memberships.groupby('File', sort=False)]
+    with ThreadPoolExecutor(max_workers=EXPORT_THREADS) as executor:
+        list(executor.map(lambda args: export_player_data(*args, output_directory), groups))
 
 
 def export_player_data(team, player, df, output_directory):
-    # Replace spaces and slashes in team and player names with underscores for directory and file naming
-    team_directory = team.replace(' ', '_').replace('/', '_')
-    player_filename = player.replace(' ', '_') + '.csv'
-    
-    # Construct the full path for the team's directory
-    team_path = os.path.join(output_directory, team_directory)
+    # Construct the full path for the player's CSV file
+    file_path = player_file_path(team, player, output_directory)
 
     # Ensure the team's directory exists
-    os.makedirs(team_path, exist_ok=True)  # Creates the directory if it doesn't exist
-    
-    # Construct the full path for the player's CSV file
-    player_file_path = os.path.join(team_path, player_filename)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)  # Creates the directory if it doesn't exist
     
     # Check if the player's file exists
-    if os.path.exists(player_file_path):
+    if os.path.exists(file_path):
         # Read the existing data
-        existing_df = pd.read_csv(player_file_path)
+        existing_df = pd.read_csv(file_path)
         # Combine existing data with new data
         combined_df = pd.concat([existing_df, df], ignore_index=True)
         # Remove duplicates while preserving row order
         combined_df = combined_df.drop_duplicates()
     else:
-        # If the file doesn't exist, use the new data
-        combined_df = df
+        # If the file doesn't exist, use the new data (a row can be filed under a player twice)
+        combined_df = df.drop_duplicates()
     
     # Write the combined DataFrame to the CSV file
-    combined_df.to_csv(player_file_path, index=False)
+    combined_df.to_csv(file_path, index=False)
     
-    # print(f"Exported data for player {player} in team {team} to {player_file_path}")
+    # print(f"Exported data for player {player} in team {team} to {file_path}")
     
 
 if __name__ == "__main__":
@@ -1,85 +1,233 @@
 import pandas as pd
 import sys
 import os
+import json
+import hashlib
+from seperate_player_data import strip_text_columns
 
 #   Run in Terminal in order get all data seperated.
 #   python seperate_team_offense_data.py player_cut_basket_efficiency.csv player_cut_efficiency.csv player_cut_flash_efficiency.csv player_cut_screen_efficiency.csv player_handoffs_bhleft_dribble_efficiency.csv player_handoffs_bhleft_efficiency.csv player_handoffs_bhleft_stationary_efficiency.csv player_handoffs_bhright_dribble_efficiency.csv player_handoffs_bhright_efficiency.csv player_handoffs_bhright_stationary_efficiency.csv player_handoffs_dribble_efficiency.csv player_handoffs_efficiency.csv player_handoffs_stationary_efficiency.csv player_handoffs_top_dribble_efficiency.csv player_handoffs_top_efficiency.csv player_handoffs_top_stationary_efficiency.csv player_iso_efficiency.csv player_iso_left_efficiency.csv player_iso_right_efficiency.csv player_iso_top_efficiency.csv player_misc_efficiency.csv player_offscreens_curl_efficiency.csv player_offscreens_efficiency.csv player_offscreens_flare_efficiency.csv player_offscreens_leftshoulder_curl_efficiency.csv player_offscreens_leftshoulder_efficiency.csv player_offscreens_leftshoulder_straight_efficiency.csv player_offscreens_rightshoulder_curl_efficiency.csv player_offscreens_rightshoulder_efficiency.csv player_offscreens_rightshoulder_flare_efficiency.csv player_offscreens_rightshoulder_straight_efficiency.csv player_offscreens_straight_efficiency.csv player_pnr_bhhigh_efficiency.csv player_pnr_bhhigh_offpick_efficiency.csv player_pnr_bhhigh_rejectpick_efficiency.csv player_pnr_bhleft_efficiency.csv player_pnr_bhleft_offpick_efficiency.csv player_pnr_bhleft_rejectpick_efficiency.csv player_pnr_bhright_efficiency.csv player_pnr_bhright_offpick_efficiency.csv player_pnr_bhright_rejectpick_efficiency.csv player_pnr_efficiency.csv player_pnr_offpick_efficiency.csv player_pnr_rejectpick_efficiency.csv player_post_efficiency.csv player_post_faceup_efficiency.csv player_post_leftblock_efficiency.csv player_post_leftblock_faceup_efficiency.csv player_post_leftblock_leftshoulder_efficiency.csv player_post_leftblock_rightshoulder_efficiency.csv player_post_leftshoulder_efficiency.csv player_post_middle_efficiency.csv player_post_middle_faceup_efficiency.csv player_post_middle_leftshoulder_efficiency.csv player_post_middle_rightshoulder_efficiency.csv player_post_rightblock_efficiency.csv player_post_rightblock_faceup_efficiency.csv player_post_rightblock_leftshoulder_efficiency.csv player_post_rightblock_rightshoulder_efficiency.csv player_post_rightshoulder_efficiency.csv player_rollman_efficiency.csv player_rollman_leftdrive_efficiency.csv player_rollman_leftdrive_pop_efficiency.csv player_rollman_leftdrive_slip_efficiency.csv player_rollman_pop_efficiency.csv player_rollman_rightdrive_efficiency.csv player_rollman_rightdrive_pop_efficiency.csv player_rollman_rightdrive_slip_efficiency.csv player_rollman_roll_efficiency.csv player_rollman_slip_efficiency.csv player_spotup_drive_efficiency.csv player_spotup_efficiency.csv player_spotup_jumpshot_efficiency.csv player_spotup_leftdrive_efficiency.csv player_spotup_rightdrive_efficiency.csv player_spotup_straightdrive_efficiency.csv player_transition_bh_efficiency.csv player_transition_leakouts_efficiency.csv player_transition_leftwing_efficiency.csv player_transition_rightwing_efficiency.csv player_transition_trailer_efficiency.csv playerefficiency.csv playerefficiencyleft.csv playerefficiencyright.csv twoplayer_bhhigh_rollmanpops_efficiency.csv twoplayer_iso_cut_efficiency.csv twoplayer_iso_spotupdrives_efficiency.csv twoplayer_iso_spotupjumpers_efficiency.csv twoplayer_pnr_cut_efficiency.csv twoplayer_pnr_spotupdrives_efficiency.csv twoplayer_pnr_spotupsdrives_efficiency.csv twoplayer_pnr_spotupsjumpers_efficiency.csv twoplayer_pnrbhhigh_cuts_efficiency.csv twoplayer_pnrbhhigh_rollman_efficiency.csv twoplayer_pnrbhhigh_rollmanpops_efficiency.csv twoplayer_pnrbhhigh_rollmanrolls_efficiency.csv twoplayer_pnrbhhigh_rollmanslips_efficiency.csv twoplayer_pnrbhhigh_spotupdrives_efficiency.csv twoplayer_pnrbhhigh_spotupjumper_efficiency.csv twoplayer_pnrbhleft_cuts_efficiency.csv twoplayer_pnrbhleft_rollman_efficiency.csv twoplayer_pnrbhleft_rollmanpops_efficiency.csv twoplayer_pnrbhleft_rollmanrolls_efficiency.csv twoplayer_pnrbhleft_rollmanslips_efficiency.csv twoplayer_pnrbhleft_spotupdrives_efficiency.csv twoplayer_pnrbhleft_spotupjumper_efficiency.csv twoplayer_pnrbhright_cuts_efficiency.csv twoplayer_pnrbhright_rollman_efficiency.csv twoplayer_pnrbhright_rollmanpops_efficiency.csv twoplayer_pnrbhright_rollmanrolls_efficiency.csv twoplayer_pnrbhright_rollmanslips_efficiency.csv twoplayer_pnrbhright_spotupdrives_efficiency.csv twoplayer_pnrbhright_spotupjumper_efficiency.csv twoplayer_post_cut_efficiency.csv twoplayer_post_spotupdrive_efficiency.csv twoplayer_post_spotupjumper_efficiency.csv team_offense_data
 
-def combine_and_split_team_data(file_list, output_directory, input_directory):
-    # Create an empty DataFrame to store the combined data
-    combined_df = pd.DataFrame()
+# Manifest of the efficiency files already split, kept in the output directory
+MANIFEST_NAME = 'source_manifest.json'
+
+
+def load_manifest(output_directory):
+    """
+    Loads the manifest of the efficiency files already split into team files.
+
+    Parameters:
+    - output_directory: Directory of the team files.
+
+    Returns:
+    - manifest: Dictionary mapping file names to their 'mtime_ns', 'size', 'sha256' and
+                the 'teams' they were split into, each with the hash of its rows (empty if there is no manifest).
+    """
+    manifest_path = os.path.join(output_directory, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, 'r') as manifest_file:
+        return json.load(manifest_file)
+
+def save_manifest(manifest, output_directory):
+    """Writes the manifest next to the team files, replacing the old one at once"""
+    manifest_path = os.path.join(output_directory, MANIFEST_NAME)
+    temp_path = manifest_path + '.tmp'
+    with open(temp_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+def file_hash(file_path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def rows_hash(df):
+    """Hash of the rows of a DataFrame, in order"""
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()
+
+def team_hashes(entry):
+    """Row hash of every team of a manifest entry, None for the entries that only listed their teams"""
+    if entry is None:
+        return {}
+    teams = entry['teams']
+    return dict(teams) if isinstance(teams, dict) else dict.fromkeys(teams)
+
+def source_changed(file_path, entry, output_directory):
+    """
+    Checks whether an efficiency file has to be split again. A file with the same
+    modification time and size is unchanged, otherwise its hash decides. A file is
+    also split again when one of the team files it was split into is missing.
+
+    Parameters:
+    - file_path: Path of the efficiency file.
+    - entry: Manifest entry of the file (None if it was never split).
+    - output_directory: Directory of the team files.
+
+    Returns:
+    - changed: True if the file has to be split again.
+    """
+    if entry is None:
+        return True
+    if any(not os.path.exists(team_file_path(team, output_directory)) for team in entry['teams']):
+        return True
+
+    stat = os.stat(file_path)
+    if stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['size']:
+        return False
+    if file_hash(file_path) == entry['sha256']:
+        # Touched but not changed, remember the new modification time
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        return False
+    return True
+
+def combine_and_split_team_data(file_list, output_directory, input_directory, incremental=False, loaded_frames=None):
+    """
+    Combines the efficiency files and replaces the rows of each file in the team files.
+    The rows are per-player totals, so the rows a file held before are dropped instead
+    of kept next to the new ones. A team file is only rewritten when the rows of one
+    of the files changed for that team, according to the row hashes of the manifest.
+
+    Parameters:
+    - file_list: Names of the efficiency csv files.
+    - output_directory: Directory of the team files.
+    - input_directory: Directory of the efficiency files.
+    - incremental: Only split the efficiency files that changed since the last run,
+                   according to the manifest in the output directory.
+    - loaded_frames: Optional dictionary mapping file names to DataFrames already read, such as
+                     the ones returned by export_efficiency.py, those files are not read again.
+    """
+    manifest = load_manifest(output_directory)
+    if incremental:
+        changed_files = [file for file in file_list if not os.path.exists(os.path.join(input_directory, file))
+                         or source_changed(os.path.join(input_directory, file), manifest.get(file), output_directory)]
+        print(f"{len(changed_files)} of {len(file_list)} efficiency files changed since the last run.")
+        file_list = changed_files
 
     # Process each file in the file list
+    frames = []
+    read_files = []
+    new_hashes = {}
     for file in file_list:
         try:
             # Use the full path for each file
             file_path = os.path.join(input_directory, file)
-            df = pd.read_csv(file_path)
+            df = loaded_frames[file] if loaded_frames is not None and file in loaded_frames else pd.read_csv(file_path)
+            read_files.append(file)
             if df.empty:
                 print(f"Skipping empty file: {file_path}")
                 continue
-            df['SourceFile'] = os.path.basename(file_path)
-            combined_df = pd.concat([combined_df, df], ignore_index=True)
+            # Files written by export_efficiency.py already name their source
+            if 'SourceFile' not in df.columns:
+                df['SourceFile'] = os.path.basename(file_path)
+            # Hashed before combining, so the hash of a team's rows only depends on this file
+            if 'Team' in df.columns:
+                new_hashes[file] = {str(team): rows_hash(group) for team, group in df.groupby('Team', sort=False)}
+            frames.append(df)
             
         except pd.errors.EmptyDataError:
             print(f"Error: {file_path} is empty or not formatted correctly. Skipping this file.")
+            read_files.append(file)
         except FileNotFoundError:
             print(f"Error: {file_path} not found. Skipping this file.")
         except Exception as e:
             print(f"Unexpected error with file {file_path}: {e}. Skipping this file.")
             continue
 
-    # Normalize data: Strip whitespace from string columns
-    combined_df = combined_df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
+    if frames:
+        combined_df = pd.concat(frames, ignore_index=True)
 
-    # Remove duplicate rows
-    combined_df = combined_df.drop_duplicates()
+        # Normalize data
+        strip_text_columns(combined_df)
 
-    # Check for the presence of 'Team' column
-    if 'Team' not in combined_df.columns:
-        print("Error: 'Team' column not found in the combined data.")
-        sys.exit(1)
+        # Remove duplicate rows
+        combined_df = combined_df.drop_duplicates()
+
+        # Check for the presence of 'Team' column
+        if 'Team' not in combined_df.columns:
+            print("Error: 'Team' column not found in the combined data.")
+            sys.exit(1)
+        groups = {key: group for key, group in combined_df.groupby(['SourceFile', 'Team'], sort=False)}
+    else:
+        groups = {}
+
+    # The teams of a file whose rows changed, or that the file no longer holds, get its rows replaced
+    replaced_sources = {}
+    for file in read_files:
+        source_file = os.path.basename(file)
+        hashes = new_hashes.setdefault(file, {})
+        previous = team_hashes(manifest.get(file))
+        for team in set(hashes) | set(previous):
+            # Without the manifest of an incremental run every team is rewritten
+            if not incremental or hashes.get(team) != previous.get(team):
+                replaced_sources.setdefault(team, set()).add(source_file)
 
-    # Group the data by 'Team'
-    grouped_teams = combined_df.groupby('Team')
+    # Export each affected team's data to its CSV file
+    os.makedirs(output_directory, exist_ok=True)
+    for team in sorted(replaced_sources):
+        sources = replaced_sources[team]
+        new_rows = [groups[(os.path.basename(file), team)] for file in read_files
+                    if os.path.basename(file) in sources and (os.path.basename(file), team) in groups]
+        export_team_data(team, new_rows, sources, output_directory)
 
-    # Export each team's data to a separate CSV file
-    for team, group in grouped_teams:
-        export_team_data(team, group, output_directory)
+    # Remember what every file that was read looked like and the rows it sent to every team
+    for file in read_files:
+        file_path = os.path.join(input_directory, file)
+        stat = os.stat(file_path)
+        manifest[file] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': file_hash(file_path),
+                          'teams': new_hashes[file]}
+    save_manifest(manifest, output_directory)
 
-def export_team_data(team, df, output_directory):
+def team_file_path(team, output_directory):
+    """Path of the csv file of a team, the team name made safe for the file system"""
     # Replace spaces and slashes in team names with underscores for file naming
     safe_team_name = team.replace(' ', '_').replace('/', '_')
     team_filename = f"{safe_team_name}.csv"
-    
+    return os.path.join(output_directory, team_filename)
+
+def export_team_data(team, frames, sources, output_directory):
+    """
+    Replaces the rows of the given efficiency files in a team's CSV file.
+
+    Parameters:
+    - team: Name of the team.
+    - frames: DataFrames of the team's new rows, one per efficiency file that still holds the team.
+    - sources: Names of the efficiency files whose old rows are dropped.
+    - output_directory: Directory of the team files.
+    """
     # Construct the full path for the team's CSV file
-    team_file_path = os.path.join(output_directory, team_filename)
+    file_path = team_file_path(team, output_directory)
     
-    # Check if the team's file exists
-    if os.path.exists(team_file_path):
-        # Read the existing data
-        existing_df = pd.read_csv(team_file_path)
-        # Combine existing data with new data
-        combined_df = pd.concat([existing_df, df], ignore_index=True)
-        # Remove duplicates while preserving row order
-        combined_df = combined_df.drop_duplicates()
-    else:
-        # If the file doesn't exist, use the new data
-        combined_df = df
+    # Keep the rows of the other efficiency files
+    if os.path.exists(file_path):
+        existing_df = pd.read_csv(file_path)
+        if 'SourceFile' in existing_df.columns:
+            existing_df = existing_df[~existing_df['SourceFile'].isin(sources)]
+        frames = [existing_df] + frames
+
+    if not frames:
+        return
+    combined_df = pd.concat(frames, ignore_index=True)
     
     # Write the combined DataFrame to the CSV file
-    combined_df.to_csv(team_file_path, index=False)
+    combined_df.to_csv(file_path, index=False)
     
-    print(f"Exported data for team '{team}' to {team_file_path}")
+    print(f"Exported data for team '{team}' to {file_path}")
 
 if __name__ == "__main__":
-    # Example usage: python separate_team_data.py file1.csv file2.csv ... output_directory
-    if len(sys.argv) < 3:
-        print("Usage: python separate_team_data.py <file1.csv> <file2.csv> ... <output_directory>")
+    # Example usage: python separate_team_data.py [--incremental] file1.csv file2.csv ... output_directory
+    incremental = '--incremental' in sys.argv
+    arguments = [argument for argument in sys.argv[1:] if argument != '--incremental']
+    if len(arguments) < 2:
+        print("Usage: python separate_team_data.py [--incremental] <file1.csv> <file2.csv> ... <output_directory>")
         sys.exit(1)
 
     # List of input files
-    file_list = sys.argv[1:-1]
+    file_list = arguments[:-1]
     
     # Output directory for individual team files (absolute path)
     output_directory = "/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2023_24/cleaned/Teams/team_offense_data/"
@@ -93,4 +241,4 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Run the function
-    combine_and_split_team_data(file_list, output_directory, input_directory)
+    combine_and_split_team_data(file_list, output_directory, input_directory, incremental)
@@ -17,6 +17,52 @@ import os
 import shutil
 from process_games import add_game
 from csv_to_database import transfer_plays_to_db
+from synergy_tokens import SynergyTokens
+
+# Synergy play type tags mapped to our play types, checked in this order
+PLAY_TYPE_TAGS = {
+    'ISO': 'Iso',
+    'Spot-Up': 'Spot Ups',
+    'Hand Off': 'Hand Offs',
+    'Off Screen': 'Off Screens',
+    'Cut': 'Cuts',
+    'Post-Up': 'Post',
+    'Transition': 'Transition',
+    'P&R Roll Man': 'P&R Roll Man',
+    'P&R Ball Handler': 'PNR',
+    'No Play Type': 'Misc'
+}
+
+# Substrings of a play segment that determine its direction, first match wins
+PLAY_DIRECTIONS = {
+    'Off Screens': [('Top', 'Top'), ('Right', 'Right'), ('Left', 'Left')],
+    'Hand Offs': [('Top', 'Top'), ('Right', 'Right'), ('Left', 'Left')],
+    'P&R Roll Man': [('Drives Left', 'Left'), ('Drives Right', 'Right')],
+    'Spot Ups': [('Drives Left', 'Left'), ('Drives Right', 'Right'), ('Drives Straight', 'Straight')],
+    'PNR': [('Left P&R', 'Left'), ('Right P&R', 'Right'), ('High P&R', 'High')],
+    'Iso': [('Top', 'Top'), ('Right', 'Right'), ('Left', 'Left')],
+    'Post': [('Flash Middle', 'Middle'), ('Right Block', 'Right'), ('Left Block', 'Left')]
+}
+
+# Substrings of a play segment that determine its action, first match wins
+PLAY_ACTIONS = {
+    'Cuts': [('Basket', 'Basket'), ('Screen', 'Screen'), ('Flash', 'Flash')],
+    'Transition': [('Ballhandler', 'Ball Handler'), ('Left Wing', 'Left Wing'), ('Right Wing', 'Right Wing'),
+                   ('Trailer', 'Trailer'), ('Leak Outs', 'Leak Outs'), ('First Middle', 'First Middle')],
+    'Off Screens': [('Curl', 'Curl'), ('Straight', 'Straight'), ('Flare', 'Flare')],
+    'Hand Offs': [('Dribble', 'Dribble'), ('Stationary', 'Stationary')],
+    'P&R Roll Man': [('Pick and Pops', 'Pop'), ('Rolls to Basket', 'Roll'), ('Slips the Pick', 'Slips')],
+    'Spot Ups': [('No Dribble Jumper', 'Shot'), ('Drives Left', 'Drive'), ('Drives Right', 'Drive'),
+                 ('Drives Straight', 'Drive')],
+    'PNR': [('Dribbles Off Pick', 'Off'), ('Dribble Off Pick', 'Off'), ('Go Away from Pick', 'Away')],
+    'Post': [('Face-up', 'Face Up'), ('Left Shoulder', 'Left Shoulder'), ('Right Shoulder', 'Right Shoulder'),
+             ('Dribble Move', 'Dribble')]
+}
+
+# A PNR segment always overwrites its action, even when none of the actions above match
+PLAY_DEFAULT_ACTIONS = {
+    'PNR': 'N/A'
+}
 
 
 """
@@ -33,16 +79,19 @@ def process_plays(csv_df: pd.DataFrame):
     # final dataframe with important info
     final_df = pd.DataFrame(index=filtered_df.index, columns=['Home','Away', 'OffensivePossession', 'Outcome', 'ShotType', 'PrimaryPlayer', 'PrimaryPlayType', 'PrimaryDirection', 'PrimaryAction', 'SecondaryPlayer', 'SecondaryPlayType', 'SecondaryDirection', 'SecondaryAction'])
     final_df[:] = None
+    
+    # splits every Synergy String once, all columns below are derived from these tokens
+    tokens = SynergyTokens(filtered_df['Synergy String'])
 
     # finds key information and puts in
     finds_opponent_site_and_conference(filtered_df, final_df) # Checked and done
     find_playoutcomes(filtered_df, final_df) 
-    find_shottypes(filtered_df, final_df)
-    find_playtype(filtered_df, final_df)
+    find_shottypes(filtered_df, final_df, tokens)
+    find_playtype(filtered_df, final_df, tokens)
     find_offensive_team(filtered_df, final_df)
-    find_players(filtered_df, final_df)
+    find_players(filtered_df, final_df, tokens)
     find_playnumber(filtered_df, final_df)
-    find_levelshot(filtered_df, final_df)
+    find_levelshot(filtered_df, final_df, tokens)
     find_date(filtered_df, final_df)
 
     
@@ -101,16 +150,10 @@ def find_offensive_team(df: pd.DataFrame, final_df: pd.DataFrame):
     final_df['OffensivePossession'] = df['Team']
 
 def find_date(df: pd.DataFrame, final_df: pd.DataFrame):
-    dates = []
+    # Converts 'MM/DD/YYYY' into 'YYYY-MM-DD'
+    date_list = df['Date'].str.split('/')
     
-    for index, row in df.iterrows():
-        date_list = row['Date'].split('/')
-        
-        date = date_list[2] + '-' + date_list[0] + '-' + date_list[1]
-            
-        dates.append(date)
-            
-    final_df['Date'] = dates
+    final_df['Date'] = date_list.str[2] + '-' + date_list.str[0] + '-' + date_list.str[1]
         
 def find_playoutcomes(df: pd.DataFrame, final_df: pd.DataFrame):
     # Maps The result column values to their new outcome values
@@ -126,104 +169,74 @@ def find_playoutcomes(df: pd.DataFrame, final_df: pd.DataFrame):
     }
     final_df['Outcome'] = df['Result'].map(outcome_mapping)
 
-def find_shottypes(df: pd.DataFrame, final_df: pd.DataFrame):
-    # Initialize an empty list to store shot types for each row
-    shot_types = []
-
-    # Iterate over each row in the DataFrame
-    for index, row in df.iterrows():
-        # Split the 'Synergy String' of the current row into a list based on delimiters
-        synergy_list = row['Synergy String'].split(' > ')
-            
-        # Initialize shot type for the current row
-        shot_type = None
-            
-
-        # Check for each shot type keyword in the synergy list
-        if 'No Dribble Jumper' in synergy_list:
-            shot_type = 'No Dribble Jumper'
-        elif 'Dribble Jumper' in synergy_list:
-            shot_type = 'Dribble Jumper'
-        elif 'Drop Step' in synergy_list or 'To Drop Step' in synergy_list:
-            shot_type = 'Drop Step'
-        elif 'Hook Shot' in synergy_list or 'To Hook' in synergy_list:
-            shot_type = 'Hook Shot'
-        elif 'To Basket' in synergy_list or 'At Basket' in synergy_list or 'Rolls to Basket' in synergy_list or 'Cut' in synergy_list:
-            shot_type = 'To Basket'
-        elif 'Offensive Rebound' in synergy_list and 'Short' in synergy_list and 'Scoring Attempt' in synergy_list:
-            shot_type = 'To Basket'
-        elif 'Foul' in synergy_list or 'Turnover' in synergy_list or 'Shot Clock Violation':
-            shot_type = 'N/A'
-        else:
-            print(synergy_list)
-
-        # Append the shot type to the list for this row
-        shot_types.append(shot_type)
-
-    # Add the shot types list to the final DataFrame
-    final_df['ShotType'] = shot_types
+def find_shottypes(df: pd.DataFrame, final_df: pd.DataFrame, tokens: SynergyTokens):
+    # Checks for each shot type keyword in the synergy tokens, first match wins
+    shot_type_conditions = [
+        (tokens.has_token('No Dribble Jumper'), 'No Dribble Jumper'),
+        (tokens.has_token('Dribble Jumper'), 'Dribble Jumper'),
+        (tokens.has_token(['Drop Step', 'To Drop Step']), 'Drop Step'),
+        (tokens.has_token(['Hook Shot', 'To Hook']), 'Hook Shot'),
+        (tokens.has_token(['To Basket', 'At Basket', 'Rolls to Basket', 'Cut']), 'To Basket'),
+        (tokens.has_token('Offensive Rebound') & tokens.has_token('Short') & tokens.has_token('Scoring Attempt'), 'To Basket')
+    ]
+
+    # Add the shot types to the final DataFrame
+    final_df['ShotType'] = select_values(shot_type_conditions, 'N/A')
     
-def find_players(df: pd.DataFrame, final_df: pd.DataFrame):
+def find_players(df: pd.DataFrame, final_df: pd.DataFrame, tokens: SynergyTokens):
+    # The first token of a segment is '<jersey number> <player name>'
+    primary_players = find_player_from_token(tokens.first_token(0))
+    secondary_players = find_player_from_token(tokens.first_token(1))
+        
+    # Add the players as new columns in final_df
+    final_df['PrimaryPlayer'] = primary_players.to_numpy()
+    final_df['SecondaryPlayer'] = secondary_players.fillna('N/A').to_numpy()
+        
+def find_player_from_token(first_tokens: pd.Series):
+    # Drops the jersey number in front of the player name
+    return first_tokens.str.partition(' ')[2]
     
-    primary_players = []
-    secondary_players = []
+def find_playtype(df: pd.DataFrame, final_df: pd.DataFrame, tokens: SynergyTokens):
+    segments = tokens.segments
     
-    for index, row in df.iterrows():
-        # Split the 'Player' column of the current row into a list based on delimiters
-        synergy_list = row['Synergy String'].split(' > Ball Delivered > ')
+    # Classifies every segment of every play at once
+    play_types = select_values([(tokens.segment_has_token(tag), play_type) for tag, play_type in PLAY_TYPE_TAGS.items()], None)
+    directions = np.full(len(segments), None, dtype=object)
+    actions = np.full(len(segments), None, dtype=object)
     
-        primary_play_list = synergy_list[0].split(' > ')
-        primary_player = find_player_from_list(primary_play_list)
-        
-        secondary_play_list = None
-        if len(synergy_list) > 1:
-            secondary_play_list = synergy_list[1].split(' > ')
-            secondary_player = find_player_from_list(secondary_play_list)
-        else:
-            secondary_player = 'N/A'
-        
-        # Append primary and secondary players to their respective lists
-        primary_players.append(primary_player)
-        secondary_players.append(secondary_player)
+    for play_type in PLAY_TYPE_TAGS.values():
+        is_play_type = play_types == play_type
+        if not is_play_type.any():
+            continue
         
-    # Add the lists as new columns in final_df
-    final_df['PrimaryPlayer'] = primary_players
-    final_df['SecondaryPlayer'] = secondary_players
-        
-def find_player_from_list(string_list):
-    player_name_list = string_list[0].split(' ')
-    name = ' '.join(player_name_list[1:])
-    return name
+        # Direction and action are substring checks on the segment text
+        if play_type in PLAY_DIRECTIONS:
+            conditions = [(tokens.segment_contains(text), direction) for text, direction in PLAY_DIRECTIONS[play_type]]
+            directions[is_play_type] = select_values(conditions, None)[is_play_type]
+        if play_type in PLAY_ACTIONS:
+            conditions = [(tokens.segment_contains(text), action) for text, action in PLAY_ACTIONS[play_type]]
+            actions[is_play_type] = select_values(conditions, PLAY_DEFAULT_ACTIONS.get(play_type))[is_play_type]
+    
+    # Segment 0 describes the primary play, every later segment the secondary play.
+    # 'No Play Type' always marks the primary play as 'Misc'
+    is_primary = segments['SegmentNumber'].to_numpy() == 0
+    is_misc = play_types == 'Misc'
+    is_secondary = ~is_primary & ~is_misc
     
-def find_playtype(df: pd.DataFrame, final_df: pd.DataFrame):
+    columns = {
+        'PrimaryPlayType': np.where(is_primary | is_misc, play_types, None),
+        'PrimaryDirection': np.where(is_primary, directions, None),
+        'PrimaryAction': np.where(is_primary, actions, None),
+        'SecondaryPlayType': np.where(is_secondary, play_types, None),
+        'SecondaryDirection': np.where(is_secondary, directions, None),
+        'SecondaryAction': np.where(is_secondary, actions, None)
+    }
     
-    # iterates through rows in uncleaned dataframe
-    for index, row in df.iterrows():
-        # Split the 'Synergy String' of the current row into a list based on delimiters
-        synergy_list = row['Synergy String'].split(' > Ball Delivered > ')
-            
-        for i in range(len(synergy_list)):
-            play_list = synergy_list[i].split(' > ')
-            if 'ISO' in play_list:
-                process_iso(synergy_list[i], i, final_df, index)
-            elif 'Spot-Up' in play_list:
-                process_spot_ups(synergy_list[i], i, final_df, index)
-            elif 'Hand Off' in play_list:
-                process_hand_offs(synergy_list[i], i, final_df, index)
-            elif 'Off Screen' in play_list:
-                process_off_screens(synergy_list[i], i, final_df, index)
-            elif 'Cut' in play_list:
-                process_cuts(synergy_list[i], i, final_df, index)
-            elif 'Post-Up' in play_list:
-                process_postups(synergy_list[i], i, final_df, index)
-            elif 'Transition' in play_list:
-                process_transition(synergy_list[i], i, final_df, index)
-            elif 'P&R Roll Man' in play_list:
-                process_pnr_roll_man(synergy_list[i], i, final_df, index)
-            elif 'P&R Ball Handler' in play_list:
-                process_pnr(synergy_list[i], i, final_df, index)
-            elif 'No Play Type' in play_list:
-                final_df.at[index, 'PrimaryPlayType'] = 'Misc'
+    # When a play has several segments writing the same column the last one wins
+    play_positions = segments['PlayPosition'].to_numpy()
+    for column, values in columns.items():
+        last_values = pd.Series(values, index=play_positions).groupby(level=0).last()
+        final_df[column] = last_values.reindex(range(len(final_df))).to_numpy()
 
 def find_playnumber(df: pd.DataFrame, final_df: pd.DataFrame):
     if '#' not in df.columns:
@@ -231,241 +244,34 @@ def find_playnumber(df: pd.DataFrame, final_df: pd.DataFrame):
     
     final_df['PlayNumber'] = df['#']
 
-def find_levelshot(df: pd.DataFrame, final_df: pd.DataFrame):
-     # iterates through rows in uncleaned dataframe
-    for index, row in df.iterrows():
-        # Split the 'Synergy String' of the current row into a list based on delimiters
-        synergy_string = row['Synergy String'].split(' > ')
-        
-        level_one_list = ['To Basket', 'At Basket', 'Rolls to Basket', 'Basket', 'Offensive Rebound', 
-                          'Short', 'Make 2 Pts Foul', 'To Hook', 'Cut', 'To Drop Step', 'To Jumper', 
-                          'To Up and Under', 'Post-Up']
-            
-        if 'Short to < 17\'' in synergy_string:
-            final_df.at[index, 'ShotLevel'] = 2
-        elif 'Medium/17\' to <3p' in synergy_string:
-            final_df.at[index, 'ShotLevel'] = 3
-        elif 'Long/3pt' in synergy_string:
-            final_df.at[index, 'ShotLevel'] = 4
-        else:
-            final_df.at[index, 'ShotLevel'] = 1  
-
-def process_cuts(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Cuts'
-    if playnumber == 0:
-        # Initialize the primary playtype and action
-        final_df.at[idx, 'PrimaryPlayType'] = play_type
-        action_column = 'PrimaryAction'
-    else:
-        # Initialize the secondary playtype and action
-        final_df.at[idx, 'SecondaryPlayType'] = play_type
-        action_column = 'SecondaryAction'
-    
-    # Determine the action
-    if 'Basket' in playlist:
-        final_df.at[idx, action_column] = 'Basket'
-    elif 'Screen' in playlist:
-        final_df.at[idx, action_column] = 'Screen'
-    elif 'Flash' in playlist:
-        final_df.at[idx, action_column] = 'Flash'
-        
-def process_transition(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Transition'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
-    
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Determine the play action
-    if 'Ballhandler' in playlist:
-        final_df.at[idx, action_column] = 'Ball Handler'
-    elif 'Left Wing' in playlist:
-        final_df.at[idx, action_column] = 'Left Wing'
-    elif 'Right Wing' in playlist:
-        final_df.at[idx, action_column] = 'Right Wing'
-    elif 'Trailer' in playlist:
-        final_df.at[idx, action_column] = 'Trailer'
-    elif 'Leak Outs' in playlist:
-        final_df.at[idx, action_column] = 'Leak Outs'
-    elif 'First Middle' in playlist:
-        final_df.at[idx, action_column] = 'First Middle'
-
-def process_off_screens(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Off Screens'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
-    
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Determine the direction
-    if 'Top' in playlist:
-        final_df.at[idx, direction_column] = 'Top'
-    elif 'Right' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-    elif 'Left' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
-
-    # Determine the action
-    if 'Curl' in playlist:
-        final_df.at[idx, action_column] = 'Curl'
-    elif 'Straight' in playlist:
-        final_df.at[idx, action_column] = 'Straight'
-    elif 'Flare' in playlist:
-        final_df.at[idx, action_column] = 'Flare'
-
-def process_hand_offs(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Hand Offs'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
-    
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Determine the direction
-    if 'Top' in playlist:
-        final_df.at[idx, direction_column] = 'Top'
-    elif 'Right' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-    elif 'Left' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
-
-    # Determine the action
-    if 'Dribble' in playlist:
-        final_df.at[idx, action_column] = 'Dribble'
-    elif 'Stationary' in playlist:
-        final_df.at[idx, action_column] = 'Stationary'
-        
-def process_pnr_roll_man(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'P&R Roll Man'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
-    
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Determine the direction
-    if 'Drives Left' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
-    elif 'Drives Right' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-
-    # Determine the action
-    if 'Pick and Pops' in playlist:
-        final_df.at[idx, action_column] = 'Pop'
-    elif 'Rolls to Basket' in playlist:
-        final_df.at[idx, action_column] = 'Roll'
-    elif 'Slips the Pick' in playlist:
-        final_df.at[idx, action_column] = 'Slips'
-
-def process_spot_ups(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Spot Ups'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
+def find_levelshot(df: pd.DataFrame, final_df: pd.DataFrame, tokens: SynergyTokens):
+    shot_level_conditions = [
+        (tokens.has_token('Short to < 17\''), 2),
+        (tokens.has_token('Medium/17\' to <3p'), 3),
+        (tokens.has_token('Long/3pt'), 4)
+    ]
     
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Initialize the action to None
-    action = None
-
-    # Determine the direction and set action to 'Drive' if a direction is found
-    if 'Drives Left' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
-        action = 'Drive'
-    elif 'Drives Right' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-        action = 'Drive'
-    elif 'Drives Straight' in playlist:
-        final_df.at[idx, direction_column] = 'Straight'
-        action = 'Drive'
-
-    # Determine the action if not already set to 'Drive'
-    if 'No Dribble Jumper' in playlist:
-        action = 'Shot'
-
-    # Set the action column in the DataFrame
-    if action is not None:
-        final_df.at[idx, action_column] = action
-                  
-def process_pnr(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'PNR'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
-    
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Initialize the action to None
-    action = None
-
-    # Determine the direction
-    if 'Left P&R' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
-    elif 'Right P&R' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-    elif 'High P&R' in playlist:
-        final_df.at[idx, direction_column] = 'High'
-
-    # Determine the action
-    if 'Dribbles Off Pick' in playlist or 'Dribble Off Pick' in playlist:
-        action = 'Off'
-    elif 'Go Away from Pick' in playlist:
-        action = 'Away'
-
-    # Set the action column in the DataFrame
-    #if action is not None:
-    final_df.at[idx, action_column] = action
-        
-def process_iso(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Iso'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
+    final_df['ShotLevel'] = select_values(shot_level_conditions, 1).astype(float)
+
+def select_values(conditions, default):
+    """
+    Vectorized if/elif chain: picks the value of the first condition that is true.
+
+    Parameters:
+    - conditions: List of (boolean mask, value) pairs in priority order.
+    - default: Value used where no condition is true.
+
+    Returns:
+    - Object array with the selected value for every row.
+    """
+    length = len(conditions[0][0])
+    selected = np.full(length, default, dtype=object)
     
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Determine the direction
-    if 'Top' in playlist:
-        final_df.at[idx, direction_column] = 'Top'
-    elif 'Right' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-    elif 'Left' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
+    # Assigning from the lowest priority up lets the first true condition win
+    for mask, value in reversed(conditions):
+        selected[np.asarray(mask, dtype=bool)] = value
+    return selected
         
-def process_postups(playlist, playnumber, final_df: pd.DataFrame, idx):
-    play_type = 'Post'
-    direction_column = 'PrimaryDirection' if playnumber == 0 else 'SecondaryDirection'
-    action_column = 'PrimaryAction' if playnumber == 0 else 'SecondaryAction'
-    playtype_column = 'PrimaryPlayType' if playnumber == 0 else 'SecondaryPlayType'
-    
-    # Initialize the play type
-    final_df.at[idx, playtype_column] = play_type
-
-    # Determine the direction
-    if 'Flash Middle' in playlist:
-        final_df.at[idx, direction_column] = 'Middle'
-    elif 'Right Block' in playlist:
-        final_df.at[idx, direction_column] = 'Right'
-    elif 'Left Block' in playlist:
-        final_df.at[idx, direction_column] = 'Left'
-
-    # Determine the action
-    if 'Face-up' in playlist:
-        final_df.at[idx, action_column] = 'Face Up'
-    elif 'Left Shoulder' in playlist:
-        final_df.at[idx, action_column] = 'Left Shoulder'
-    elif 'Right Shoulder' in playlist:
-        final_df.at[idx, action_column] = 'Right Shoulder'
-    elif 'Dribble Move' in playlist:
-        final_df.at[idx, action_column] = 'Dribble'
-            
         
 def get_constraints(csv_df: pd.DataFrame):
     constraint1 = csv_df['Result'] != "No Violation"
@@ -1,11 +1,13 @@
 import csv
 import os
 import mysql.connector
+from mysql.connector import pooling
 from dotenv import load_dotenv
 import pandas as pd
 import sys
 from mysql.connector import Error
 import logging
+from efficiency_tables import refresh_efficiency_groups
 
 
 # Load environment variables from .env file
@@ -17,19 +19,43 @@ DB_NAME = os.getenv('NAME')
 DB_PORT = os.getenv('PORT')
 DB_USER = os.getenv('USERNAME')
 DB_PASS = os.getenv('PASSWORD')
+DB_POOL_SIZE = int(os.getenv('POOL_SIZE', 5))
 
-def connect_to_db():
-    """Connect to the MySQL database server"""
-    conn = None
-    try:
-        conn = mysql.connector.connect(
+# Number of plays sent to the database per multi-row INSERT
+INSERT_CHUNK_SIZE = 500
+
+INSERT_PLAY_QUERY = 'INSERT INTO plays (ShotType, Outcome, Home, Away, OffensivePossession, PlayID, PrimaryPlayer, SecondaryPlayID, SecondaryPlayer, PlayNumber, ShotLevel, DefensiveConference, OffensiveConference, Date)\
+                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'
+
+# Detects changes to PlayDescriptions without reading the whole table
+PLAYDESCRIPTIONS_SIGNATURE_QUERY = "SELECT COUNT(*), BIT_XOR(CRC32(CONCAT_WS('|', PlayID, PlayType, Direction, Play_Action)))\
+                                    FROM PlayDescriptions"
+
+# PlayDescriptions lookup of this process, filled by load_playids
+_playid_cache = {'signature': None, 'playids': {}}
+
+# Connection pool shared by every transfer of this process, created on first use
+_pool = None
+
+def get_pool():
+    """Returns the connection pool of this process, creating it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = pooling.MySQLConnectionPool(
+            pool_name='basketball_stats',
+            pool_size=DB_POOL_SIZE,
             host=DB_HOST,
             port=DB_PORT,
             database=DB_NAME,
             user=DB_USER,
             password=DB_PASS
         )
-        return conn
+    return _pool
+
+def connect_to_db():
+    """Get a connection to the MySQL database server from the pool, close() returns it"""
+    try:
+        return get_pool().get_connection()
     except mysql.connector.Error as err:
         print(f"Error: {err}")
         return None
@@ -45,11 +71,24 @@ def read_csv(file_path):
     return data
 
 def play_to_db(conn, data):
+    """
+    Inserts the plays of a game into the 'plays' table. The PlayIDs of every play
+    come from the PlayDescriptions cache and the plays are sent in multi-row INSERTs.
+    Nothing is committed here, so the caller can commit the game as one transaction.
+
+    Parameters:
+    - conn: A MySQL database connection object.
+    - data: List of rows read from a cleaned game csv file.
+    """
+    cur = conn.cursor()
     try:
-        cur = conn.cursor()
+        triples = [(row[7], row[8], row[9]) for row in data] + [(row[11], row[12], row[13]) for row in data]
+        playids = find_playids(cur, triples)
+
+        values = []
         for row in data:
-            primary_playid = find_playid(cur, row[7], row[8], row[9])
-            secondary_playid = find_playid(cur, row[11], row[12], row[13])
+            primary_playid = playids.get(playid_key(row[7], row[8], row[9]))
+            secondary_playid = playids.get(playid_key(row[11], row[12], row[13]))
             home = row[1]
             away = row[2]
             shottype = row[5]
@@ -61,52 +100,70 @@ def play_to_db(conn, data):
             shotlevel = row[17]
             offensiveconference = row[14]
             defensiveconference = row[15]
-            date = row[18]         
-            insert_query = 'INSERT INTO plays (ShotType, Outcome, Home, Away, OffensivePossession, PlayID, PrimaryPlayer, SecondaryPlayID, SecondaryPlayer, PlayNumber, ShotLevel, DefensiveConference, OffensiveConference, Date)\
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'
-            cur.execute(insert_query, (shottype, outcome, home, away, offensive_possession, primary_playid, primary_player, secondary_playid, secondary_player, playnumber, shotlevel, defensiveconference, offensiveconference, date))
-    except mysql.connector.Error as err:
-        print(f"Error: {err}")
+            date = row[18]
+            values.append((shottype, outcome, home, away, offensive_possession, primary_playid, primary_player, secondary_playid,
+                           secondary_player, playnumber, shotlevel, defensiveconference, offensiveconference, date))
+
+        for start in range(0, len(values), INSERT_CHUNK_SIZE):
+            cur.executemany(INSERT_PLAY_QUERY, values[start:start + INSERT_CHUNK_SIZE])
+    finally:
+        cur.close()
     
     
-def game_to_db(conn, data):
+def insert_team_games(conn, data):
     """
-    Inserts data from a pandas DataFrame into the 'TeamGames' table in the database.
+    Inserts data from a pandas DataFrame into the 'TeamGames' table with one executemany.
+    Nothing is committed and errors are raised, so the caller decides the transaction.
     
     Parameters:
     - conn: A MySQL database connection object.
     - data: A pandas DataFrame where each row represents a game data entry.
+
+    Returns:
+    - rowcount: Number of rows inserted.
     """
-    try:
+    columns = data.columns.tolist()
+
+    # Rename columns if necessary to match database schema
+    if 'Differential' in columns and 'Diff' not in columns:
+        data = data.rename(columns={'Differential': 'Diff'})
         columns = data.columns.tolist()
+        logging.info("Renamed 'Differential' column to 'Diff'.")
 
-        # Rename columns if necessary to match database schema
-        if 'Differential' in columns and 'Diff' not in columns:
-            data.rename(columns={'Differential': 'Diff'}, inplace=True)
-            columns = data.columns.tolist()
-            logging.info("Renamed 'Differential' column to 'Diff'.")
+    # Fill NaN values with default (0)
+    data_filled = data.fillna(0)
+    logging.info("Filled NaN values with 0.")
 
-        # Fill NaN values with default (0)
-        data_filled = data.fillna(0)
-        logging.info("Filled NaN values with 0.")
+    # Convert DataFrame to list of tuples for insertion
+    processed_values = [tuple(row) for row in data_filled.values]
 
-        # Convert DataFrame to list of tuples for insertion
-        processed_values = [tuple(row) for row in data_filled.values]
+    if not processed_values:
+        logging.info("No data to insert.")
+        return 0
 
-        if not processed_values:
-            logging.info("No data to insert.")
-            return
+    # Prepare SQL statement
+    columns_str = ', '.join([f'`{col}`' for col in columns])
+    placeholders = ', '.join(['%s'] * len(columns))
+    insert_query = f'INSERT INTO TeamGames ({columns_str}) VALUES ({placeholders})'
 
-        # Prepare SQL statement
-        columns_str = ', '.join([f'`{col}`' for col in columns])
-        placeholders = ', '.join(['%s'] * len(columns))
-        insert_query = f'INSERT INTO TeamGames ({columns_str}) VALUES ({placeholders})'
+    # Execute insertion
+    with conn.cursor() as cursor:
+        cursor.executemany(insert_query, processed_values)
+        return cursor.rowcount
 
-        # Execute insertion
-        with conn.cursor() as cursor:
-            cursor.executemany(insert_query, processed_values)
+def game_to_db(conn, data):
+    """
+    Inserts data from a pandas DataFrame into the 'TeamGames' table in the database.
+    
+    Parameters:
+    - conn: A MySQL database connection object.
+    - data: A pandas DataFrame where each row represents a game data entry.
+    """
+    try:
+        rowcount = insert_team_games(conn, data)
+        if rowcount:
             conn.commit()
-            logging.info(f"Successfully inserted {cursor.rowcount} record(s) into the 'TeamGames' table.")
+            logging.info(f"Successfully inserted {rowcount} record(s) into the 'TeamGames' table.")
     except Error as err:
         logging.error(f"MySQL Error: {err}")
         conn.rollback()
@@ -115,15 +172,67 @@ def game_to_db(conn, data):
     
 def find_playid(cur, playtype, playdirection, playaction):
     try:
-        select_query = "SELECT PlayID FROM PlayDescriptions\
-                        WHERE PlayType = %s AND Direction = %s AND Play_Action = %s"
-        cur.execute(select_query, (playtype, playdirection, playaction))
-        result = cur.fetchone()
-        cur.fetchall()
-        return result[0] if result else None
+        playids = load_playids(cur)
+        return playids.get(playid_key(playtype, playdirection, playaction))
     except mysql.connector.Error as e:
         print(f"Error: {e}")
 
+def playid_key(playtype, playdirection, playaction):
+    """Key of a play description, compared the way MySQL's case-insensitive collation does"""
+    return tuple(str(value).rstrip().lower() for value in (playtype, playdirection, playaction))
+
+def load_playids(cur):
+    """
+    Returns the PlayDescriptions lookup of this process. The table is read once and
+    read again only when its row count or checksum changed since it was cached.
+
+    Parameters:
+    - cur: A MySQL cursor.
+
+    Returns:
+    - playids: Dictionary mapping playid_key of every play description to its PlayID.
+    """
+    cur.execute(PLAYDESCRIPTIONS_SIGNATURE_QUERY)
+    signature = tuple(cur.fetchone())
+    cur.fetchall()
+
+    if signature != _playid_cache['signature']:
+        cur.execute("SELECT PlayType, Direction, Play_Action, PlayID FROM PlayDescriptions ORDER BY PlayID")
+
+        # Keep the first PlayID of a description, like the old per-play SELECT did
+        playids = {}
+        for playtype, playdirection, playaction, playid in cur.fetchall():
+            playids.setdefault(playid_key(playtype, playdirection, playaction), playid)
+
+        _playid_cache['signature'] = signature
+        _playid_cache['playids'] = playids
+        logging.info(f"Loaded {len(playids)} play descriptions into the PlayID cache.")
+
+    return _playid_cache['playids']
+
+def find_playids(cur, triples):
+    """
+    Looks up the PlayIDs of many (PlayType, Direction, Play_Action) triples in the
+    PlayDescriptions cache and reports the triples that are not in the table.
+
+    Parameters:
+    - cur: A MySQL cursor.
+    - triples: Iterable of (playtype, playdirection, playaction) tuples.
+
+    Returns:
+    - playids: Dictionary mapping playid_key of every known triple to its PlayID.
+    """
+    playids = load_playids(cur)
+
+    # A play type of 'N/A' means the play has no secondary play, it is not unknown
+    unknown = sorted(set(triple for triple in triples if triple[0] != 'N/A' and playid_key(*triple) not in playids))
+    if unknown:
+        print(f"{len(unknown)} play descriptions are not in PlayDescriptions, their PlayID is left empty:")
+        for playtype, playdirection, playaction in unknown:
+            print(f"    {playtype} > {playdirection} > {playaction}")
+
+    return playids
+
  
 def transfer_plays_to_db(file_path):
     conn = connect_to_db()
@@ -131,9 +240,11 @@ def transfer_plays_to_db(file_path):
         try:
             data = read_csv(file_path)
             play_to_db(conn, data)
-            conn.commit()  # Commit after all files are processed
+            refresh_efficiency_groups(conn, data)
+            conn.commit()  # The whole game and its efficiency groups are committed as one transaction
         except Exception as e:
-            print(f"An error occurred: {e}")
+            conn.rollback()
+            print(f"An error occurred, no plays of {file_path} were added: {e}")
         finally:
             conn.close()
     else:
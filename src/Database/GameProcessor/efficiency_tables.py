@@ -0,0 +1,264 @@
+"""
+File: efficiency_tables.py
+
+Description:
+Stores the result of every efficiency view of view_catalog.py in a summary table, so
+reading an efficiency breakdown reads its table instead of aggregating the whole plays
+table again.
+
+The tables are kept current by TeamGameWriter.flush and transfer_plays_to_db: in the
+transaction of new games only the groups the games can change are deleted and computed
+again, the (Player, Team) groups of one-player views and the (PrimaryPlayer,
+SecondaryPlayer, Team) groups of two-player views. They are computed from plays with the query of the view and the
+groups as a condition on plays, since MySQL would aggregate all of plays to select
+them from the view. A view keeps defining its breakdown, so create_edit_view --all
+builds the table of every view it recreates again.
+
+The tables are built, or rebuilt from scratch, with
+    python efficiency_tables.py build
+and written to the efficiency csv files by export_efficiency.py, which reads the
+table of a view instead of the view once it is built.
+
+"""
+
+import os
+import sys
+import logging
+# The view catalog and the queries of the views live in the Database directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from view_catalog import VIEW_CATALOG, match_plays
+from view_queries import load_play_descriptions, one_player_query, two_player_query
+
+# Lists the efficiency views and the summary table of each
+REGISTRY_TABLE = 'EfficiencyTables'
+TABLE_PREFIX = 'mat_'
+
+ONE_PLAYER_KEY = ['Player', 'Team']
+TWO_PLAYER_KEY = ['PrimaryPlayer', 'SecondaryPlayer', 'Team']
+
+# (view name, primary plays, secondary plays, players) entry of every efficiency view
+CATALOG_ENTRIES = {entry[0]: entry for entry in VIEW_CATALOG}
+
+
+def efficiency_table_name(view_name):
+    """Name of the summary table of an efficiency view"""
+    return TABLE_PREFIX + view_name
+
+def create_registry(cur):
+    cur.execute(f"""
+    CREATE TABLE IF NOT EXISTS {REGISTRY_TABLE} (
+        ViewName VARCHAR(64) PRIMARY KEY,
+        TableName VARCHAR(64) NOT NULL,
+        KeyColumns VARCHAR(255) NOT NULL,
+        RefreshedAt DATETIME NOT NULL
+    )
+    """)
+
+def load_efficiency_tables(cur):
+    """
+    Reads the registry of summary tables.
+
+    Parameters:
+    - cur: A MySQL cursor.
+
+    Returns:
+    - tables: List of (view_name, table_name, key_columns) tuples, empty if no table was built yet.
+    """
+    cur.execute("SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                (REGISTRY_TABLE,))
+    if not cur.fetchone()[0]:
+        return []
+
+    cur.execute(f"SELECT ViewName, TableName, KeyColumns FROM {REGISTRY_TABLE} ORDER BY ViewName")
+    return [(view_name, table_name, key_columns.split(',')) for view_name, table_name, key_columns in cur.fetchall()]
+
+def view_key_columns(view_name):
+    """Group columns of an efficiency view of the catalog"""
+    if view_name not in CATALOG_ENTRIES:
+        raise ValueError(f"{view_name} is not a view of view_catalog.py")
+    return ONE_PLAYER_KEY if CATALOG_ENTRIES[view_name][3] == 1 else TWO_PLAYER_KEY
+
+def build_efficiency_table(conn, view_name):
+    """
+    Builds the summary table of an efficiency view from scratch and registers it.
+    CREATE TABLE commits implicitly, so this is not part of a caller's transaction.
+
+    Parameters:
+    - conn: A MySQL database connection object.
+    - view_name: Name of an efficiency view of the catalog.
+
+    Returns:
+    - rows: Number of rows in the built table.
+    """
+    table_name = efficiency_table_name(view_name)
+    cur = conn.cursor()
+    try:
+        key_columns = view_key_columns(view_name)
+        key_str = ', '.join(f'`{column}`' for column in key_columns)
+
+        cur.execute(f"DROP TABLE IF EXISTS `{table_name}`")
+        cur.execute(f"CREATE TABLE `{table_name}` AS SELECT * FROM `{view_name}`")
+        cur.execute(f"ALTER TABLE `{table_name}` ADD INDEX group_key ({key_str})")
+        cur.execute(f"SELECT COUNT(*) FROM `{table_name}`")
+        rows = cur.fetchone()[0]
+
+        create_registry(cur)
+        cur.execute(f"REPLACE INTO {REGISTRY_TABLE} (ViewName, TableName, KeyColumns, RefreshedAt) VALUES (%s, %s, %s, NOW())",
+                    (view_name, table_name, ','.join(key_columns)))
+        conn.commit()
+        return rows
+    finally:
+        cur.close()
+
+def build_efficiency_tables(conn):
+    """
+    Builds the summary table of every efficiency view of the catalog, the views have
+    to be created first with create_edit_view --all.
+
+    Parameters:
+    - conn: A MySQL database connection object.
+
+    Returns:
+    - tables: Number of tables built.
+    """
+    view_names = list(CATALOG_ENTRIES)
+    for view_name in view_names:
+        rows = build_efficiency_table(conn, view_name)
+        print(f"Built {efficiency_table_name(view_name)} with {rows} rows.")
+    return len(view_names)
+
+def touched_groups(data):
+    """
+    Finds the players of a game whose efficiency groups the game changes.
+
+    Parameters:
+    - data: List of rows read from a cleaned game csv file.
+
+    Returns:
+    - (players, pairs): Dictionaries mapping each team to the set of its credited players,
+      and to the set of its (PrimaryPlayer, SecondaryPlayer) pairs.
+    """
+    players = {}
+    pairs = {}
+    for row in data:
+        team = row[3]
+        primary_player = row[6]
+        secondary_player = row[10]
+
+        # One-player views credit the secondary player of a play when there is one
+        players.setdefault(team, set()).add(primary_player if secondary_player == 'N/A' else secondary_player)
+        if primary_player != 'N/A' and secondary_player != 'N/A':
+            pairs.setdefault(team, set()).add((primary_player, secondary_player))
+    return players, pairs
+
+def group_filter(key_columns, team, players, pairs):
+    """
+    Selects the groups of a team to refresh, on the summary table and on plays. The
+    groups may be more than were touched, which is harmless since the same groups are
+    deleted and computed again.
+
+    Parameters:
+    - key_columns: Group columns of the summary table.
+    - team: The team.
+    - players, pairs: The touched groups of every team, from touched_groups.
+
+    Returns:
+    - (clause, condition, values): WHERE clause on the summary table, condition on plays
+      for the query of the view and the values of both, (None, None, None) if the team
+      has no touched groups.
+    """
+    if key_columns == ONE_PLAYER_KEY:
+        names = sorted(players.get(team, ()))
+        if not names:
+            return None, None, None
+        placeholders = ', '.join(['%s'] * len(names))
+        return (f"Team = %s AND Player IN ({placeholders})",
+                f"OffensivePossession = %s AND {{player}} IN ({placeholders})",
+                [team] + names)
+
+    team_pairs = pairs.get(team, ())
+    if not team_pairs:
+        return None, None, None
+    primary_players = sorted(set(pair[0] for pair in team_pairs))
+    secondary_players = sorted(set(pair[1] for pair in team_pairs))
+    primary_placeholders = ', '.join(['%s'] * len(primary_players))
+    secondary_placeholders = ', '.join(['%s'] * len(secondary_players))
+    players_clause = f"PrimaryPlayer IN ({primary_placeholders}) AND SecondaryPlayer IN ({secondary_placeholders})"
+    return (f"Team = %s AND {players_clause}",
+            f"OffensivePossession = %s AND {players_clause}",
+            [team] + primary_players + secondary_players)
+
+def refresh_query(view_name, descriptions, condition, values):
+    """
+    Query of a view of the catalog limited to some groups by a condition on plays.
+
+    Parameters:
+    - view_name: Name of the efficiency view.
+    - descriptions: Rows of PlayDescriptions, to resolve the plays of the view.
+    - condition: Condition on plays from group_filter.
+    - values: Values of the condition.
+
+    Returns:
+    - (query, values): The query and its values, given once for each half of a one-player view.
+    """
+    _, plays, secondary_plays, players = CATALOG_ENTRIES[view_name]
+    play_numbers = match_plays(descriptions, plays)
+    if players == 1:
+        return one_player_query(play_numbers, condition), values + values
+    return two_player_query(play_numbers, match_plays(descriptions, secondary_plays), condition), values
+
+def refresh_efficiency_groups(conn, data):
+    """
+    Refreshes the groups of every summary table changed by the plays of some games.
+    Nothing is committed here, so the plays and their summaries are committed together.
+
+    Parameters:
+    - conn: A MySQL database connection object, the plays of the games already inserted.
+    - data: List of rows read from the cleaned game csv files.
+
+    Returns:
+    - groups: Number of refreshed rows over all tables.
+    """
+    cur = conn.cursor()
+    try:
+        # Tables of views dropped from the catalog are left as they are
+        tables = [table for table in load_efficiency_tables(cur) if table[0] in CATALOG_ENTRIES]
+        if not tables:
+            return 0
+
+        descriptions = load_play_descriptions(cur)
+        players, pairs = touched_groups(data)
+        refreshed = 0
+        for view_name, table_name, key_columns in tables:
+            for team in players:
+                clause, condition, values = group_filter(key_columns, team, players, pairs)
+                if not clause:
+                    continue
+                query, query_values = refresh_query(view_name, descriptions, condition, values)
+                cur.execute(f"DELETE FROM `{table_name}` WHERE {clause}", values)
+                cur.execute(f"INSERT INTO `{table_name}` {query}", query_values)
+                refreshed += cur.rowcount
+
+        cur.execute(f"UPDATE {REGISTRY_TABLE} SET RefreshedAt = NOW()")
+        logging.info(f"Refreshed {refreshed} rows of {len(tables)} efficiency tables.")
+        return refreshed
+    finally:
+        cur.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] != 'build':
+        print("Usage: python efficiency_tables.py build")
+        sys.exit(1)
+
+    from csv_to_database import connect_to_db
+    conn = connect_to_db()
+    if not conn:
+        print("Failed to connect to the database")
+        sys.exit(1)
+
+    try:
+        tables = build_efficiency_tables(conn)
+        print(f"Built {tables} efficiency tables.")
+    finally:
+        conn.close()
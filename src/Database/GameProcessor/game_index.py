@@ -0,0 +1,93 @@
+"""
+File: game_index.py
+
+Description:
+Keeps a persistent SQLite index of the games already written to the team
+csv files, keyed on (Team, Opponent, Date). split_gamedata_by_team asks it
+whether a game is new instead of re-reading the whole team csv file.
+Keys are committed together with the rows they stand for.
+
+The index can be rebuilt from the existing cleaned/Teams/*/*.csv files with
+    python game_index.py rebuild [teams_directory] [index_file]
+
+"""
+
+import os
+import sys
+import glob
+import sqlite3
+import pandas as pd
+
+TEAMS_DIRECTORY = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/Teams'
+GAME_INDEX_PATH = os.path.join(TEAMS_DIRECTORY, 'game_index.sqlite')
+
+KEY_COLUMNS = ['Team', 'Opponent', 'Date']
+
+
+def open_game_index(index_path=GAME_INDEX_PATH):
+    """
+    Opens the game index, creating it if it does not exist yet.
+
+    Parameters:
+    - index_path: Path of the SQLite index file.
+
+    Returns:
+    - conn: sqlite3 connection to the index.
+    """
+    conn = sqlite3.connect(index_path)
+    conn.execute('CREATE TABLE IF NOT EXISTS games (Team TEXT, Opponent TEXT, Date TEXT, PRIMARY KEY (Team, Opponent, Date))')
+    conn.commit()
+    return conn
+
+def add_game_key(conn, team, opponent, date):
+    """
+    Adds the key of a game to the index without committing it. The caller commits
+    the index once the game is written, or rolls it back if writing failed.
+
+    Parameters:
+    - conn: sqlite3 connection to the index.
+    - team: Name of the team.
+    - opponent: Name of the opponent.
+    - date: Date of the game.
+
+    Returns:
+    - is_new_game: True if the game was not indexed yet and should be written.
+    """
+    cursor = conn.execute('INSERT OR IGNORE INTO games (Team, Opponent, Date) VALUES (?, ?, ?)',
+                          (str(team), str(opponent), str(date)))
+    return cursor.rowcount == 1
+
+def rebuild_game_index(teams_directory=TEAMS_DIRECTORY, index_path=GAME_INDEX_PATH):
+    """
+    Rebuilds the game index from the team csv files.
+
+    Parameters:
+    - teams_directory: Directory holding one folder with a csv file per team.
+    - index_path: Path of the SQLite index file.
+
+    Returns:
+    - games: Number of games in the rebuilt index.
+    """
+    conn = open_game_index(index_path)
+    try:
+        conn.execute('DELETE FROM games')
+        for file_path in sorted(glob.glob(os.path.join(teams_directory, '*', '*.csv'))):
+            keys = pd.read_csv(file_path, usecols=KEY_COLUMNS, dtype=str)
+            conn.executemany('INSERT OR IGNORE INTO games (Team, Opponent, Date) VALUES (?, ?, ?)',
+                             keys.itertuples(index=False, name=None))
+        conn.commit()
+        games = conn.execute('SELECT COUNT(*) FROM games').fetchone()[0]
+    finally:
+        conn.close()
+    return games
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] != 'rebuild':
+        print("Usage: python game_index.py rebuild [teams_directory] [index_file]")
+        sys.exit(1)
+
+    teams_directory = sys.argv[2] if len(sys.argv) > 2 else TEAMS_DIRECTORY
+    index_path = sys.argv[3] if len(sys.argv) > 3 else os.path.join(teams_directory, 'game_index.sqlite')
+    games = rebuild_game_index(teams_directory, index_path)
+    print(f"Indexed {games} games from {teams_directory} into {index_path}.")
@@ -1,50 +1,237 @@
 import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
 from clean_csv import run_clean_csv
-from split_gamedata_by_team import split_row_by_team
+from split_gamedata_by_team import split_row_by_team, TeamGameWriter
 from csv_to_database import transfer_games_to_db
-from csv_to_database import transfer_plays_to_db
+from csv_to_database import read_csv
 from process_games import df_to_csv_file
 import shutil
 
+UNSAVED_DIRECTORY = "/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/raw/unsaved_games"
+SAVED_DIRECTORY = "/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/raw/saved_games"
+CLEANED_DIRECTORY = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/game_csv'
+UNPROCESSED_GAMES_CSV = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/unprocessed_games.csv'
+
+# Columns of the score review file used by the batch mode
+REVIEW_COLUMNS = ['File', 'Team1', 'Team2', 'Date', 'T1Pts', 'T2Pts']
+
+
+def list_unsaved_games():
+    """
+    Lists the raw game files waiting to be processed, in a stable order.
+
+    Returns:
+    - filenames: Sorted list of the csv file names in the unsaved games directory.
+    """
+    # Handles .DS_Store
+    return sorted(filename for filename in os.listdir(UNSAVED_DIRECTORY) if 'DS_Store' not in filename)
+
+def clean_game(filename):
+    """
+    Cleans one raw game file. Runs inside the worker processes of the batch mode,
+    so it only reads files and never touches the database or the shared csv files.
+
+    Parameters:
+    - filename: Name of the raw game file in the unsaved games directory.
+
+    Returns:
+    - (filename, result): result is the tuple returned by run_clean_csv, None if the game failed.
+    """
+    try:
+        return filename, run_clean_csv(filename)
+    except Exception as e:
+        print(f"Error cleaning {filename}: {e}")
+        return filename, None
+
+def write_game_files(filename, final_df, t1score, t2score, game_df):
+    """
+    Appends a cleaned game to unprocessed_games.csv and writes its cleaned plays file.
+    Nothing reaches the database here.
+
+    Parameters:
+    - filename: Name of the raw game file.
+    - final_df: DataFrame of the cleaned plays.
+    - t1score, t2score: Confirmed scores of the teams.
+    - game_df: Aggregated game statistics DataFrame.
+
+    Returns:
+    - cleaned_file_path: Path of the cleaned plays file.
+    """
+    # Updates scores if neccesary and moves to unprocessed games csv file
+    df_to_csv_file(game_df, t1score, t2score)
+
+    # Creates a new file with clean play data into seperate folder
+    clean_file_name = 'cleaned_' + filename
+    cleaned_file_path = os.path.join(CLEANED_DIRECTORY, clean_file_name)
+    final_df.to_csv(cleaned_file_path, encoding='utf-8', index=False)
+    return cleaned_file_path
+
+def save_game(filename, final_df, team1, team2, date, t1score, t2score, game_df):
+    """
+    Writes one cleaned game everywhere it is stored and moves the raw file to the
+    saved games directory. The plays and the team rows of the game are committed
+    together, and not at all if the game is already in the game index.
+
+    Parameters:
+    - filename: Name of the raw game file.
+    - final_df: DataFrame of the cleaned plays.
+    - team1, team2: Names of the teams.
+    - date: Date of the game.
+    - t1score, t2score: Confirmed scores of the teams.
+    - game_df: Aggregated game statistics DataFrame.
+    """
+    cleaned_file_path = write_game_files(filename, final_df, t1score, t2score, game_df)
+
+    # Adds the plays and team stats to database
+    split_row_by_team(pd.read_csv(UNPROCESSED_GAMES_CSV), team1, team2, date, plays=read_csv(cleaned_file_path))
+
+    move_to_saved(filename)
+
+def move_to_saved(filename):
+    """Moves a raw game file to the saved location once it is in the database"""
+    source = os.path.join(UNSAVED_DIRECTORY, filename)
+    destination = os.path.join(SAVED_DIRECTORY, filename)
+    shutil.move(source, destination)
+    print(f'{filename} was proccessed and added to database.\n')
+
+def review_scores_interactively(flagged):
+    """
+    Asks once for all games whose score could not be fully accounted for, and
+    lets the user correct the ones that are wrong.
+
+    Parameters:
+    - flagged: Dictionary mapping file names to [team1, team2, date, t1score, t2score].
+    """
+    print('Check the scores of these games:')
+    for number, (team1, team2, date, t1score, t2score) in enumerate(flagged.values(), start=1):
+        print(f'    {number}. {date} {team1}: {t1score}  {team2}: {t2score}')
+    output = input('Do these scores look correct\n[ y/n ]: ')
+    if output != 'n':
+        return
+
+    print('Okay input new scores (leave blank to keep a score)')
+    for game in flagged.values():
+        team1, team2, date = game[0], game[1], game[2]
+        print(f'{team1} vs {team2} on {date}')
+        t1score = input(f'{team1}: ')
+        t2score = input(f'{team2}: ')
+        if t1score:
+            game[3] = t1score
+        if t2score:
+            game[4] = t2score
+
+def review_scores_from_file(flagged, review_file):
+    """
+    Resolves games whose score could not be fully accounted for with a review file.
+    Scores already in the file are taken as confirmed, every other flagged game is
+    appended to the file and held back so it can be checked before the next run.
+
+    Parameters:
+    - flagged: Dictionary mapping file names to [team1, team2, date, t1score, t2score].
+    - review_file: Path of the review csv file.
+
+    Returns:
+    - held_back: List of the file names that still need to be reviewed.
+    """
+    if os.path.isfile(review_file):
+        reviewed = pd.read_csv(review_file).drop_duplicates('File', keep='last').set_index('File')
+    else:
+        reviewed = pd.DataFrame(columns=REVIEW_COLUMNS).set_index('File')
+
+    held_back = []
+    for filename, game in flagged.items():
+        if filename in reviewed.index:
+            game[3] = reviewed.at[filename, 'T1Pts']
+            game[4] = reviewed.at[filename, 'T2Pts']
+        else:
+            held_back.append(filename)
+
+    if held_back:
+        pending = pd.DataFrame([[filename] + flagged[filename] for filename in held_back], columns=REVIEW_COLUMNS)
+        pending.to_csv(review_file, mode='a', header=not os.path.isfile(review_file), index=False)
+        print(f'{len(held_back)} games need their score checked in {review_file}, rerun once it is reviewed.')
+
+    return held_back
+
+def run_batch(workers=None, review_file=None):
+    """
+    Processes every unsaved game in batch. Cleaning and aggregating run in a
+    process pool, then this process alone writes the games in file name order.
+    The plays and team rows of all new games are committed together at the
+    end, and only then are the raw files moved to the saved games directory,
+    so a failed run can be rerun without inserting any game twice.
+
+    Parameters:
+    - workers: Number of worker processes (defaults to the number of cores).
+    - review_file: Optional review csv file used instead of prompting for scores.
+    """
+    filenames = list_unsaved_games()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        cleaned = [(filename, result) for filename, result in executor.map(clean_game, filenames) if result is not None]
+
+    # Scores that could not be fully accounted for are all reviewed at the end
+    flagged = {filename: [result[1], result[2], result[3], result[5], result[6]]
+               for filename, result in cleaned if result[4]}
+    held_back = []
+    if flagged:
+        if review_file:
+            held_back = review_scores_from_file(flagged, review_file)
+        else:
+            review_scores_interactively(flagged)
+
+    # Every game is added to unprocessed_games.csv first, so the file is read once for the whole batch
+    written = []
+    for filename, (final_df, team1, team2, date, play_not_counted, t1score, t2score, game_df) in cleaned:
+        if filename in held_back:
+            continue
+        if filename in flagged:
+            t1score, t2score = flagged[filename][3], flagged[filename][4]
+        cleaned_file_path = write_game_files(filename, final_df, t1score, t2score, game_df)
+        written.append((filename, team1, team2, date, cleaned_file_path))
+
+    # Plays and team rows of every game are written together once all games are queued
+    writer = TeamGameWriter()
+    saved = []
+    try:
+        games_df = pd.read_csv(UNPROCESSED_GAMES_CSV)
+        for filename, team1, team2, date, cleaned_file_path in written:
+            split_row_by_team(games_df, team1, team2, date, writer, read_csv(cleaned_file_path))
+            saved.append(filename)
+        writer.flush()
+    finally:
+        writer.close()
+
+    for filename in saved:
+        move_to_saved(filename)
+
+    print(f'{len(saved)} of {len(filenames)} games were processed.')
+
 
 if __name__ == '__main__':
-    directory = "/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/raw/unsaved_games"
-    for filename in os.listdir(directory):
-        # Handles .DS_Store
-        if 'DS_Store' in filename:
-            continue 
-        
-        # Cleans csv and creates a copy
-        final_df, team1, team2, date, play_not_counted, t1score, t2score, game_df = run_clean_csv(filename)
-        
-        if play_not_counted:
-            output = input(f'Check score for {team1} vs {team2} on {date}\n\
-                Does this score look correct\n\
-                {team1}: {t1score}\n\
-                {team2}: {t2score}\n\
-                [ y/n ]: ')
-            if output == 'n':
-                print('Okay input new scores')
-                t1score = input(f'{team1}: ')
-                t2score = input(f'{team2}: ')
-        
-        # Updates scores if neccesary and moves to unprocessed games csv file
-        df_to_csv_file(game_df, t1score, t2score)
-                
-        # Creates a new file with clean play data into seperate folder
-        clean_file_name = 'cleaned_' + filename
-        cleaned_file_path = os.path.join('/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/game_csv', clean_file_name)
-        final_df.to_csv(cleaned_file_path, encoding='utf-8', index=False)
-        
-        # Transfers play-by-play statistics into actual database
-        transfer_plays_to_db(cleaned_file_path)
-        
-        # Adds team stats to database
-        split_directory = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/unprocessed_games.csv'
-        split_row_by_team(split_directory, team1, team2, date)
-        
-        # Moves files to a saved location once they are in the database
-        source = os.path.join("/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/raw/unsaved_games", filename)
-        destination = os.path.join("/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/raw/saved_games", filename)
-        shutil.move(source, destination)
-        print(f'{filename} was proccessed and added to database.\n')
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Processes the raw games in unsaved_games and adds them to the database.')
+    parser.add_argument('--batch', action='store_true', help='clean games in parallel and review scores once at the end')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes for --batch')
+    parser.add_argument('--review-file', default=None, help='csv file to review scores in instead of prompting (--batch only)')
+    args = parser.parse_args()
+
+    if args.batch:
+        run_batch(args.workers, args.review_file)
+    else:
+        for filename in list_unsaved_games():
+            # Cleans csv and creates a copy
+            final_df, team1, team2, date, play_not_counted, t1score, t2score, game_df = run_clean_csv(filename)
+
+            if play_not_counted:
+                output = input(f'Check score for {team1} vs {team2} on {date}\n\
+                    Does this score look correct\n\
+                    {team1}: {t1score}\n\
+                    {team2}: {t2score}\n\
+                    [ y/n ]: ')
+                if output == 'n':
+                    print('Okay input new scores')
+                    t1score = input(f'{team1}: ')
+                    t2score = input(f'{team2}: ')
+
+            save_game(filename, final_df, team1, team2, date, t1score, t2score, game_df)
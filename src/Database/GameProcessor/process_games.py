@@ -4,914 +4,392 @@ import sys
 import os
 from pathlib import Path
 
-def update_score(row, new_df, one_or_two, team1, team2):
+# Columns of a processed game, one row per game
+GAME_COLUMNS = ['Team1', 'Team2', 'T1Pts', 'T2Pts', 'TotalPts', 'Differential',
+                'T1_CutPlays', 'T1_Cut2PA', 'T1_Cut2PM', 'T1_Cut2P%', 'T1_CutTO', 'T1_CutFouls', 
+
+                'T1_PnrPlays', 'T1_Pnr3PA', 'T1_Pnr3PM', 'T1_Pnr3P%', 'T1_Pnr2PA', 'T1_Pnr2PM', 'T1_Pnr2P%', 'T1_PnrMiA','T1_PnrMiM', 
+                'T1_PnrMi%', 'T1_PnrEFG%', 'T1_PnrTO', 'T1_PnrFouls', 
+
+                'T1_PostPlays','T1_Post2PA', 'T1_Post2PM', 'T1_Post2P%', 'T1_PostTO', 'T1_PostFouls', 
+
+                'T1_RollPlays', 'T1_Roll3PA', 'T1_Roll3PM', 'T1_Roll3P%', 'T1_Roll2PA', 'T1_Roll2PM', 'T1_Roll2P%', 'T1_RollMiA',
+                'T1_RollMiM', 'T1_RollMi%', 'T1_RollEFG%', 'T1_RollTO', 'T1_RollFouls', 
+
+                'T1_SUShotPlays', 'T1_SUShot3PA', 'T1_SUShot3PM', 'T1_SUShot3P%', 'T1_SUShotMiA','T1_SUShotMiM', 'T1_SUShotMi%', 
+                'T1_SUShotTO', 'T1_SUShotFouls', 
+
+                'T1_SUDrivePlays', 'T1_SUDriveMiA', 'T1_SUDriveMiM', 'T1_SUDriveMi%', 'T1_SUDrive2PA', 'T1_SUDrive2PM', 'T1_SUDrive2P%', 
+                'T1_SUDriveTO', 'T1_SUDriveFouls',
+
+                'T1_IsoPlays', 'T1_Iso3PA', 'T1_Iso3PM', 'T1_Iso3P%', 'T1_Iso2PA', 'T1_Iso2PM', 'T1_Iso2P%', 'T1_IsoMiA','T1_IsoMiM', 
+                'T1_IsoMi%', 'T1_IsoEFG%', 'T1_IsoTO', 'T1_IsoFouls',
+
+                'T1_TransitionPlays', 'T1_Transition3PA', 'T1_Transition3PM', 'T1_Transition3P%', 
+                'T1_Transition2PA', 'T1_Transition2PM', 'T1_Transition2P%', 'T1_TransitionMiA','T1_TransitionMiM', 
+                'T1_TransitionMi%', 'T1_TransitionEFG%', 'T1_TransitionTO', 'T1_TransitionFouls', 
+
+                'T1_OfscPlays', 'T1_Ofsc3PA', 'T1_Ofsc3PM', 'T1_Ofsc3P%', 'T1_Ofsc2PA', 'T1_Ofsc2PM', 'T1_Ofsc2P%', 'T1_OfscMiA','T1_OfscMiM', 
+                'T1_OfscMi%', 'T1_OfscEFG%', 'T1_OfscTO', 'T1_OfscFouls', 
+
+                'T1_HaOfPlays', 'T1_HaOf3PA', 'T1_HaOf3PM', 'T1_HaOf3P%', 'T1_HaOf2PA', 'T1_HaOf2PM', 'T1_HaOf2P%', 'T1_HaOfMiA',
+                'T1_HaOfMiM', 'T1_HaOfMi%', 'T1_HaOfEFG%', 'T1_HaOfTO', 'T1_HaOfFouls',
+
+
+                'T2_CutPlays', 'T2_Cut2PA', 'T2_Cut2PM', 'T2_Cut2P%', 'T2_CutTO', 'T2_CutFouls', 
+
+                'T2_PnrPlays', 'T2_Pnr3PA', 'T2_Pnr3PM', 'T2_Pnr3P%', 'T2_Pnr2PA', 'T2_Pnr2PM', 
+                'T2_Pnr2P%', 'T2_PnrMiA', 'T2_PnrMiM', 'T2_PnrMi%', 'T2_PnrEFG%', 'T2_PnrTO', 
+                'T2_PnrFouls', 
+
+                'T2_PostPlays', 'T2_Post2PA', 'T2_Post2PM', 'T2_Post2P%', 'T2_PostTO', 'T2_PostFouls', 
+
+                'T2_RollPlays', 'T2_Roll3PA', 'T2_Roll3PM', 'T2_Roll3P%', 'T2_Roll2PA', 
+                'T2_Roll2PM', 'T2_Roll2P%', 'T2_RollMiA', 'T2_RollMiM', 'T2_RollMi%', 
+                'T2_RollEFG%', 'T2_RollTO', 'T2_RollFouls', 
+
+                'T2_SUShotPlays', 'T2_SUShot3PA', 'T2_SUShot3PM', 'T2_SUShot3P%', 
+                'T2_SUShotMiA', 'T2_SUShotMiM', 'T2_SUShotMi%', 'T2_SUShotTO', 
+                'T2_SUShotFouls', 
+
+                'T2_SUDrivePlays', 'T2_SUDriveMiA', 'T2_SUDriveMiM', 'T2_SUDriveMi%', 'T2_SUDrive2PA', 
+                'T2_SUDrive2PM', 'T2_SUDrive2P%', 'T2_SUDriveTO', 'T2_SUDriveFouls',
+
+                'T2_IsoPlays', 'T2_Iso3PA', 'T2_Iso3PM', 'T2_Iso3P%', 'T2_Iso2PA', 
+                'T2_Iso2PM', 'T2_Iso2P%', 'T2_IsoMiA', 'T2_IsoMiM', 'T2_IsoMi%', 
+                'T2_IsoEFG%', 'T2_IsoTO', 'T2_IsoFouls',
+
+                'T2_TransitionPlays', 'T2_Transition3PA', 
+                'T2_Transition3PM', 'T2_Transition3P%', 'T2_Transition2PA', 
+                'T2_Transition2PM', 'T2_Transition2P%', 'T2_TransitionMiA', 
+                'T2_TransitionMiM', 'T2_TransitionMi%', 'T2_TransitionEFG%', 
+                'T2_TransitionTO', 'T2_TransitionFouls', 
+
+                'T2_OfscPlays', 'T2_Ofsc3PA', 'T2_Ofsc3PM', 'T2_Ofsc3P%', 
+                'T2_Ofsc2PA', 'T2_Ofsc2PM', 'T2_Ofsc2P%', 'T2_OfscMiA', 
+                'T2_OfscMiM', 'T2_OfscMi%', 'T2_OfscEFG%', 'T2_OfscTO', 
+                'T2_OfscFouls', 
+
+                'T2_HaOfPlays', 'T2_HaOf3PA', 'T2_HaOf3PM', 'T2_HaOf3P%', 
+                'T2_HaOf2PA', 'T2_HaOf2PM', 'T2_HaOf2P%', 'T2_HaOfMiA', 
+                'T2_HaOfMiM', 'T2_HaOfMi%', 'T2_HaOfEFG%', 'T2_HaOfTO', 'T2_HaOfFouls',
+
+                'Date'
+]
+
+# Counter slots of every play family. 'Plays' is incremented for every play of the family
+# and the outcome slots below are incremented depending on the play's outcome and shot level.
+# Shot levels are bucketed into 1 (at the basket), 2 (mid range, levels 2 and 3) and 4 (three)
+ANY_LEVEL = (1, 2, 4)
+NOT_BASKET = (2, 4)
+THREE = (4,)
+NOT_THREE = (1, 2)
+MID_RANGE = (2,)
+
+FULL_OUTCOME_SLOTS = {
+    '2pMa': [('2PM', ANY_LEVEL), ('2PA', ANY_LEVEL), ('MiM', NOT_BASKET), ('MiA', NOT_BASKET)],
+    '2pmi': [('2PA', ANY_LEVEL), ('MiA', NOT_BASKET)],
+    '3pMa': [('3PM', ANY_LEVEL), ('3PA', ANY_LEVEL)],
+    '3pmi': [('3PA', ANY_LEVEL)],
+    'Turnover': [('TO', ANY_LEVEL)],
+    'Foul': [('Fouls', ANY_LEVEL)],
+    'And1': [('3PM', THREE), ('3PA', THREE), ('2PM', NOT_THREE), ('2PA', NOT_THREE), ('MiM', MID_RANGE), ('MiA', MID_RANGE)]
+}
+
+OUTCOME_SLOTS = {
+    'Pnr': FULL_OUTCOME_SLOTS,
+    'Iso': FULL_OUTCOME_SLOTS,
+    'Transition': FULL_OUTCOME_SLOTS,
+    'Ofsc': FULL_OUTCOME_SLOTS,
+    'HaOf': FULL_OUTCOME_SLOTS,
+    'Roll': FULL_OUTCOME_SLOTS,
+    'Cut': {
+        '2pMa': [('2PA', ANY_LEVEL), ('2PM', ANY_LEVEL)],
+        '2pmi': [('2PM', ANY_LEVEL)],
+        'Turnover': [('TO', ANY_LEVEL)],
+        'Foul': [('Fouls', ANY_LEVEL)],
+        'And1': [('2PA', ANY_LEVEL), ('2PM', ANY_LEVEL)]
+    },
+    'Post': {
+        '2pMa': [('2PM', ANY_LEVEL), ('2PA', ANY_LEVEL)],
+        '2pmi': [('2PA', ANY_LEVEL)],
+        'Turnover': [('TO', ANY_LEVEL)],
+        'Foul': [('Fouls', ANY_LEVEL)],
+        'And1': [('2PM', ANY_LEVEL), ('2PA', ANY_LEVEL)]
+    },
+    'SUShot': {
+        '2pMa': [('MiM', ANY_LEVEL), ('MiA', ANY_LEVEL)],
+        '2pmi': [('MiA', ANY_LEVEL)],
+        '3pMa': [('3PM', ANY_LEVEL), ('3PA', ANY_LEVEL)],
+        '3pmi': [('3PA', ANY_LEVEL)],
+        'Turnover': [('TO', ANY_LEVEL)],
+        'Foul': [('Fouls', ANY_LEVEL)],
+        'And1': [('3PM', THREE), ('3PA', THREE), ('MiM', NOT_THREE), ('MiA', NOT_THREE)]
+    },
+    'SUDrive': {
+        '2pMa': [('2PM', ANY_LEVEL), ('2PA', ANY_LEVEL), ('MiM', NOT_BASKET), ('MiA', NOT_BASKET)],
+        '2pmi': [('2PA', ANY_LEVEL), ('MiA', NOT_BASKET)],
+        'Turnover': [('TO', ANY_LEVEL)],
+        'Foul': [('Fouls', ANY_LEVEL)],
+        'And1': [('2PM', ANY_LEVEL), ('2PA', ANY_LEVEL), ('MiM', NOT_BASKET), ('MiA', NOT_BASKET)]
+    }
+}
+
+# Percentage slots of every play family as (percentage, makes, attempts).
+# Cut and Roll divide the counters the way the stats already stored were computed
+PERCENT_SLOTS = {
+    'Pnr': [('3P%', '3PM', '3PA'), ('2P%', '2PM', '2PA'), ('Mi%', 'MiM', 'MiA')],
+    'Iso': [('3P%', '3PM', '3PA'), ('2P%', '2PM', '2PA'), ('Mi%', 'MiM', 'MiA')],
+    'Transition': [('3P%', '3PM', '3PA'), ('2P%', '2PM', '2PA'), ('Mi%', 'MiM', 'MiA')],
+    'Ofsc': [('3P%', '3PM', '3PA'), ('2P%', '2PM', '2PA'), ('Mi%', 'MiM', 'MiA')],
+    'HaOf': [('3P%', '3PM', '3PA'), ('2P%', '2PM', '2PA'), ('Mi%', 'MiM', 'MiA')],
+    'Roll': [('3P%', '3PM', '3PA'), ('2P%', '2PM', '2PA'), ('Mi%', 'MiA', 'MiM')],
+    'Cut': [('2P%', '2PA', '2PM')],
+    'Post': [('2P%', '2PM', '2PA')],
+    'SUShot': [('Mi%', 'MiM', 'MiA'), ('3P%', '3PM', '3PA')],
+    'SUDrive': [('2P%', '2PM', '2PA'), ('Mi%', 'MiM', 'MiA')]
+}
+
+# Play families that also track EFG%
+EFG_FAMILIES = ['Pnr', 'Roll', 'Iso', 'Transition', 'Ofsc', 'HaOf']
+
+
+def build_slot_table():
     """
-    Updates the scores for Team1 or Team2 based on the play result.
-    
-    Parameters:
-    - row: A row from the unprocessed DataFrame.
-    - new_df: The game DataFrame to be updated.
-    - one_or_two: Flag indicating which team to update (1 for Team1, else Team2).
-    - team1: Name of Team1.
-    - team2: Name of Team2.
-    """
-    # Initialize scores from the DataFrame   
-    if one_or_two == 1:
-        if row['Result'] == 'Make 2 Pts':
-            new_df.at[0, 'T1Pts'] += 2
-        elif row['Result'] == 'Make 3 Pts':
-            new_df.at[0, 'T1Pts'] += 3
-        elif row['Result'] == 'Free Throw':
-            if isinstance(row['Synergy Tags'], str):
-                if 'FTM' in row['Synergy Tags']:
-                    new_df.at[0, 'T1Pts'] += 1
-            else:
-                print(f"{team1} vs {team2}: Free Throw at Play #{row['#']} not accounted for.")
-                return True
-        elif row['Result'] in ['1 Pts', '0 Pts']:
-            if isinstance(row['Synergy Tags'], str):
-                if '3FGM' in row['Synergy Tags']:
-                    new_df.at[0, 'T1Pts'] += 3
-                elif '2FGM' in row['Synergy Tags']:
-                    new_df.at[0, 'T1Pts'] += 2
-            else:
-                print(f"{team1} vs {team2}: And 1 at Play #{row['#']} not accounted for.")
-                return True
-    else:
-        if row['Result'] == 'Make 2 Pts':
-            new_df.at[0, 'T2Pts'] += 2
-        elif row['Result'] == 'Make 3 Pts':
-            new_df.at[0, 'T2Pts'] += 3
-        elif row['Result'] == 'Free Throw':
-            if isinstance(row['Synergy Tags'], str):
-                if 'FTM' in row['Synergy Tags']:
-                    new_df.at[0, 'T2Pts'] += 1
-            else:
-                print(f"{team1} vs {team2}: Free Throw at Play #{row['#']} not accounted for.")
-                return True
-        elif row['Result'] in ['1 Pts', '0 Pts']:
-            if isinstance(row['Synergy Tags'], str):
-                if '3FGM' in row['Synergy Tags']:
-                    new_df.at[0, 'T2Pts'] += 3
-                elif '2FGM' in row['Synergy Tags']:
-                    new_df.at[0, 'T2Pts'] += 2
-            else:
-                print(f"{team1} vs {team2}: And 1 at Play #{row['#']} not accounted for.")
-                return True
-    return False
+    Expands OUTCOME_SLOTS into a lookup table with one row per
+    (family, outcome, shot level bucket, slot) increment.
 
-def process_game(unprocessed_df: pd.DataFrame, processed_df: pd.DataFrame):
-    """
-    Processes the game by updating statistics based on unprocessed and processed DataFrames.
-    
-    Parameters:
-    - unprocessed_df: DataFrame containing unprocessed game plays.
-    - processed_df: DataFrame containing processed game plays.
-    
     Returns:
-    - game_df: Updated game statistics DataFrame.
+    - slot_table: DataFrame with columns 'Family', 'Outcome', 'LevelBucket' and 'Slot'.
     """
-    columns = ['Team1', 'Team2', 'T1Pts', 'T2Pts', 'TotalPts', 'Differential', 
-               'T1_CutPlays', 'T1_Cut2PA', 'T1_Cut2PM', 'T1_Cut2P%', 'T1_CutTO', 'T1_CutFouls', 
-               
-               'T1_PnrPlays', 'T1_Pnr3PA', 'T1_Pnr3PM', 'T1_Pnr3P%', 'T1_Pnr2PA', 'T1_Pnr2PM', 'T1_Pnr2P%', 'T1_PnrMiA','T1_PnrMiM', 
-               'T1_PnrMi%', 'T1_PnrEFG%', 'T1_PnrTO', 'T1_PnrFouls', 
-               
-               'T1_PostPlays','T1_Post2PA', 'T1_Post2PM', 'T1_Post2P%', 'T1_PostTO', 'T1_PostFouls', 
-               
-               'T1_RollPlays', 'T1_Roll3PA', 'T1_Roll3PM', 'T1_Roll3P%', 'T1_Roll2PA', 'T1_Roll2PM', 'T1_Roll2P%', 'T1_RollMiA',
-               'T1_RollMiM', 'T1_RollMi%', 'T1_RollEFG%', 'T1_RollTO', 'T1_RollFouls', 
-               
-               'T1_SUShotPlays', 'T1_SUShot3PA', 'T1_SUShot3PM', 'T1_SUShot3P%', 'T1_SUShotMiA','T1_SUShotMiM', 'T1_SUShotMi%', 
-               'T1_SUShotTO', 'T1_SUShotFouls', 
-               
-               'T1_SUDrivePlays', 'T1_SUDriveMiA', 'T1_SUDriveMiM', 'T1_SUDriveMi%', 'T1_SUDrive2PA', 'T1_SUDrive2PM', 'T1_SUDrive2P%', 
-               'T1_SUDriveTO', 'T1_SUDriveFouls',
-               
-               'T1_IsoPlays', 'T1_Iso3PA', 'T1_Iso3PM', 'T1_Iso3P%', 'T1_Iso2PA', 'T1_Iso2PM', 'T1_Iso2P%', 'T1_IsoMiA','T1_IsoMiM', 
-               'T1_IsoMi%', 'T1_IsoEFG%', 'T1_IsoTO', 'T1_IsoFouls',
-               
-               'T1_TransitionPlays', 'T1_Transition3PA', 'T1_Transition3PM', 'T1_Transition3P%', 
-               'T1_Transition2PA', 'T1_Transition2PM', 'T1_Transition2P%', 'T1_TransitionMiA','T1_TransitionMiM', 
-               'T1_TransitionMi%', 'T1_TransitionEFG%', 'T1_TransitionTO', 'T1_TransitionFouls', 
-               
-               'T1_OfscPlays', 'T1_Ofsc3PA', 'T1_Ofsc3PM', 'T1_Ofsc3P%', 'T1_Ofsc2PA', 'T1_Ofsc2PM', 'T1_Ofsc2P%', 'T1_OfscMiA','T1_OfscMiM', 
-               'T1_OfscMi%', 'T1_OfscEFG%', 'T1_OfscTO', 'T1_OfscFouls', 
-               
-               'T1_HaOfPlays', 'T1_HaOf3PA', 'T1_HaOf3PM', 'T1_HaOf3P%', 'T1_HaOf2PA', 'T1_HaOf2PM', 'T1_HaOf2P%', 'T1_HaOfMiA',
-               'T1_HaOfMiM', 'T1_HaOfMi%', 'T1_HaOfEFG%', 'T1_HaOfTO', 'T1_HaOfFouls',
-               
-               
-               'T2_CutPlays', 'T2_Cut2PA', 'T2_Cut2PM', 'T2_Cut2P%', 'T2_CutTO', 'T2_CutFouls', 
-
-               'T2_PnrPlays', 'T2_Pnr3PA', 'T2_Pnr3PM', 'T2_Pnr3P%', 'T2_Pnr2PA', 'T2_Pnr2PM', 
-               'T2_Pnr2P%', 'T2_PnrMiA', 'T2_PnrMiM', 'T2_PnrMi%', 'T2_PnrEFG%', 'T2_PnrTO', 
-               'T2_PnrFouls', 
-               
-               'T2_PostPlays', 'T2_Post2PA', 'T2_Post2PM', 'T2_Post2P%', 'T2_PostTO', 'T2_PostFouls', 
-
-               'T2_RollPlays', 'T2_Roll3PA', 'T2_Roll3PM', 'T2_Roll3P%', 'T2_Roll2PA', 
-               'T2_Roll2PM', 'T2_Roll2P%', 'T2_RollMiA', 'T2_RollMiM', 'T2_RollMi%', 
-               'T2_RollEFG%', 'T2_RollTO', 'T2_RollFouls', 
-
-               'T2_SUShotPlays', 'T2_SUShot3PA', 'T2_SUShot3PM', 'T2_SUShot3P%', 
-               'T2_SUShotMiA', 'T2_SUShotMiM', 'T2_SUShotMi%', 'T2_SUShotTO', 
-               'T2_SUShotFouls', 
-
-               'T2_SUDrivePlays', 'T2_SUDriveMiA', 'T2_SUDriveMiM', 'T2_SUDriveMi%', 'T2_SUDrive2PA', 
-               'T2_SUDrive2PM', 'T2_SUDrive2P%', 'T2_SUDriveTO', 'T2_SUDriveFouls',
-
-               'T2_IsoPlays', 'T2_Iso3PA', 'T2_Iso3PM', 'T2_Iso3P%', 'T2_Iso2PA', 
-               'T2_Iso2PM', 'T2_Iso2P%', 'T2_IsoMiA', 'T2_IsoMiM', 'T2_IsoMi%', 
-               'T2_IsoEFG%', 'T2_IsoTO', 'T2_IsoFouls',
-
-               'T2_TransitionPlays', 'T2_Transition3PA', 
-               'T2_Transition3PM', 'T2_Transition3P%', 'T2_Transition2PA', 
-               'T2_Transition2PM', 'T2_Transition2P%', 'T2_TransitionMiA', 
-               'T2_TransitionMiM', 'T2_TransitionMi%', 'T2_TransitionEFG%', 
-               'T2_TransitionTO', 'T2_TransitionFouls', 
-
-               'T2_OfscPlays', 'T2_Ofsc3PA', 'T2_Ofsc3PM', 'T2_Ofsc3P%', 
-               'T2_Ofsc2PA', 'T2_Ofsc2PM', 'T2_Ofsc2P%', 'T2_OfscMiA', 
-               'T2_OfscMiM', 'T2_OfscMi%', 'T2_OfscEFG%', 'T2_OfscTO', 
-               'T2_OfscFouls', 
-
-               'T2_HaOfPlays', 'T2_HaOf3PA', 'T2_HaOf3PM', 'T2_HaOf3P%', 
-               'T2_HaOf2PA', 'T2_HaOf2PM', 'T2_HaOf2P%', 'T2_HaOfMiA', 
-               'T2_HaOfMiM', 'T2_HaOfMi%', 'T2_HaOfEFG%', 'T2_HaOfTO', 'T2_HaOfFouls',
-               
-               'Date'
-            ]
-    
-    processed_df = processed_df.reset_index(drop=True)
-
-    # Identify unique teams
-    unique_teams = processed_df['OffensivePossession'].unique().tolist()
-    if len(unique_teams) < 2:
-        print("Error: Less than two unique teams found in 'OffensivePossession'.")
-        return None
-    team1 = unique_teams[0]
-    team2 = unique_teams[1]
+    rows = []
+    for family, outcomes in OUTCOME_SLOTS.items():
+        for outcome, slots in outcomes.items():
+            for slot, levels in slots:
+                for level in levels:
+                    rows.append((family, outcome, level, slot))
+    return pd.DataFrame(rows, columns=['Family', 'Outcome', 'LevelBucket', 'Slot'])
 
-    # Initialize game_df with a single row containing team names and zeros for all stats
-    initial_data = [team1, team2] + [0] * (len(columns) - 2)
-    game_df = pd.DataFrame([initial_data], columns=columns)
+SLOT_TABLE = build_slot_table()
 
-    play_not_counted = False
 
-    for _, row in unprocessed_df.iterrows():
-        # Update points
-        if team1 == row['Team']: 
-            not_accounted = update_score(row, game_df, 1, team1, team2)
-        else:
-            not_accounted = update_score(row, game_df, 0, team1, team2)
-            
-        if not_accounted:
-            play_not_counted = True
-            
-    # Update total points and differential
-    game_df.at[0, 'TotalPts'] = game_df.at[0, 'T1Pts'] + game_df.at[0, 'T2Pts']
-    game_df.at[0, 'Differential'] = game_df.at[0, 'T1Pts'] - game_df.at[0, 'T2Pts']
-    
-    # Update the date of the game
-    game_df.at[0, 'Date'] = processed_df.at[0, 'Date']
-
-    for _, row in processed_df.iterrows():        
-        # Flag to check which team to update
-        team1_update = team1 == row['OffensivePossession']
-        
-        play_processed = False
-        key = row['SecondaryPlayType']
-        second_key = row['SecondaryAction']
-
-        # Process based on secondary play types
-        if key == 'Cuts': 
-            update_cut(team1_update, row, game_df)
-            play_processed = True
-        elif key == 'Spot Ups' and second_key == 'Shot': 
-            update_shot(team1_update, row, game_df)
-            play_processed = True
-        elif key == 'Spot Ups' and second_key == 'Drive':
-            update_drive(team1_update, row, game_df)
-            play_processed = True
-        elif key == 'P&R Roll Man':  
-            update_roll(team1_update, row, game_df)
-            play_processed = True
-
-        # If secondary play was not processed, process based on primary play types
-        if not play_processed:
-            key = row['PrimaryPlayType']
-            second_key = row['PrimaryAction']
-            
-            if key == "PNR": 
-                update_pnr(team1_update, row, game_df)
-            elif key == 'Iso':
-                update_iso(team1_update, row, game_df)
-            elif key == 'Post': 
-                update_post(team1_update, row, game_df)
-            elif key == 'Cuts': 
-                update_cut(team1_update, row, game_df)
-            elif key == 'Spot Ups' and second_key == 'Shot': 
-                update_shot(team1_update, row, game_df)
-            elif key == 'Spot Ups' and second_key == 'Drive':
-                update_drive(team1_update, row, game_df)
-            elif key == 'Off Screens':
-                update_offscreen(team1_update, row, game_df)
-            elif key == 'Hand Offs':  
-                update_handoff(team1_update, row, game_df)
-            elif key == 'Transition':  
-                update_transition(team1_update, row, game_df)
-                
-    game_df[game_df.select_dtypes(include=['float']).columns] = game_df.select_dtypes(include=['float']).round(2)
-    
-    return game_df, play_not_counted
-
-def update_pnr(t1vt2, line, df: pd.DataFrame):
+def score_game(unprocessed_df: pd.DataFrame, team1, team2):
     """
-    Updates pick and roll statistics for a team.
-    
+    Computes the points scored by Team1 and Team2 from the play results.
+
     Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
-    """
-    if t1vt2:
-        processed_columns = ['T1_PnrPlays', 'T1_Pnr3PA', 'T1_Pnr3PM', 'T1_Pnr3P%', 
-                             'T1_Pnr2PA', 'T1_Pnr2PM', 'T1_Pnr2P%', 'T1_PnrMiA',
-                             'T1_PnrMiM', 'T1_PnrMi%', 'T1_PnrEFG%', 'T1_PnrTO', 
-                             'T1_PnrFouls']
-    else:
-        processed_columns = ['T2_PnrPlays', 'T2_Pnr3PA', 'T2_Pnr3PM', 'T2_Pnr3P%', 
-                             'T2_Pnr2PA', 'T2_Pnr2PM', 'T2_Pnr2P%', 'T2_PnrMiA', 
-                             'T2_PnrMiM', 'T2_PnrMi%', 'T2_PnrEFG%', 'T2_PnrTO', 
-                             'T2_PnrFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-    
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)  # Default to 1 if not present
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[8]] += 1  # Makes
-            df.at[0, processed_columns[7]] += 1  # Attempts
-            
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[7]] += 1  # Makes
-
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-        
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[11]] += 1  # Turnovers
-        
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[12]] += 1  # Fouls
-        
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
+    - unprocessed_df: DataFrame containing unprocessed game plays.
+    - team1: Name of Team1.
+    - team2: Name of Team2.
 
+    Returns:
+    - t1_points: Points scored by Team1.
+    - t2_points: Points scored by Team2.
+    - play_not_counted: True if a free throw or and-one could not be scored.
+    """
+    result = unprocessed_df['Result']
+    tags = unprocessed_df['Synergy Tags'].astype(object)
+
+    # Tags are NaN for plays Synergy did not tag
+    has_tags = tags.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    tags = tags.where(has_tags, '')
+    free_throw_made = tags.str.contains('FTM', regex=False).to_numpy(dtype=bool)
+    three_made = tags.str.contains('3FGM', regex=False).to_numpy(dtype=bool)
+    two_made = tags.str.contains('2FGM', regex=False).to_numpy(dtype=bool)
+
+    is_free_throw = (result == 'Free Throw').to_numpy()
+    is_and_one = result.isin(['1 Pts', '0 Pts']).to_numpy()
+
+    points = np.select(
+        [(result == 'Make 2 Pts').to_numpy(),
+         (result == 'Make 3 Pts').to_numpy(),
+         is_free_throw & free_throw_made,
+         is_and_one & three_made,
+         is_and_one & two_made],
+        [2, 3, 1, 3, 2],
+        default=0
+    )
+
+    # Free throws and and-ones without tags cannot be scored
+    not_accounted = (is_free_throw | is_and_one) & ~has_tags
+    for play_number, play_result in zip(unprocessed_df['#'][not_accounted], result[not_accounted]):
+        if play_result == 'Free Throw':
+            print(f"{team1} vs {team2}: Free Throw at Play #{play_number} not accounted for.")
         else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
-
-            if shot_level != 1: 
-                df.at[0, processed_columns[8]] += 1  # Makes
-                df.at[0, processed_columns[7]] += 1  # Attempts
-                
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_Pnr2PM'] if t1vt2 else df.at[0, 'T2_Pnr2PM']
-    attempts_two = df.at[0, 'T1_Pnr2PA'] if t1vt2 else df.at[0, 'T2_Pnr2PA']
-    makes_three = df.at[0, 'T1_Pnr3PM'] if t1vt2 else df.at[0, 'T2_Pnr3PM']
-    attempts_three = df.at[0, 'T1_Pnr3PA'] if t1vt2 else df.at[0, 'T2_Pnr3PA']
-    makes_mid = df.at[0, 'T1_PnrMiM'] if t1vt2 else df.at[0, 'T2_PnrMiM']
-    attempts_mid = df.at[0, 'T1_PnrMiA'] if t1vt2 else df.at[0, 'T2_PnrMiA']
-    
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[9]] = update_shot_percent(makes_mid, attempts_mid)
-    
-    # Update EFG%
-    total_efg = update_EFGpercent(makes_two, attempts_two, makes_three, attempts_three)
-    df.at[0, processed_columns[10]] = total_efg
+            print(f"{team1} vs {team2}: And 1 at Play #{play_number} not accounted for.")
 
-def update_cut(t1vt2, line, df: pd.DataFrame):
-    """
-    Updates cut statistics for a team.
-    
-    Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
-    """
-    if t1vt2:
-        processed_columns = ['T1_CutPlays', 'T1_Cut2PA', 'T1_Cut2PM', 'T1_Cut2P%', 'T1_CutTO', 'T1_CutFouls']
-    else:
-        processed_columns = ['T2_CutPlays', 'T2_Cut2PA', 'T2_Cut2PM', 'T2_Cut2P%', 'T2_CutTO', 'T2_CutFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    if outcome == '2pMa':
-        df.at[0, processed_columns[1]] += 1  # Makes
-        df.at[0, processed_columns[2]] += 1  # Attempts
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[2]] += 1  # Attempts
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[4]] += 1  # Turnovers
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[5]] += 1  # Fouls
-    elif outcome == 'And1':
-        df.at[0, processed_columns[1]] += 1  # Makes
-        df.at[0, processed_columns[2]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes = df.at[0, processed_columns[1]]
-    attempts = df.at[0, processed_columns[2]]
-    if attempts > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes, attempts)
+    is_team1 = (unprocessed_df['Team'] == team1).to_numpy()
+    t1_points = int(points[is_team1].sum())
+    t2_points = int(points[~is_team1].sum())
 
-def update_post(t1vt2, line, df: pd.DataFrame):
-    """
-    Updates post statistics for a team.
-    
-    Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
-    """
-    if t1vt2:
-        processed_columns = ['T1_PostPlays','T1_Post2PA', 'T1_Post2PM', 'T1_Post2P%', 'T1_PostTO', 'T1_PostFouls']
-    else:
-        processed_columns = ['T2_PostPlays', 'T2_Post2PA', 'T2_Post2PM', 'T2_Post2P%', 'T2_PostTO', 'T2_PostFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    if outcome == '2pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[4]] += 1  # Turnovers
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[5]] += 1  # Fouls
-    elif outcome == 'And1':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes = df.at[0, processed_columns[2]]
-    attempts = df.at[0, processed_columns[1]]
-    if attempts > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes, attempts)
+    return t1_points, t2_points, bool(not_accounted.any())
 
-def update_roll(t1vt2, line, df: pd.DataFrame):
+def find_play_families(processed_df: pd.DataFrame):
     """
-    Updates roll statistics for a team.
-    
+    Finds the play family each processed play is counted under. The secondary
+    play type decides when it is a cut, spot up or roll, otherwise the primary does.
+
     Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
-    """
-    if t1vt2:
-        processed_columns = ['T1_RollPlays', 'T1_Roll3PA', 'T1_Roll3PM', 'T1_Roll3P%', 'T1_Roll2PA', 'T1_Roll2PM', 
-                             'T1_Roll2P%', 'T1_RollMiA', 'T1_RollMiM', 'T1_RollMi%', 'T1_RollEFG%', 'T1_RollTO', 
-                             'T1_RollFouls']
-    else:
-        processed_columns = ['T2_RollPlays', 'T2_Roll3PA', 'T2_Roll3PM', 'T2_Roll3P%', 'T2_Roll2PA', 'T2_Roll2PM', 
-                             'T2_Roll2P%', 'T2_RollMiA', 'T2_RollMiM', 'T2_RollMi%', 'T2_RollEFG%', 'T2_RollTO', 
-                             'T2_RollFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[8]] += 1  # Makes
-            df.at[0, processed_columns[7]] += 1  # Attempts
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[7]] += 1  # Makes
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[11]] += 1  # Turnovers
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[12]] += 1  # Fouls
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
-            if shot_level != 1:
-                df.at[0, processed_columns[8]] += 1  # Makes
-                df.at[0, processed_columns[7]] += 1  # Attempts
-                
-    
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_Roll2PM'] if t1vt2 else df.at[0, 'T2_Roll2PM']
-    attempts_two = df.at[0, 'T1_Roll2PA'] if t1vt2 else df.at[0, 'T2_Roll2PA']
-    makes_three = df.at[0, 'T1_Roll3PM'] if t1vt2 else df.at[0, 'T2_Roll3PM']
-    attempts_three = df.at[0, 'T1_Roll3PA'] if t1vt2 else df.at[0, 'T2_Roll3PA']
-    makes_mid = df.at[0, 'T1_RollMiA'] if t1vt2 else df.at[0, 'T2_RollMiA']
-    attempts_mid = df.at[0, 'T1_RollMiM'] if t1vt2 else df.at[0, 'T2_RollMiM']
-    
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[9]] = update_shot_percent(makes_mid, attempts_mid)
-    
-    # Update EFG%
-    total_efg = update_EFGpercent(makes_two, attempts_two, makes_three, attempts_three)
-    df.at[0, processed_columns[10]] = total_efg
+    - processed_df: DataFrame containing processed game plays.
 
-def update_shot(t1vt2, line, df: pd.DataFrame):
+    Returns:
+    - families: Array with the family prefix of every play (None if not counted).
     """
-    Updates shot statistics for a team.
-    
-    Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
+    secondary_type = processed_df['SecondaryPlayType']
+    secondary_action = processed_df['SecondaryAction']
+    primary_type = processed_df['PrimaryPlayType']
+    primary_action = processed_df['PrimaryAction']
+
+    conditions = [
+        secondary_type == 'Cuts',
+        (secondary_type == 'Spot Ups') & (secondary_action == 'Shot'),
+        (secondary_type == 'Spot Ups') & (secondary_action == 'Drive'),
+        secondary_type == 'P&R Roll Man',
+        primary_type == 'PNR',
+        primary_type == 'Iso',
+        primary_type == 'Post',
+        primary_type == 'Cuts',
+        (primary_type == 'Spot Ups') & (primary_action == 'Shot'),
+        (primary_type == 'Spot Ups') & (primary_action == 'Drive'),
+        primary_type == 'Off Screens',
+        primary_type == 'Hand Offs',
+        primary_type == 'Transition'
+    ]
+    choices = ['Cut', 'SUShot', 'SUDrive', 'Roll', 'Pnr', 'Iso', 'Post', 'Cut', 'SUShot', 'SUDrive', 'Ofsc', 'HaOf', 'Transition']
+
+    return np.select([condition.to_numpy(dtype=bool) for condition in conditions], choices, default=None)
+
+def count_play_slots(processed_df: pd.DataFrame, team1):
     """
-    if t1vt2:
-        processed_columns = ['T1_SUShotPlays', 'T1_SUShot3PA', 'T1_SUShot3PM', 'T1_SUShot3P%', 
-                             'T1_SUShotMiA', 'T1_SUShotMiM', 'T1_SUShotMi%', 
-                             'T1_SUShotTO', 'T1_SUShotFouls']
-    else:
-        processed_columns = ['T2_SUShotPlays', 'T2_SUShot3PA', 'T2_SUShot3PM', 'T2_SUShot3P%', 
-                             'T2_SUShotMiA', 'T2_SUShotMiM', 'T2_SUShotMi%', 
-                             'T2_SUShotTO', 'T2_SUShotFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[7]] += 1  # Turnovers
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[8]] += 1  # Fouls
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes_three = df.at[0, 'T1_SUShot3PM'] if t1vt2 else df.at[0, 'T2_SUShot3PM']
-    attempts_three = df.at[0, 'T1_SUShot3PA'] if t1vt2 else df.at[0, 'T2_SUShot3PA']
-    makes_mid = df.at[0, 'T1_SUShotMiM'] if t1vt2 else df.at[0, 'T2_SUShotMiM']
-    attempts_mid = df.at[0, 'T1_SUShotMiA'] if t1vt2 else df.at[0, 'T2_SUShotMiA']
-    
-    if attempts_mid > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_mid, attempts_mid)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
+    Counts every play into its (team, family, slot) counters at once.
 
-def update_drive(t1vt2, line, df: pd.DataFrame):
-    """
-    Updates drive statistics for a team.
-    
     Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
-    """
-    if t1vt2:
-        processed_columns = ['T1_SUDrivePlays', 'T1_SUDriveMiA', 'T1_SUDriveMiM', 'T1_SUDriveMi%', 
-                             'T1_SUDrive2PA', 'T1_SUDrive2PM', 'T1_SUDrive2P%', 
-                             'T1_SUDriveTO', 'T1_SUDriveFouls']
-    else:
-        processed_columns = ['T2_SUDrivePlays', 'T2_SUDriveMiA', 'T2_SUDriveMiM', 'T2_SUDriveMi%', 
-                             'T2_SUDrive2PA', 'T2_SUDrive2PM', 'T2_SUDrive2P%', 
-                             'T2_SUDriveTO', 'T2_SUDriveFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[1]] += 1  # Attempts
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[7]] += 1  # Turnovers 
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[8]] += 1  # Fouls 
-    elif outcome == 'And1':
-        if shot_level != 1:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_SUDrive2PM'] if t1vt2 else df.at[0, 'T2_SUDrive2PM']
-    attempts_two = df.at[0, 'T1_SUDrive2PA'] if t1vt2 else df.at[0, 'T2_SUDrive2PA']
-    makes_mid = df.at[0, 'T1_SUDriveMiM'] if t1vt2 else df.at[0, 'T2_SUDriveMiM']
-    attempts_mid = df.at[0, 'T1_SUDriveMiA'] if t1vt2 else df.at[0, 'T2_SUDriveMiA']
-    
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_mid, attempts_mid)
+    - processed_df: DataFrame containing processed game plays.
+    - team1: Name of Team1.
 
-def update_iso(t1vt2, line, df: pd.DataFrame):
+    Returns:
+    - running: DataFrame with one row per counted play, in play order, holding the
+               'Team' and 'Family' of the play and the counters of that team's family
+               after the play (one column per slot, e.g. 'Plays', '2PA').
     """
-    Updates isolation statistics for a team.
-    
-    Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
+    shot_level = processed_df['ShotLevel'] if 'ShotLevel' in processed_df.columns else pd.Series(1, index=processed_df.index)
+    plays = pd.DataFrame({
+        'Team': np.where(processed_df['OffensivePossession'] == team1, 'T1', 'T2'),
+        'Family': find_play_families(processed_df),
+        'Outcome': processed_df['Outcome'].to_numpy(),
+        'LevelBucket': np.select([shot_level == 1, shot_level == 4], [1, 4], default=2)
+    })
+    plays = plays[plays['Family'].notna()]
+
+    # The slot table maps every play to the counters it increments
+    increments = plays.reset_index().merge(SLOT_TABLE, on=['Family', 'Outcome', 'LevelBucket'])
+    slots = pd.crosstab(increments['index'], increments['Slot']).reindex(plays.index, fill_value=0)
+    slots['Plays'] = 1
+
+    # Every family counts its plays, running totals give the counters after each play
+    running = slots.groupby([plays['Team'], plays['Family']]).cumsum()
+    running.insert(0, 'Team', plays['Team'])
+    running.insert(1, 'Family', plays['Family'])
+
+    return running
+
+def slot_values(counters: pd.DataFrame, slot):
     """
-    if t1vt2:
-        processed_columns = ['T1_IsoPlays', 'T1_Iso3PA', 'T1_Iso3PM', 'T1_Iso3P%', 
-                             'T1_Iso2PA', 'T1_Iso2PM', 'T1_Iso2P%', 'T1_IsoMiA',
-                             'T1_IsoMiM', 'T1_IsoMi%', 'T1_IsoEFG%', 'T1_IsoTO', 'T1_IsoFouls']
-    else:
-        processed_columns = ['T2_IsoPlays', 'T2_Iso3PA', 'T2_Iso3PM', 'T2_Iso3P%', 
-                             'T2_Iso2PA', 'T2_Iso2PM', 'T2_Iso2P%', 'T2_IsoMiA', 
-                             'T2_IsoMiM', 'T2_IsoMi%', 'T2_IsoEFG%', 'T2_IsoTO', 'T2_IsoFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[8]] += 1  # Makes
-            df.at[0, processed_columns[7]] += 1  # Attempts
-            
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[7]] += 1  # Makes
-
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-        
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[11]] += 1  # Turnovers
-        
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[12]] += 1  # Fouls
-        
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
-
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
-
-            if shot_level != 1: 
-                df.at[0, processed_columns[8]] += 1  # Makes
-                df.at[0, processed_columns[7]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_Iso2PM'] if t1vt2 else df.at[0, 'T2_Iso2PM']
-    attempts_two = df.at[0, 'T1_Iso2PA'] if t1vt2 else df.at[0, 'T2_Iso2PA']
-    makes_three = df.at[0, 'T1_Iso3PM'] if t1vt2 else df.at[0, 'T2_Iso3PM']
-    attempts_three = df.at[0, 'T1_Iso3PA'] if t1vt2 else df.at[0, 'T2_Iso3PA']
-    makes_mid = df.at[0, 'T1_IsoMiM'] if t1vt2 else df.at[0, 'T2_IsoMiM']
-    attempts_mid = df.at[0, 'T1_IsoMiA'] if t1vt2 else df.at[0, 'T2_IsoMiA']
-
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[9]] = update_shot_percent(makes_mid, attempts_mid)
-    
-    # Update EFG%
-    total_efg = update_EFGpercent(makes_two, attempts_two, makes_three, attempts_three)
-    df.at[0, processed_columns[10]] = total_efg
-
-def update_transition(t1vt2, line, df: pd.DataFrame):
+    Returns the running values of a counter as a numpy array, zeros if the
+    family never incremented it during the game.
     """
-    Updates transition statistics for a team.
-    
-    Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
+    if slot in counters.columns:
+        return counters[slot].to_numpy()
+    return np.zeros(len(counters), dtype=np.int64)
+
+def final_percent(percent, numerators, denominators):
     """
-    if t1vt2:
-        processed_columns = ['T1_TransitionPlays', 'T1_Transition3PA', 'T1_Transition3PM', 'T1_Transition3P%', 
-                             'T1_Transition2PA', 'T1_Transition2PM', 'T1_Transition2P%', 'T1_TransitionMiA',
-                             'T1_TransitionMiM', 'T1_TransitionMi%', 'T1_TransitionEFG%', 'T1_TransitionTO', 
-                             'T1_TransitionFouls']
-    else:
-        processed_columns = ['T2_TransitionPlays', 'T2_Transition3PA', 'T2_Transition3PM', 'T2_Transition3P%', 
-                             'T2_Transition2PA', 'T2_Transition2PM', 'T2_Transition2P%', 'T2_TransitionMiA', 
-                             'T2_TransitionMiM', 'T2_TransitionMi%', 'T2_TransitionEFG%', 'T2_TransitionTO', 
-                             'T2_TransitionFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-        
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[8]] += 1  # Makes
-            df.at[0, processed_columns[7]] += 1  # Attempts
-            
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[7]] += 1  # Makes
-
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-        
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[11]] += 1  # Turnovers
-        
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[12]] += 1  # Fouls
-        
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
+    Returns the percentage a family ends the game with. The value stays an int when
+    every percentage written over the game was a whole number, since those never
+    turn the counter column they were written into a float. Attempts of a family in
+    one game stay far below 200, so a ratio only rounds to a whole number when it is one.
 
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
+    Parameters:
+    - percent: Percentage of the final counters (None if undefined).
+    - numerators: Running numerators of the ratio, one per written percentage.
+    - denominators: Running denominators of the ratio (0 writes an undefined percentage).
 
-            if shot_level != 1: 
-                df.at[0, processed_columns[8]] += 1  # Makes
-                df.at[0, processed_columns[7]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_Transition2PM'] if t1vt2 else df.at[0, 'T2_Transition2PM']
-    attempts_two = df.at[0, 'T1_Transition2PA'] if t1vt2 else df.at[0, 'T2_Transition2PA']
-    makes_three = df.at[0, 'T1_Transition3PM'] if t1vt2 else df.at[0, 'T2_Transition3PM']
-    attempts_three = df.at[0, 'T1_Transition3PA'] if t1vt2 else df.at[0, 'T2_Transition3PA']
-    makes_mid = df.at[0, 'T1_TransitionMiM'] if t1vt2 else df.at[0, 'T2_TransitionMiM']
-    attempts_mid = df.at[0, 'T1_TransitionMiA'] if t1vt2 else df.at[0, 'T2_TransitionMiA']
-
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[9]] = update_shot_percent(makes_mid, attempts_mid)
-    
-    # Update EFG%
-    total_efg = update_EFGpercent(makes_two, attempts_two, makes_three, attempts_three)
-    df.at[0, processed_columns[10]] = total_efg
+    Returns:
+    - percent: Final percentage, NaN if it is undefined.
+    """
+    if percent is None:
+        return np.nan
+    if (denominators == 0).any() or (numerators % denominators != 0).any():
+        return float(percent)
+    return int(percent)
 
-def update_offscreen(t1vt2, line, df: pd.DataFrame):
+def process_game(unprocessed_df: pd.DataFrame, processed_df: pd.DataFrame):
     """
-    Updates offscreen statistics for a team.
-    
+    Processes the game by updating statistics based on unprocessed and processed DataFrames.
+
     Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
+    - unprocessed_df: DataFrame containing unprocessed game plays.
+    - processed_df: DataFrame containing processed game plays.
+
+    Returns:
+    - game_df: Updated game statistics DataFrame.
     """
-    if t1vt2:
-        processed_columns = ['T1_OfscPlays', 'T1_Ofsc3PA', 'T1_Ofsc3PM', 'T1_Ofsc3P%', 
-                             'T1_Ofsc2PA', 'T1_Ofsc2PM', 'T1_Ofsc2P%', 'T1_OfscMiA',
-                             'T1_OfscMiM', 'T1_OfscMi%', 'T1_OfscEFG%', 'T1_OfscTO', 
-                             'T1_OfscFouls']
-    else:
-        processed_columns = ['T2_OfscPlays', 'T2_Ofsc3PA', 'T2_Ofsc3PM', 'T2_Ofsc3P%', 
-                             'T2_Ofsc2PA', 'T2_Ofsc2PM', 'T2_Ofsc2P%', 'T2_OfscMiA', 
-                             'T2_OfscMiM', 'T2_OfscMi%', 'T2_OfscEFG%', 'T2_OfscTO', 
-                             'T2_OfscFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-    
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[8]] += 1  # Makes
-            df.at[0, processed_columns[7]] += 1  # Attempts
-            
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[7]] += 1  # Makes
-
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-        
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[11]] += 1  # Turnovers
-        
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[12]] += 1  # Fouls
-        
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
+    processed_df = processed_df.reset_index(drop=True)
 
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
+    # Identify unique teams
+    unique_teams = processed_df['OffensivePossession'].unique().tolist()
+    if len(unique_teams) < 2:
+        print("Error: Less than two unique teams found in 'OffensivePossession'.")
+        return None
+    team1 = unique_teams[0]
+    team2 = unique_teams[1]
 
-            if shot_level != 1: 
-                df.at[0, processed_columns[8]] += 1  # Makes
-                df.at[0, processed_columns[7]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_Ofsc2PM'] if t1vt2 else df.at[0, 'T2_Ofsc2PM']
-    attempts_two = df.at[0, 'T1_Ofsc2PA'] if t1vt2 else df.at[0, 'T2_Ofsc2PA']
-    makes_three = df.at[0, 'T1_Ofsc3PM'] if t1vt2 else df.at[0, 'T2_Ofsc3PM']
-    attempts_three = df.at[0, 'T1_Ofsc3PA'] if t1vt2 else df.at[0, 'T2_Ofsc3PA']
-    makes_mid = df.at[0, 'T1_OfscMiM'] if t1vt2 else df.at[0, 'T2_OfscMiM']
-    attempts_mid = df.at[0, 'T1_OfscMiA'] if t1vt2 else df.at[0, 'T2_OfscMiA']
-
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[9]] = update_shot_percent(makes_mid, attempts_mid)
-    
-    # Update EFG%
-    total_efg = update_EFGpercent(makes_two, attempts_two, makes_three, attempts_three)
-    df.at[0, processed_columns[10]] = total_efg
+    # Initialize the game row with team names and zeros for all stats
+    game_row = dict.fromkeys(GAME_COLUMNS, 0)
+    game_row['Team1'] = team1
+    game_row['Team2'] = team2
 
-def update_handoff(t1vt2, line, df: pd.DataFrame):
-    """
-    Updates handoff statistics for a team.
-    
-    Parameters:
-    - t1vt2: Boolean flag indicating which team to update.
-    - line: A row from the processed DataFrame.
-    - df: The game DataFrame to be updated.
-    """
-    if t1vt2:
-        processed_columns = ['T1_HaOfPlays', 'T1_HaOf3PA', 'T1_HaOf3PM', 'T1_HaOf3P%', 
-                             'T1_HaOf2PA', 'T1_HaOf2PM', 'T1_HaOf2P%', 'T1_HaOfMiA',
-                             'T1_HaOfMiM', 'T1_HaOfMi%', 'T1_HaOfEFG%', 'T1_HaOfTO', 
-                             'T1_HaOfFouls']
-    else:
-        processed_columns = ['T2_HaOfPlays', 'T2_HaOf3PA', 'T2_HaOf3PM', 'T2_HaOf3P%', 
-                             'T2_HaOf2PA', 'T2_HaOf2PM', 'T2_HaOf2P%', 'T2_HaOfMiA', 
-                             'T2_HaOfMiM', 'T2_HaOfMi%', 'T2_HaOfEFG%', 'T2_HaOfTO', 
-                             'T2_HaOfFouls']
-        
-    # Increment plays
-    df.at[0, processed_columns[0]] += 1
-    
-    # Handle outcomes
-    outcome = line['Outcome']
-    shot_level = line.get('ShotLevel', 1)
-    
-    if outcome == '2pMa':
-        df.at[0, processed_columns[5]] += 1  # Makes
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[8]] += 1  # Makes
-            df.at[0, processed_columns[7]] += 1  # Attempts
-            
-    elif outcome == '2pmi':
-        df.at[0, processed_columns[4]] += 1  # Attempts
-        if shot_level != 1:
-            df.at[0, processed_columns[7]] += 1  # Makes
-
-    elif outcome == '3pMa':
-        df.at[0, processed_columns[2]] += 1  # Makes
-        df.at[0, processed_columns[1]] += 1  # Attempts
-
-    elif outcome == '3pmi':
-        df.at[0, processed_columns[1]] += 1  # Attempts
-        
-    elif outcome == 'Turnover':
-        df.at[0, processed_columns[11]] += 1  # Turnovers
-        
-    elif outcome == 'Foul':
-        df.at[0, processed_columns[12]] += 1  # Fouls
-        
-    elif outcome == 'And1':
-        if shot_level == 4:
-            df.at[0, processed_columns[2]] += 1  # Makes
-            df.at[0, processed_columns[1]] += 1  # Attempts
+    # Update points, total points and differential
+    t1_points, t2_points, play_not_counted = score_game(unprocessed_df, team1, team2)
+    game_row['T1Pts'] = t1_points
+    game_row['T2Pts'] = t2_points
+    game_row['TotalPts'] = t1_points + t2_points
+    game_row['Differential'] = t1_points - t2_points
 
-        else:
-            df.at[0, processed_columns[5]] += 1  # Makes
-            df.at[0, processed_columns[4]] += 1  # Attempts
+    # Update the date of the game
+    game_row['Date'] = processed_df.at[0, 'Date']
+
+    # Count every play into its counters at once
+    running = count_play_slots(processed_df, team1)
+    for (team, family), counters in running.groupby(['Team', 'Family'], sort=False):
+        prefix = f'{team}_{family}'
+        final = counters.iloc[-1]
+        for slot in counters.columns.drop(['Team', 'Family']):
+            if prefix + slot in game_row:
+                game_row[prefix + slot] = int(final[slot])
+
+        # Percentages are rewritten after every play of the family. A percentage
+        # stays 0 until its family has attempts, EFG% is written from the first play
+        for percent, makes, attempts in PERCENT_SLOTS[family]:
+            made = slot_values(counters, makes)
+            attempted = slot_values(counters, attempts)
+            written = attempted > 0
+            if written.any():
+                game_row[prefix + percent] = final_percent(update_shot_percent(made[-1], attempted[-1]),
+                                                           made[written], attempted[written])
+
+        if family in EFG_FAMILIES:
+            # EFG% is (2PM + 1.5 * 3PM) / FGA, doubled to stay in integers
+            made_two, attempted_two = slot_values(counters, '2PM'), slot_values(counters, '2PA')
+            made_three, attempted_three = slot_values(counters, '3PM'), slot_values(counters, '3PA')
+            efg = update_EFGpercent(made_two[-1], attempted_two[-1], made_three[-1], attempted_three[-1])
+            game_row[prefix + 'EFG%'] = final_percent(efg, 2 * made_two + 3 * made_three,
+                                                      2 * (attempted_two + attempted_three))
+
+    game_df = pd.DataFrame([game_row], columns=GAME_COLUMNS)
+    game_df[game_df.select_dtypes(include=['float']).columns] = game_df.select_dtypes(include=['float']).round(2)
 
-            if shot_level != 1: 
-                df.at[0, processed_columns[8]] += 1  # Makes
-                df.at[0, processed_columns[7]] += 1  # Attempts
-    
-    # Update shot percentages
-    makes_two = df.at[0, 'T1_HaOf2PM'] if t1vt2 else df.at[0, 'T2_HaOf2PM']
-    attempts_two = df.at[0, 'T1_HaOf2PA'] if t1vt2 else df.at[0, 'T2_HaOf2PA']
-    makes_three = df.at[0, 'T1_HaOf3PM'] if t1vt2 else df.at[0, 'T2_HaOf3PM']
-    attempts_three = df.at[0, 'T1_HaOf3PA'] if t1vt2 else df.at[0, 'T2_HaOf3PA']
-    makes_mid = df.at[0, 'T1_HaOfMiM'] if t1vt2 else df.at[0, 'T2_HaOfMiM']
-    attempts_mid = df.at[0, 'T1_HaOfMiA'] if t1vt2 else df.at[0, 'T2_HaOfMiA']
-    
-    if attempts_two > 0:
-        df.at[0, processed_columns[6]] = update_shot_percent(makes_two, attempts_two)
-    if attempts_three > 0:
-        df.at[0, processed_columns[3]] = update_shot_percent(makes_three, attempts_three)
-    if attempts_mid > 0:
-        df.at[0, processed_columns[9]] = update_shot_percent(makes_mid, attempts_mid)
-    
-    # Update EFG%
-    total_efg = update_EFGpercent(makes_two, attempts_two, makes_three, attempts_three)
-    df.at[0, processed_columns[10]] = total_efg
+    return game_df, play_not_counted
 
 def update_shot_percent(makes, attempts):
     """
@@ -1,228 +1,318 @@
 import os
+import sys
 import csv
+import shutil
+import tempfile
 import pandas as pd
-from csv_to_database import transfer_games_to_db
-
-def split_row_by_team(input_file, team1, team2, date):
-    # Configuration
-    team1_col_name = 'Team1'
-    team2_col_name = 'Team2'
-    base_output_dir = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/Teams'
-    secondary_output = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/processed_games.csv'
-    
-    # Read CSV using pandas
-    df = pd.read_csv(input_file)
-    
-    df = df[ (df['Date'] == date) & (df['Team1'] == team1) & (df['Team2'] == team2)]
-        
-    # Get the column names for writing headers later
-    fieldnames = df.columns.tolist()
-    
-    for _, row in df.iterrows():
-        
-        # Finds names of the teams
-        team1_name = row[team1_col_name]
-        team2_name = row[team2_col_name]
-        
+from csv_to_database import connect_to_db, insert_team_games, play_to_db
+from efficiency_tables import refresh_efficiency_groups
+from game_index import open_game_index, add_game_key, rebuild_game_index
+from process_games import GAME_COLUMNS
+
+BASE_OUTPUT_DIR = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/Teams'
+SECONDARY_OUTPUT = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/processed_games.csv'
+
+
+class TeamGameWriter:
+    """
+    Collects the team-perspective rows and the plays of the new games of an ingestion
+    run and writes them all at once: every team file and processed_games.csv is written
+    a single time, all TeamGames rows are inserted with one executemany, and the plays
+    and their efficiency groups are inserted in the same transaction.
+
+    Nothing is visible until flush(). The new csv files are prepared next to the
+    old ones first, the database transaction is committed, and only then are the
+    files swapped in and the game keys committed to the game index. If anything
+    fails before the commit, the database, the csv files and the index are left
+    as they were, so a rerun of the same games inserts nothing twice.
+    """
+
+    def __init__(self, base_output_dir=BASE_OUTPUT_DIR, secondary_output=SECONDARY_OUTPUT):
+        self.base_output_dir = base_output_dir
+        self.secondary_output = secondary_output
+
+        # Index of the games already written to the team files
+        index_path = os.path.join(base_output_dir, 'game_index.sqlite')
+        if not os.path.isfile(index_path):
+            os.makedirs(base_output_dir, exist_ok=True)
+            rebuild_game_index(base_output_dir, index_path)
+        self.index_conn = open_game_index(index_path)
+
+        self.columns = None
+        self.rows = []
+        self.rows_by_file = {}
+        self.plays = []
+
+    def add(self, row_dict, columns):
+        """
+        Queues a team-perspective row unless its game is already written.
+
+        Parameters:
+        - row_dict: Dictionary of the row, as built by create_row.
+        - columns: Column names of the row.
+
+        Returns:
+        - is_new_game: True if the row was queued.
+        """
+        if not add_game_key(self.index_conn, row_dict['Team'], row_dict['Opponent'], row_dict['Date']):
+            return False
+
         # Clean names for files
-        team1_name = team1_name.replace(' ', '_')
-        team2_name = team2_name.replace(' ', '_')
-
-        # Create a directory for the teams if it doesn't exist
-        team1_dir = os.path.join(base_output_dir, team1_name)
-        if not os.path.exists(team1_dir):
-            os.makedirs(team1_dir)
-        team2_dir = os.path.join(base_output_dir, team2_name)
-        if not os.path.exists(team2_dir):
-            os.makedirs(team2_dir)
-        
-        output_filename1 = team1_name + '.csv'
-        output_filename2 = team2_name + '.csv'
-        
-        # Path to the output file for this team
-        team1_file_path = os.path.join(team1_dir, output_filename1)
-        team2_file_path = os.path.join(team2_dir, output_filename2)
-
-        # Check if the files already exists to determine if we need headers
-        file1_exists = os.path.isfile(team1_file_path)
-        file2_exists = os.path.isfile(team2_file_path)
-        file_games_exists = os.path.isfile(secondary_output)
-        
-        # Create the correct row to transport
-        # Convert the row (a pandas Series) to a dict for writing
-        row_team1_df, columns = create_row('team1', row, fieldnames)
-        row_team2_df, columns = create_row('team2', row, fieldnames)
+        team_name = row_dict['Team'].replace(' ', '_')
+        team_file_path = os.path.join(self.base_output_dir, team_name, team_name + '.csv')
+
+        self.columns = columns
+        self.rows.append(row_dict)
+        self.rows_by_file.setdefault(team_file_path, []).append(row_dict)
+        self.rows_by_file.setdefault(self.secondary_output, []).append(row_dict)
+        return True
+
+    def add_plays(self, data):
+        """
+        Queues the plays of a new game.
+
+        Parameters:
+        - data: List of rows read from a cleaned game csv file.
+        """
+        self.plays.append(data)
+
+    def flush(self):
+        """
+        Writes every queued row to the team files, processed_games.csv and TeamGames,
+        and every queued play to plays.
+
+        Returns:
+        - rows: Number of team-perspective rows written.
+        """
+        if not self.rows:
+            self.index_conn.rollback()
+            return 0
+
+        prepared = {}
+        conn = None
+        try:
+            # Prepare the new version of every target file
+            for file_path, rows in self.rows_by_file.items():
+                prepared[file_path] = self.prepare_file(file_path, rows)
+
+            conn = connect_to_db()
+            if not conn:
+                raise ConnectionError("Failed to connect to the database.")
+            for data in self.plays:
+                play_to_db(conn, data)
+            if self.plays:
+                refresh_efficiency_groups(conn, [row for data in self.plays for row in data])
+            insert_team_games(conn, pd.DataFrame(self.rows))
+            conn.commit()
+        except Exception:
+            if conn:
+                conn.rollback()
+            for temp_path in prepared.values():
+                os.remove(temp_path)
+            self.index_conn.rollback()
+            raise
+        finally:
+            if conn:
+                conn.close()
+
+        for file_path, temp_path in prepared.items():
+            os.replace(temp_path, file_path)
+        self.index_conn.commit()
+
+        rows = len(self.rows)
+        self.rows = []
+        self.rows_by_file = {}
+        self.plays = []
+        return rows
+
+    def prepare_file(self, file_path, rows):
+        """
+        Writes a copy of a csv file with the given rows appended next to it.
+
+        Parameters:
+        - file_path: Path of the csv file.
+        - rows: List of row dictionaries to append.
+
+        Returns:
+        - temp_path: Path of the prepared copy.
+        """
+        directory = os.path.dirname(file_path)
+        os.makedirs(directory, exist_ok=True)
+        file_exists = os.path.isfile(file_path)
+
+        temp_file, temp_path = tempfile.mkstemp(suffix='.csv', dir=directory)
+        with os.fdopen(temp_file, 'w', newline='', encoding='utf-8') as output:
+            if file_exists:
+                with open(file_path, 'r', newline='', encoding='utf-8') as existing:
+                    shutil.copyfileobj(existing, output)
+            writer = csv.DictWriter(output, fieldnames=self.columns)
+            if not file_exists:
+                writer.writeheader()
+            writer.writerows(rows)
+        if file_exists:
+            shutil.copymode(file_path, temp_path)
+        return temp_path
+
+    def close(self):
+        """Discards any rows that were not flushed and closes the game index."""
+        self.index_conn.rollback()
+        self.index_conn.close()
+
+
+def split_row_by_team(games_df, team1, team2, date, writer=None, plays=None):
+    """
+    Splits a processed game into one row per team perspective and writes them to
+    the team files, processed_games.csv and TeamGames.
+
+    Parameters:
+    - games_df: DataFrame of the processed games, read once by the caller.
+    - team1, team2: Names of the teams of the game.
+    - date: Date of the game.
+    - writer: Optional TeamGameWriter collecting the rows of a whole ingestion run.
+              Without it the game is written right away.
+    - plays: Optional rows of the cleaned game csv file, inserted into plays with the
+             team rows unless the game is already in the game index.
+
+    Returns:
+    - is_new_game: True if the game was not written before.
+    """
+    df = games_df[ (games_df['Date'] == date) & (games_df['Team1'] == team1) & (games_df['Team2'] == team2)]
         
-        # Convert Series to dictionary before writing to CSV
-        row_team1_dict = row_team1_df.to_dict()
-        row_team2_dict = row_team2_df.to_dict()
-                
-        # Open the team file in append mode for team 1
-        if not row_exists(team1_file_path, row_team1_dict):  
-            transfer_games_to_db(row_team1_dict) 
-            with open(team1_file_path, 'a', newline='', encoding='utf-8') as team1_file:
-                writer = csv.DictWriter(team1_file, fieldnames=columns)
-                if not file1_exists:
-                    writer.writeheader() 
-                writer.writerow(row_team1_dict) 
-            with open(secondary_output, 'a', newline='', encoding='utf-8') as all_games_file:
-                writer = csv.DictWriter(all_games_file, fieldnames=columns)
-                if not file_games_exists:
-                    writer.writeheader() 
-                writer.writerow(row_team1_dict)
-
-        # Open the team file in append mode for team 2
-        if not row_exists(team2_file_path, row_team2_dict):  
-            transfer_games_to_db(row_team2_dict)
-            with open(team2_file_path, 'a', newline='', encoding='utf-8') as team2_file:
-                writer = csv.DictWriter(team2_file, fieldnames=columns)
-                if not file2_exists:
-                    writer.writeheader() 
-                writer.writerow(row_team2_dict) 
-            with open(secondary_output, 'a', newline='', encoding='utf-8') as all_games_file:
-                writer = csv.DictWriter(all_games_file, fieldnames=columns)
-                if not file_games_exists:
-                    writer.writeheader() 
-                writer.writerow(row_team2_dict)   
+    game_writer = writer if writer else TeamGameWriter()
+    
+    # Both team rows of every game, Team1 first
+    is_new_game = False
+    for team_row in create_team_rows(df).to_dict('records'):
+        is_new_game = game_writer.add(team_row, TEAM_COLUMNS) or is_new_game
+    if is_new_game and plays:
+        game_writer.add_plays(plays)
+    
+    if not writer:
+        try:
+            game_writer.flush()
+        finally:
+            game_writer.close()
                 
     print("Processing complete.")
+    return is_new_game
     
 
-def row_exists(file_path, row_dict):
-    if os.path.exists(file_path):
-        with open(file_path, 'r', newline='', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for existing_row in reader:
-                # Convert every value in existing_row to a string (by putting in quotes)
-                quoted_existing_row = {key: f'"{value}"' for key, value in existing_row.items()}
-                
-                # Compare quoted existing row with row_dict (which is already a dictionary of strings)
-                if quoted_existing_row == {key: f'"{value}"' for key, value in row_dict.items()}:
-                    return True  # Row already exists
-    return False  # Row does not exist
+def build_perspective_sources(own, other):
+    """
+    Maps every column of a team row to the column of the game row it is read from.
+
+    Parameters:
+    - own: Prefix of the team in the game row ('T1' or 'T2').
+    - other: Prefix of its opponent.
+
+    Returns:
+    - sources: Dictionary mapping team columns to game columns.
+    """
+    sources = {'Team': 'Team' + own[1], 'Opponent': 'Team' + other[1],
+               'Team_Pts': own + 'Pts', 'Opponent_Pts': other + 'Pts', 'Date': 'Date'}
+    for column in GAME_COLUMNS[6:]:
+        if own in column:
+            sources[column.replace(own, 'O')] = column
+        elif other in column:
+            sources[column.replace(other, 'D')] = column
+    return sources
+
+# Columns of a team row: the game columns seen from one team, T1/T2 become O(ffense)/D(efense)
+TEAM_COLUMNS = ['Team', 'Opponent', 'Team_Pts', 'Opponent_Pts', 'TotalPts', 'Differential'] + \
+               [col.replace('T1', 'O').replace('T2', 'D') for col in GAME_COLUMNS[6:]]
+
+# Column permutation that turns a game row into the row of each of its teams
+PERSPECTIVE_SOURCES = {'team1': build_perspective_sources('T1', 'T2'),
+                       'team2': build_perspective_sources('T2', 'T1')}
+
+
+def create_perspective(team, games_df: pd.DataFrame):
+    """
+    Turns every game of a DataFrame into the row of one of its teams.
+
+    Parameters:
+    - team: 'team1' or 'team2'.
+    - games_df: DataFrame of processed games (columns of unprocessed_games.csv).
+
+    Returns:
+    - team_df: DataFrame with TEAM_COLUMNS, one row per game.
+    """
+    sources = {team_column: game_column for team_column, game_column in PERSPECTIVE_SOURCES[team].items()
+               if game_column in games_df.columns}
+    team_df = games_df[list(sources.values())].set_axis(list(sources.keys()), axis=1)
+
+    team_df['TotalPts'] = team_df['Team_Pts'] + team_df['Opponent_Pts']
+    team_df['Differential'] = team_df['Team_Pts'] - team_df['Opponent_Pts']
+
+    return team_df.reindex(columns=TEAM_COLUMNS)
+
+def create_team_rows(games_df: pd.DataFrame):
+    """
+    Turns every game into the rows of both of its teams at once. The rows of a
+    game stay together, Team1's row first.
+
+    Parameters:
+    - games_df: DataFrame of processed games (columns of unprocessed_games.csv).
 
+    Returns:
+    - team_rows: DataFrame with TEAM_COLUMNS, two rows per game.
+    """
+    games_df = games_df.reset_index(drop=True)
+    team_rows = pd.concat([create_perspective('team1', games_df), create_perspective('team2', games_df)])
+    return team_rows.sort_index(kind='stable').reset_index(drop=True)
 
 def create_row(team, row: pd.Series, df_columns):
-    columns = ['Team', 'Opponent', 'Team_Pts', 'Opponent_Pts', 'TotalPts', 'Differential', 
-               'T1_CutPlays', 'T1_Cut2PA', 'T1_Cut2PM', 'T1_Cut2P%', 'T1_CutTO', 'T1_CutFouls', 
-               
-               'T1_PnrPlays', 'T1_Pnr3PA', 'T1_Pnr3PM', 'T1_Pnr3P%', 'T1_Pnr2PA', 'T1_Pnr2PM', 'T1_Pnr2P%', 'T1_PnrMiA','T1_PnrMiM', 
-               'T1_PnrMi%', 'T1_PnrEFG%', 'T1_PnrTO', 'T1_PnrFouls', 
-               
-               'T1_PostPlays','T1_Post2PA', 'T1_Post2PM', 'T1_Post2P%', 'T1_PostTO', 'T1_PostFouls', 
-               
-               'T1_RollPlays', 'T1_Roll3PA', 'T1_Roll3PM', 'T1_Roll3P%', 'T1_Roll2PA', 'T1_Roll2PM', 'T1_Roll2P%', 'T1_RollMiA',
-               'T1_RollMiM', 'T1_RollMi%', 'T1_RollEFG%', 'T1_RollTO', 'T1_RollFouls', 
-               
-               'T1_SUShotPlays', 'T1_SUShot3PA', 'T1_SUShot3PM', 'T1_SUShot3P%', 'T1_SUShotMiA','T1_SUShotMiM', 'T1_SUShotMi%', 
-               'T1_SUShotTO', 'T1_SUShotFouls', 
-               
-               'T1_SUDrivePlays', 'T1_SUDriveMiA', 'T1_SUDriveMiM', 'T1_SUDriveMi%', 'T1_SUDrive2PA', 'T1_SUDrive2PM', 'T1_SUDrive2P%', 
-               'T1_SUDriveTO', 'T1_SUDriveFouls',
-               
-               'T1_IsoPlays', 'T1_Iso3PA', 'T1_Iso3PM', 'T1_Iso3P%', 'T1_Iso2PA', 'T1_Iso2PM', 'T1_Iso2P%', 'T1_IsoMiA','T1_IsoMiM', 
-               'T1_IsoMi%', 'T1_IsoEFG%', 'T1_IsoTO', 'T1_IsoFouls',
-               
-               'T1_TransitionPlays', 'T1_Transition3PA', 'T1_Transition3PM', 'T1_Transition3P%', 
-               'T1_Transition2PA', 'T1_Transition2PM', 'T1_Transition2P%', 'T1_TransitionMiA','T1_TransitionMiM', 
-               'T1_TransitionMi%', 'T1_TransitionEFG%', 'T1_TransitionTO', 'T1_TransitionFouls', 
-               
-               'T1_OfscPlays', 'T1_Ofsc3PA', 'T1_Ofsc3PM', 'T1_Ofsc3P%', 'T1_Ofsc2PA', 'T1_Ofsc2PM', 'T1_Ofsc2P%', 'T1_OfscMiA','T1_OfscMiM', 
-               'T1_OfscMi%', 'T1_OfscEFG%', 'T1_OfscTO', 'T1_OfscFouls', 
-               
-               'T1_HaOfPlays', 'T1_HaOf3PA', 'T1_HaOf3PM', 'T1_HaOf3P%', 'T1_HaOf2PA', 'T1_HaOf2PM', 'T1_HaOf2P%', 'T1_HaOfMiA',
-               'T1_HaOfMiM', 'T1_HaOfMi%', 'T1_HaOfEFG%', 'T1_HaOfTO', 'T1_HaOfFouls',
-               
-               
-               'T2_CutPlays', 'T2_Cut2PA', 'T2_Cut2PM', 'T2_Cut2P%', 'T2_CutTO', 'T2_CutFouls', 
-
-               'T2_PnrPlays', 'T2_Pnr3PA', 'T2_Pnr3PM', 'T2_Pnr3P%', 'T2_Pnr2PA', 'T2_Pnr2PM', 
-               'T2_Pnr2P%', 'T2_PnrMiA', 'T2_PnrMiM', 'T2_PnrMi%', 'T2_PnrEFG%', 'T2_PnrTO', 
-               'T2_PnrFouls', 
-               
-               'T2_PostPlays', 'T2_Post2PA', 'T2_Post2PM', 'T2_Post2P%', 'T2_PostTO', 'T2_PostFouls', 
-
-               'T2_RollPlays', 'T2_Roll3PA', 'T2_Roll3PM', 'T2_Roll3P%', 'T2_Roll2PA', 
-               'T2_Roll2PM', 'T2_Roll2P%', 'T2_RollMiA', 'T2_RollMiM', 'T2_RollMi%', 
-               'T2_RollEFG%', 'T2_RollTO', 'T2_RollFouls', 
-
-               'T2_SUShotPlays', 'T2_SUShot3PA', 'T2_SUShot3PM', 'T2_SUShot3P%', 
-               'T2_SUShotMiA', 'T2_SUShotMiM', 'T2_SUShotMi%', 'T2_SUShotTO', 
-               'T2_SUShotFouls', 
-
-               'T2_SUDrivePlays', 'T2_SUDriveMiA', 'T2_SUDriveMiM', 'T2_SUDriveMi%', 'T2_SUDrive2PA', 
-               'T2_SUDrive2PM', 'T2_SUDrive2P%', 'T2_SUDriveTO', 'T2_SUDriveFouls',
-
-               'T2_IsoPlays', 'T2_Iso3PA', 'T2_Iso3PM', 'T2_Iso3P%', 'T2_Iso2PA', 
-               'T2_Iso2PM', 'T2_Iso2P%', 'T2_IsoMiA', 'T2_IsoMiM', 'T2_IsoMi%', 
-               'T2_IsoEFG%', 'T2_IsoTO', 'T2_IsoFouls',
-
-               'T2_TransitionPlays', 'T2_Transition3PA', 
-               'T2_Transition3PM', 'T2_Transition3P%', 'T2_Transition2PA', 
-               'T2_Transition2PM', 'T2_Transition2P%', 'T2_TransitionMiA', 
-               'T2_TransitionMiM', 'T2_TransitionMi%', 'T2_TransitionEFG%', 
-               'T2_TransitionTO', 'T2_TransitionFouls', 
-
-               'T2_OfscPlays', 'T2_Ofsc3PA', 'T2_Ofsc3PM', 'T2_Ofsc3P%', 
-               'T2_Ofsc2PA', 'T2_Ofsc2PM', 'T2_Ofsc2P%', 'T2_OfscMiA', 
-               'T2_OfscMiM', 'T2_OfscMi%', 'T2_OfscEFG%', 'T2_OfscTO', 
-               'T2_OfscFouls', 
-
-               'T2_HaOfPlays', 'T2_HaOf3PA', 'T2_HaOf3PM', 'T2_HaOf3P%', 
-               'T2_HaOf2PA', 'T2_HaOf2PM', 'T2_HaOf2P%', 'T2_HaOfMiA', 
-               'T2_HaOfMiM', 'T2_HaOfMi%', 'T2_HaOfEFG%', 'T2_HaOfTO', 'T2_HaOfFouls',
-               
-               'Date'
-            ]
-    
-    updated_columns = [col.replace('T1', 'O') for col in columns]
-    updated_columns = [col.replace('T2', 'D') for col in updated_columns]
-    
-    # Initialize team_df as a Series with updated_columns as its index
-    team_df = pd.Series(index=updated_columns)
-    
-    # Case: Team 1 being explored
-    if team == 'team1':
-        team_df['Team'] = row['Team1']
-        team_df['Opponent'] = row['Team2']
-        team_df['Team_Pts'] = row['T1Pts']
-        team_df['Opponent_Pts'] = row['T2Pts']
-        team_df['TotalPts'] = row['T1Pts'] + row['T2Pts']
-        team_df['Differential'] = row['T1Pts'] - row['T2Pts']
-        team_df['Date'] = row['Date']
-        
-        for i in range(6, len(df_columns)):
-            column_name = df_columns[i]
-            if 'T1' in column_name:
-                new_key = column_name.replace('T1', 'O')
-                team_df[new_key] = row[column_name]
-            elif 'T2' in column_name:
-                new_key = column_name.replace('T2', 'D')
-                team_df[new_key] = row[column_name]
-        
-        return team_df, updated_columns
-    
-    # Case: Team 2 being explored
-    team_df['Team'] = row['Team2']
-    team_df['Opponent'] = row['Team1']
-    team_df['Team_Pts'] = row['T2Pts']
-    team_df['Opponent_Pts'] = row['T1Pts']
-    team_df['TotalPts'] = row['T2Pts'] + row['T1Pts']
-    team_df['Differential'] = row['T2Pts'] - row['T1Pts']
-    team_df['Date'] = row['Date']
-    
-    for i in range(6, len(df_columns)):
-        column_name = df_columns[i]
-        if 'T1' in column_name:
-            new_key = column_name.replace('T1', 'D')
-            team_df[new_key] = row[column_name]
-        elif 'T2' in column_name:
-            new_key = column_name.replace('T2', 'O')
-            team_df[new_key] = row[column_name]
-    
-    return team_df, updated_columns
+    """
+    Creates the row of one team for a single game.
+
+    Parameters:
+    - team: 'team1' or 'team2'.
+    - row: Row of unprocessed_games.csv.
+    - df_columns: Column names of the row.
+
+    Returns:
+    - team_df: Series of the team row.
+    - columns: TEAM_COLUMNS.
+    """
+    game_df = pd.DataFrame([row], columns=df_columns)
+    return create_perspective(team, game_df).iloc[0], TEAM_COLUMNS
+
+def regenerate_team_files(input_file, base_output_dir=BASE_OUTPUT_DIR, secondary_output=SECONDARY_OUTPUT):
+    """
+    Rewrites every team file and processed_games.csv from scratch out of all games
+    of unprocessed_games.csv, then rebuilds the game index. The database is not touched.
+
+    Parameters:
+    - input_file: Path of the csv file holding the processed games.
+    - base_output_dir: Directory holding one folder with a csv file per team.
+    - secondary_output: Path of processed_games.csv.
+
+    Returns:
+    - team_rows: DataFrame of all the team rows written.
+    """
+    team_rows = create_team_rows(pd.read_csv(input_file))
+
+    # The first row of a game wins, like when the games were appended
+    team_rows = team_rows.drop_duplicates(['Team', 'Opponent', 'Date'])
+
+    # Same line endings as the rows appended with csv.DictWriter
+    for team, rows in team_rows.groupby('Team', sort=False):
+        team_name = team.replace(' ', '_')
+        team_dir = os.path.join(base_output_dir, team_name)
+        os.makedirs(team_dir, exist_ok=True)
+        rows.to_csv(os.path.join(team_dir, team_name + '.csv'), index=False, lineterminator='\r\n')
+    team_rows.to_csv(secondary_output, index=False, lineterminator='\r\n')
+
+    rebuild_game_index(base_output_dir, os.path.join(base_output_dir, 'game_index.sqlite'))
+    return team_rows
         
      
 if __name__ == '__main__':
-    split_row_by_team('/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/src/Database/GameProcessor/sample_processed_games.csv')
+    if len(sys.argv) < 2 or sys.argv[1] != 'regenerate':
+        print("Usage: python split_gamedata_by_team.py regenerate [unprocessed_games.csv]")
+        sys.exit(1)
+
+    input_file = sys.argv[2] if len(sys.argv) > 2 else '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/cleaned_game_csv/unprocessed_games.csv'
+    team_rows = regenerate_team_files(input_file)
+    print(f"Regenerated {team_rows['Team'].nunique()} team files with {len(team_rows)} rows.")
    
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+File: synergy_tokens.py
+
+Description:
+Splits every Synergy String of a game once into a token table so that
+clean_csv can derive all of its columns with vectorized pandas operations
+instead of re-splitting the same string inside per-row loops.
+
+A Synergy String looks like
+    '4 Azriel Almodovar > P&R Ball Handler > Left P&R > Ball Delivered > 12 John Doe > Spot-Up > ...'
+The part before ' > Ball Delivered > ' is segment 0 (primary play), every
+part after it is a secondary segment.
+
+"""
+
+import numpy as np
+import pandas as pd
+
+SEGMENT_DELIMITER = ' > Ball Delivered > '
+TOKEN_DELIMITER = ' > '
+
+
+class SynergyTokens:
+    """
+    Cached token table for a column of Synergy Strings.
+
+    Attributes:
+    - index: Index of the plays that were tokenized.
+    - segments: One row per (play, segment) with 'PlayPosition', 'SegmentNumber' and
+                'SegmentText', indexed by the play's index label.
+    - tokens: One row per (play, segment, token) with 'PlayPosition', 'SegmentPosition'
+              and 'Token'.
+
+    Lookups are memoized, so asking for the same token or substring twice
+    does not rescan the table.
+    """
+
+    def __init__(self, synergy_strings: pd.Series):
+        if synergy_strings.isna().any():
+            raise ValueError("Every play must have a 'Synergy String'.")
+
+        self.index = synergy_strings.index
+
+        # Split each play into its segments
+        split_segments = synergy_strings.str.split(SEGMENT_DELIMITER)
+        segment_counts = split_segments.str.len().to_numpy()
+        segments = split_segments.explode().to_frame('SegmentText')
+        segments['PlayPosition'] = np.repeat(np.arange(len(synergy_strings)), segment_counts)
+        segments['SegmentNumber'] = segments.groupby('PlayPosition').cumcount()
+        self.segments = segments
+
+        # Split each segment into its tokens
+        split_tokens = segments['SegmentText'].str.split(TOKEN_DELIMITER)
+        token_counts = split_tokens.str.len().to_numpy()
+        self.tokens = pd.DataFrame({
+            'PlayPosition': np.repeat(segments['PlayPosition'].to_numpy(), token_counts),
+            'SegmentPosition': np.repeat(np.arange(len(segments)), token_counts),
+            'Token': split_tokens.explode().to_numpy()
+        })
+        self._token_cache = {}
+        self._contains_cache = {}
+
+    def has_token(self, values):
+        """
+        Flags the plays whose Synergy String contains any of the given tokens.
+
+        Parameters:
+        - values: A token or list of tokens to look for.
+
+        Returns:
+        - Boolean Series aligned to the tokenized plays.
+        """
+        matches = self._matching_tokens(values)
+        found = np.bincount(self.tokens['PlayPosition'].to_numpy()[matches], minlength=len(self.index)) > 0
+        return pd.Series(found, index=self.index)
+
+    def segment_has_token(self, values):
+        """
+        Flags the segments that contain any of the given tokens.
+
+        Parameters:
+        - values: A token or list of tokens to look for.
+
+        Returns:
+        - Boolean array aligned to the rows of self.segments.
+        """
+        matches = self._matching_tokens(values)
+        return np.bincount(self.tokens['SegmentPosition'].to_numpy()[matches], minlength=len(self.segments)) > 0
+
+    def segment_contains(self, text):
+        """
+        Flags the segments whose raw text contains the given substring.
+
+        Parameters:
+        - text: Substring to look for.
+
+        Returns:
+        - Boolean array aligned to the rows of self.segments.
+        """
+        if text not in self._contains_cache:
+            self._contains_cache[text] = self.segments['SegmentText'].str.contains(text, regex=False).to_numpy()
+        return self._contains_cache[text]
+
+    def first_token(self, segment_number):
+        """
+        Returns the first token of the given segment for every play.
+
+        Parameters:
+        - segment_number: Segment to read (0 for the primary play).
+
+        Returns:
+        - Series aligned to the tokenized plays, NaN where the play has no such segment.
+        """
+        segment = self.segments[self.segments['SegmentNumber'] == segment_number]
+        first = segment['SegmentText'].str.split(TOKEN_DELIMITER, n=1).str[0]
+        result = pd.Series(np.nan, index=self.index, dtype=object)
+        result.iloc[segment['PlayPosition'].to_numpy()] = first.to_numpy()
+        return result
+
+    def _matching_tokens(self, values):
+        if isinstance(values, str):
+            values = [values]
+        key = tuple(values)
+        if key not in self._token_cache:
+            self._token_cache[key] = self.tokens['Token'].isin(values).to_numpy()
+        return self._token_cache[key]
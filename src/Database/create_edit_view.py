@@ -1,8 +1,16 @@
 import csv
 import os
+import time
+import argparse
 import mysql.connector
+from mysql.connector import pooling
 from dotenv import load_dotenv
 import sys
+from view_catalog import VIEW_CATALOG, match_plays
+from view_queries import load_play_descriptions, two_player_view_sql, view_sql
+# The summary tables of the views are kept by the game processor
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GameProcessor'))
+from efficiency_tables import load_efficiency_tables, build_efficiency_table
 
 # Load environment variables from .env file
 load_dotenv()
@@ -13,19 +21,33 @@ DB_NAME = os.getenv('NAME')
 DB_PORT = os.getenv('PORT')
 DB_USER = os.getenv('USERNAME')
 DB_PASS = os.getenv('PASSWORD')
+DB_POOL_SIZE = int(os.getenv('POOL_SIZE', 5))
 
-def connect_to_db():
-    """Connect to the MySQL database server"""
-    conn = None
-    try:
-        conn = mysql.connector.connect(
+# Maps every PlayID to the one-player views counting it, read by the single scan query
+VIEW_PLAYS_TABLE = 'EfficiencyViewPlays'
+
+# Connection pool of this process, created on first use
+_pool = None
+
+def get_pool():
+    """Returns the connection pool of this process, creating it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = pooling.MySQLConnectionPool(
+            pool_name='basketball_views',
+            pool_size=DB_POOL_SIZE,
             host=DB_HOST,
             port=DB_PORT,
             database=DB_NAME,
             user=DB_USER,
             password=DB_PASS
         )
-        return conn
+    return _pool
+
+def connect_to_db():
+    """Get a connection to the MySQL database server from the pool, close() returns it"""
+    try:
+        return get_pool().get_connection()
     except mysql.connector.Error as err:
         print(f"Error: {err}")
         return None
@@ -39,59 +61,7 @@ def modify_2player_view(conn, view_name, play_numbers, secondary_play_numbers):
         view_name (str): The name of the view to modify.
         play_numbers (list of int): A list of play numbers to include in the modified view.
     """
-    play_numbers_str = ', '.join(map(str, play_numbers))
-    secondary_play_numbers_str = ', '.join(map(str, secondary_play_numbers))
-
-    view_template = f"""
-    CREATE OR REPLACE VIEW {view_name} AS
-    SELECT 
-        Player1 AS PrimaryPlayer,
-        Player2 AS SecondaryPlayer,
-        Team,
-        SUM(TotalPlays) AS TotalPlays,
-        SUM(Total3ptShots) AS Total3ptShots,
-        SUM(Total3ptMakes) AS Total3ptMakes,
-        (SUM(Total3ptMakes) / NULLIF(SUM(Total3ptShots), 0)) * 100 AS "3pt%",
-        SUM(Total2ptShots) AS Total2ptShots,
-        SUM(Total2ptMakes) AS Total2ptMakes,
-        (SUM(Total2ptMakes) / NULLIF(SUM(Total2ptShots), 0)) * 100 AS "2pt%",
-        SUM(TotalMidRangeShots) AS TotalMidRangeShots,
-        SUM(TotalMidRangeMakes) AS TotalMidRangeMakes,
-        (SUM(TotalMidRangeMakes) / NULLIF(SUM(TotalMidRangeShots), 0)) * 100 AS "MidRange%",
-        (
-            (SUM(Total2ptMakes) + (1.5 * SUM(Total3ptMakes))) / 
-            NULLIF((SUM(Total2ptShots) + SUM(Total3ptShots)), 0)
-        ) * 100 AS "EFG%",
-        SUM(TurnoverCount) AS Turnover,  -- New column to count turnovers
-        SUM(FoulCount) AS Foul           -- New column to count fouls
-    FROM (
-        SELECT 
-            PrimaryPlayer AS Player1,
-            SecondaryPlayer AS Player2,
-            OffensivePossession AS Team,
-            COUNT(*) AS TotalPlays,
-            SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
-            SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
-            SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,        
-            SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
-            SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
-            SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
-            SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS TurnoverCount,  -- New calculation for turnovers
-            SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS FoulCount            -- New calculation for fouls
-        FROM plays
-        WHERE 
-            PlayID IN ({play_numbers_str})
-            AND SecondaryPlayID IN ({secondary_play_numbers_str})  -- Only include plays where PlayID is in the specified set
-            AND PrimaryPlayer <> 'N/A'
-            AND SecondaryPlayer <> 'N/A'
-        GROUP BY 
-            PrimaryPlayer, SecondaryPlayer, OffensivePossession
-    ) AS CombinedStats
-    GROUP BY 
-        PrimaryPlayer, SecondaryPlayer, Team
-    ORDER BY 
-        TotalPlays DESC;
-    """
+    view_template = two_player_view_sql(view_name, play_numbers, secondary_play_numbers)
     
     try:
         cur = conn.cursor()
@@ -111,83 +81,251 @@ def modify_view(conn, view_name, play_numbers):
         view_name (str): The name of the view to modify.
         play_numbers (list of int): A list of play numbers to include in the modified view.
     """
-    play_numbers_str = ', '.join(map(str, play_numbers))
+    view_template = view_sql(view_name, play_numbers)
+    
+    try:
+        cur = conn.cursor()
+        cur.execute(view_template)
+        print(f"View '{view_name}' modified successfully.")
+    except mysql.connector.Error as err:
+        print(f"Error: {err}")
+
+def catalog_view_sql(cur, catalog=VIEW_CATALOG):
+    """
+    Builds the statement of every view of the catalog. Every play description is
+    resolved before any view is touched, so a catalog entry matching no play stops
+    the run before it changes the database.
+
+    Args:
+        cur: Database cursor
+        catalog (list of tuple): (view name, primary plays, secondary plays, players) entries.
+
+    Returns:
+        list of tuple: (view name, statement) of every view.
+    """
+    descriptions = load_play_descriptions(cur)
+
+    statements = []
+    for view_name, plays, secondary_plays, players in catalog:
+        play_numbers = match_plays(descriptions, plays)
+        if not play_numbers:
+            raise ValueError(f"No play description matches the plays of {view_name}: {plays}")
+        if players == 1:
+            statements.append((view_name, view_sql(view_name, play_numbers)))
+            continue
+
+        secondary_play_numbers = match_plays(descriptions, secondary_plays)
+        if not secondary_play_numbers:
+            raise ValueError(f"No play description matches the secondary plays of {view_name}: {secondary_plays}")
+        statements.append((view_name, two_player_view_sql(view_name, play_numbers, secondary_play_numbers)))
+    return statements
+
+def create_all_views(conn, catalog=VIEW_CATALOG):
+    """
+    Creates or replaces every view of the catalog over one connection, and reads
+    each view once to time it. MySQL commits every CREATE VIEW by itself, so the
+    run stops at the first failing view instead of rolling back the ones before it.
+    Views with a summary table from efficiency_tables.py get their table built again,
+    so the table never holds the rows of the old view.
+
+    Args:
+        conn: Database connection object
+        catalog (list of tuple): (view name, primary plays, secondary plays, players) entries.
+
+    Returns:
+        list of tuple: (view name, DDL seconds, query seconds, rows, rebuild seconds) of every
+        view, rebuild seconds is None for a view without a summary table.
+    """
+    timings = []
+    cur = conn.cursor()
+    try:
+        statements = catalog_view_sql(cur, catalog)
+        for view_name, statement in statements:
+            start = time.perf_counter()
+            cur.execute(statement)
+            ddl_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cur.execute(f"SELECT COUNT(*) FROM `{view_name}`")
+            rows = cur.fetchone()[0]
+            query_seconds = time.perf_counter() - start
+
+            timings.append((view_name, ddl_seconds, query_seconds, rows))
+        conn.commit()
+        registered = set(table[0] for table in load_efficiency_tables(cur))
+    finally:
+        cur.close()
+
+    rebuilt_timings = []
+    for view_name, ddl_seconds, query_seconds, rows in timings:
+        rebuild_seconds = None
+        if view_name in registered:
+            start = time.perf_counter()
+            build_efficiency_table(conn, view_name)
+            rebuild_seconds = time.perf_counter() - start
+        rebuilt_timings.append((view_name, ddl_seconds, query_seconds, rows, rebuild_seconds))
+    return rebuilt_timings
+
+def print_view_timings(timings):
+    print(f"{'View':<55}{'DDL ms':>10}{'Query ms':>10}{'Rows':>8}{'Rebuild ms':>12}")
+    for view_name, ddl_seconds, query_seconds, rows, rebuild_seconds in timings:
+        rebuild = '-' if rebuild_seconds is None else f"{1000 * rebuild_seconds:.1f}"
+        print(f"{view_name:<55}{1000 * ddl_seconds:>10.1f}{1000 * query_seconds:>10.1f}{rows:>8}{rebuild:>12}")
+    rebuilt = [timing[4] for timing in timings if timing[4] is not None]
+    print(f"{len(timings)} views, {sum(timing[1] for timing in timings):.2f}s DDL, "
+          f"{sum(timing[2] for timing in timings):.2f}s queries, "
+          f"{len(rebuilt)} summary tables rebuilt in {sum(rebuilt):.2f}s")
+
+def fill_view_plays(conn, catalog=VIEW_CATALOG):
+    """
+    Fills the mapping table of the single scan with the PlayIDs of every one-player
+    view of the catalog, one (ViewName, PlayID) row per play a view counts.
+
+    Args:
+        conn: Database connection object
+        catalog (list of tuple): (view name, primary plays, secondary plays, players) entries.
+
+    Returns:
+        int: Number of mapping rows.
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {VIEW_PLAYS_TABLE} (
+            ViewName VARCHAR(64) NOT NULL,
+            PlayID INT NOT NULL,
+            PRIMARY KEY (PlayID, ViewName)
+        )
+        """)
+        descriptions = load_play_descriptions(cur)
+        rows = [(view_name, playid) for view_name, plays, secondary_plays, players in catalog if players == 1
+                for playid in match_plays(descriptions, plays)]
+
+        cur.execute(f"DELETE FROM {VIEW_PLAYS_TABLE}")
+        cur.executemany(f"INSERT INTO {VIEW_PLAYS_TABLE} (ViewName, PlayID) VALUES (%s, %s)", rows)
+        conn.commit()
+        return len(rows)
+    finally:
+        cur.close()
+
+def single_scan_sql():
+    """
+    Builds the query computing every one-player efficiency view in one pass over plays.
+    Each play is credited to its secondary player and SecondaryPlayID when it has one,
+    and to its primary player and PlayID otherwise, like the two halves of the UNION ALL
+    in modify_view. Joining the credited PlayID to the mapping table tags the play with
+    every view counting it, and grouping by (view, player, team) gives the rows of every
+    view at once. MySQL has no GROUPING SETS, the join stands in for them.
 
-    view_template = f"""
-    CREATE OR REPLACE VIEW {view_name} AS
+    Returns:
+        str: The query, its rows are the ViewName followed by the columns of modify_view.
+    """
+    return f"""
     SELECT 
-        Player,
-        Team,
-        SUM(TotalPlays) AS TotalPlays,
-        SUM(Total3ptShots) AS Total3ptShots,
-        SUM(Total3ptMakes) AS Total3ptMakes,
-        (SUM(Total3ptMakes) / NULLIF(SUM(Total3ptShots), 0)) * 100 AS "3pt%",
-        SUM(Total2ptShots) AS Total2ptShots,
-        SUM(Total2ptMakes) AS Total2ptMakes,
-        (SUM(Total2ptMakes) / NULLIF(SUM(Total2ptShots), 0)) * 100 AS "2pt%",
-        SUM(TotalMidRangeShots) AS TotalMidRangeShots,
-        SUM(TotalMidRangeMakes) AS TotalMidRangeMakes,
-        (SUM(TotalMidRangeMakes) / NULLIF(SUM(TotalMidRangeShots), 0)) * 100 AS "MidRange%",
+        ViewPlays.ViewName,
+        CreditedPlays.Player,
+        CreditedPlays.Team,
+        COUNT(0) AS TotalPlays,
+        SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
+        SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
+        (SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) / 
+            NULLIF(SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END), 0)) * 100 AS "3pt%",
+        SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,
+        SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
+        (SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) / 
+            NULLIF(SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END), 0)) * 100 AS "2pt%",
+        SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
+        SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
+        (SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) / 
+            NULLIF(SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END), 0)) * 100 AS "MidRange%",
         (
-            (SUM(Total2ptMakes) + (1.5 * SUM(Total3ptMakes))) / 
-            NULLIF((SUM(Total2ptShots) + SUM(Total3ptShots)), 0)
+            (SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) + 
+             (1.5 * SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END))) / 
+            NULLIF((SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) + 
+                    SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END)), 0)
         ) * 100 AS "EFG%",
-        SUM(TurnoverCount) AS Turnover,  -- New column to count turnovers
-        SUM(FoulCount) AS Foul           -- New column to count fouls
+        SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS Turnover,
+        SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS Foul
     FROM (
         SELECT 
-            PrimaryPlayer AS Player,
+            CASE WHEN SecondaryPlayer = 'N/A' THEN PrimaryPlayer ELSE SecondaryPlayer END AS Player,
+            CASE WHEN SecondaryPlayer = 'N/A' THEN PlayID ELSE SecondaryPlayID END AS CreditedPlayID,
             OffensivePossession AS Team,
-            COUNT(0) AS TotalPlays,
-            SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
-            SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
-            SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,        
-            SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
-            SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
-            SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
-            SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS TurnoverCount,  -- New calculation for turnovers
-            SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS FoulCount            -- New calculation for fouls
+            Outcome,
+            ShotLevel
         FROM plays
         WHERE 
-            SecondaryPlayer = 'N/A' AND PlayID in ({play_numbers_str})
-        GROUP BY 
-            PrimaryPlayer, Team
-        
-        UNION ALL
-        
-        SELECT 
-            SecondaryPlayer AS Player,
-            OffensivePossession AS Team,
-            COUNT(0) AS TotalPlays,
-            SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
-            SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
-            SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,        
-            SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
-            SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
-            SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
-            SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS TurnoverCount,  -- New calculation for turnovers
-            SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS FoulCount            -- New calculation for fouls
-            
-        FROM plays
-        WHERE 
-            SecondaryPlayer <> 'N/A' AND SecondaryPlayID in ({play_numbers_str})
-        GROUP BY 
-            SecondaryPlayer, Team
-    ) AS CombinedStats
+            SecondaryPlayer IS NOT NULL  -- Counted by neither half of modify_view
+    ) AS CreditedPlays
+    JOIN {VIEW_PLAYS_TABLE} AS ViewPlays ON ViewPlays.PlayID = CreditedPlays.CreditedPlayID
     GROUP BY 
-        Player, Team
+        ViewPlays.ViewName, CreditedPlays.Player, CreditedPlays.Team
     ORDER BY 
-        TotalPlays DESC;
+        ViewPlays.ViewName, TotalPlays DESC;
     """
-    
+
+def read_one_player_views(conn):
+    """
+    Reads the rows of every one-player efficiency view with the single scan query.
+    The mapping table has to be filled by fill_view_plays first.
+
+    Args:
+        conn: Database connection object
+
+    Returns:
+        tuple: (columns, rows) where rows maps every view name to its rows, most plays first.
+    """
+    rows = {}
+    cur = conn.cursor()
     try:
-        cur = conn.cursor()
-        cur.execute(view_template)
-        print(f"View '{view_name}' modified successfully.")
-    except mysql.connector.Error as err:
-        print(f"Error: {err}")
+        cur.execute(single_scan_sql())
+        columns = list(cur.column_names[1:])
+        for row in cur.fetchall():
+            rows.setdefault(row[0], []).append(row[1:])
+    finally:
+        cur.close()
+    return columns, rows
 
 def main():
+    parser = argparse.ArgumentParser(description='Create or modify the efficiency views.')
+    parser.add_argument('--all', action='store_true',
+                        help='Create or replace every view of view_catalog.py, rebuild their summary tables and report the timings')
+    parser.add_argument('--single-scan', action='store_true',
+                        help='Compute every one-player view of view_catalog.py in one pass over plays and report its timing')
+    args = parser.parse_args()
+
+    if args.single_scan:
+        conn = connect_to_db()
+        if not conn:
+            print("Failed to connect to the database")
+            return
+        try:
+            mappings = fill_view_plays(conn)
+            start = time.perf_counter()
+            columns, rows = read_one_player_views(conn)
+            seconds = time.perf_counter() - start
+            for view_name, view_rows in sorted(rows.items()):
+                print(f"{view_name:<55}{len(view_rows):>8} rows")
+            print(f"{len(rows)} views from {mappings} (view, PlayID) mappings in one scan, {seconds:.2f}s")
+        except Exception as e:
+            print(f"An error occurred: {e}")
+        finally:
+            conn.close()
+        return
+
+    if args.all:
+        conn = connect_to_db()
+        if not conn:
+            print("Failed to connect to the database")
+            return
+        try:
+            print_view_timings(create_all_views(conn))
+        except Exception as e:
+            print(f"An error occurred: {e}")
+        finally:
+            conn.close()
+        return
+
     conn = connect_to_db()
     if conn:
         try:
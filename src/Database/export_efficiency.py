@@ -0,0 +1,174 @@
+"""
+File: export_efficiency.py
+
+Description:
+Exports every efficiency view of view_catalog.py to the efficiency_playdata csv files
+read by seperate_player_data.py and seperate_team_offense_data.py. The views are read
+at the same time over the connection pool, each streamed with an unbuffered cursor
+into a temporary file that replaces its csv file once complete. Views whose summary
+table was built by GameProcessor/efficiency_tables.py are read from the table.
+
+Every row already carries its 'SourceFile', and with --players and --teams the
+exported rows are split into the player and team files straight from memory, without
+reading the csv files back.
+
+    python export_efficiency.py [--output directory] [--workers N] [--players directory] [--teams directory]
+
+"""
+
+import os
+import csv
+import sys
+import time
+import argparse
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from create_edit_view import connect_to_db, DB_POOL_SIZE
+from view_catalog import VIEW_CATALOG
+# The summary tables of the views are kept by the game processor
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GameProcessor'))
+from efficiency_tables import load_efficiency_tables
+# The split steps live with the analysis scripts
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DataAnalysis'))
+from seperate_player_data import combine_and_split_player_data
+from seperate_team_offense_data import combine_and_split_team_data
+
+EXPORT_DIRECTORY = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/Teams/efficiency_playdata'
+TEAM_OFFENSE_DIRECTORY = '/Users/kylekrebs/Documents/RIT-Basketball-Stats-main/data/2024_25/cleaned/Teams/team_offense_data'
+
+# Rows fetched from the server at a time
+FETCH_SIZE = 1000
+
+
+def efficiency_sources(view_names):
+    """
+    Finds what to read for every view, its summary table if one was built.
+
+    Parameters:
+    - view_names: Names of the efficiency views.
+
+    Returns:
+    - sources: Dictionary mapping every view name to the view or table to read.
+    """
+    sources = {view_name: view_name for view_name in view_names}
+    conn = connect_to_db()
+    if not conn:
+        return sources
+    try:
+        cur = conn.cursor()
+        for view_name, table_name, key_columns in load_efficiency_tables(cur):
+            if view_name in sources:
+                sources[view_name] = table_name
+        cur.close()
+    finally:
+        conn.close()
+    return sources
+
+def csv_value(value):
+    # Written the way the views used to be dumped
+    return 'NULL' if value is None else value
+
+def frame_value(value):
+    # Read the way pandas reads the csv files, '12' as an int and '50.0000' as a float
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent == 0 else float(value)
+    return value
+
+def export_view(view_name, source, output_directory, keep_rows=False):
+    """
+    Streams one efficiency view into <view name>.csv with a 'SourceFile' column.
+    The file is written next to the old one and only replaces it once complete.
+
+    Parameters:
+    - view_name: Name of the efficiency view.
+    - source: View or summary table to read.
+    - output_directory: Directory of the csv files.
+    - keep_rows: Also return the rows as a DataFrame.
+
+    Returns:
+    - (file_name, rows, seconds, df): df is None unless keep_rows is set.
+    """
+    start = time.perf_counter()
+    file_name = view_name + '.csv'
+    file_path = os.path.join(output_directory, file_name)
+    temp_path = file_path + '.tmp'
+
+    conn = connect_to_db()
+    if not conn:
+        raise RuntimeError(f"Failed to connect to the database for {view_name}")
+    kept = []
+    rows = 0
+    try:
+        cur = conn.cursor(buffered=False)
+        cur.execute(f"SELECT * FROM `{source}` ORDER BY TotalPlays DESC")
+        columns = list(cur.column_names) + ['SourceFile']
+        with open(temp_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            while True:
+                chunk = cur.fetchmany(FETCH_SIZE)
+                if not chunk:
+                    break
+                writer.writerows([csv_value(value) for value in row] + [file_name] for row in chunk)
+                if keep_rows:
+                    kept.extend([frame_value(value) for value in row] + [file_name] for row in chunk)
+                rows += len(chunk)
+        cur.close()
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    finally:
+        conn.close()
+
+    df = pd.DataFrame(kept, columns=columns) if keep_rows else None
+    return file_name, rows, time.perf_counter() - start, df
+
+def export_efficiency_views(output_directory=EXPORT_DIRECTORY, workers=DB_POOL_SIZE, keep_rows=False):
+    """
+    Exports every efficiency view of the catalog at the same time.
+
+    Parameters:
+    - output_directory: Directory of the csv files.
+    - workers: Number of views read at the same time, at most the size of the connection pool.
+    - keep_rows: Also return the rows of every view.
+
+    Returns:
+    - exports: List of (file_name, rows, seconds, df) tuples in catalog order.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    view_names = [entry[0] for entry in VIEW_CATALOG]
+    sources = efficiency_sources(view_names)
+
+    workers = max(1, min(workers, DB_POOL_SIZE))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda view_name: export_view(view_name, sources[view_name], output_directory, keep_rows),
+                                 view_names))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Export every efficiency view to the efficiency_playdata csv files.')
+    parser.add_argument('--output', default=EXPORT_DIRECTORY, help='Directory of the efficiency csv files')
+    parser.add_argument('--workers', type=int, default=DB_POOL_SIZE,
+                        help='Number of views read at the same time (default and maximum: POOL_SIZE)')
+    parser.add_argument('--players', metavar='DIRECTORY', help='Also split the rows into the player files of this directory')
+    parser.add_argument('--teams', metavar='DIRECTORY', nargs='?', const=TEAM_OFFENSE_DIRECTORY,
+                        help='Also split the rows into the team files of this directory')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    keep_rows = bool(args.players or args.teams)
+    exports = export_efficiency_views(args.output, args.workers, keep_rows)
+    for file_name, rows, seconds, df in exports:
+        print(f"{file_name:<60}{rows:>8} rows{1000 * seconds:>10.1f} ms")
+    print(f"Exported {len(exports)} views to {args.output} in {time.perf_counter() - start:.2f}s")
+
+    if keep_rows:
+        file_list = [export[0] for export in exports]
+        frames = {export[0]: export[3] for export in exports}
+        if args.players:
+            combine_and_split_player_data(file_list, args.players, loaded_frames=frames)
+        if args.teams:
+            combine_and_split_team_data(file_list, args.teams, args.output, loaded_frames=frames)
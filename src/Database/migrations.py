@@ -0,0 +1,202 @@
+"""
+File: migrations.py
+
+Description:
+Versioned index migrations of the plays and TeamGames tables. Every migration is
+applied once, in order, and recorded in SchemaMigrations with the time it was
+applied. Indexes that already exist are left alone, so a migration stopped halfway
+can be run again.
+
+The efficiency views filter plays on PlayID, SecondaryPlayID and SecondaryPlayer
+and group by PrimaryPlayer, SecondaryPlayer and OffensivePossession, the indexes
+hold those columns along with Outcome and ShotLevel so the views are answered
+from the indexes alone. The unique key on (Date, Home, Away, PlayNumber) stops a
+game from being inserted twice.
+
+    python migrations.py migrate     applies the migrations not applied yet
+    python migrations.py status      lists the migrations and whether they are applied
+    python migrations.py explain     reports the efficiency views reading a whole table
+
+"""
+
+import sys
+import mysql.connector
+from create_edit_view import connect_to_db, catalog_view_sql
+
+MIGRATIONS_TABLE = 'SchemaMigrations'
+
+# (version, name, [(table, index name, columns, unique)])
+MIGRATIONS = [
+    (1, 'Covering indexes of the one-player efficiency views', [
+        ('plays', 'idx_plays_primary_credit',
+         ['SecondaryPlayer', 'PlayID', 'PrimaryPlayer', 'OffensivePossession', 'Outcome', 'ShotLevel'], False),
+        ('plays', 'idx_plays_secondary_credit',
+         ['SecondaryPlayID', 'SecondaryPlayer', 'OffensivePossession', 'Outcome', 'ShotLevel'], False),
+    ]),
+    (2, 'Covering index of the two-player efficiency views', [
+        ('plays', 'idx_plays_pair',
+         ['PlayID', 'SecondaryPlayID', 'PrimaryPlayer', 'SecondaryPlayer', 'OffensivePossession', 'Outcome', 'ShotLevel'], False),
+    ]),
+    (3, 'Game lookup index of TeamGames', [
+        ('TeamGames', 'idx_teamgames_game', ['Team', 'Opponent', 'Date'], False),
+    ]),
+    (4, 'Unique key of a play', [
+        ('plays', 'uq_plays_play', ['Date', 'Home', 'Away', 'PlayNumber'], True),
+    ]),
+]
+
+
+def create_migrations_table(cur):
+    cur.execute(f"""
+    CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} (
+        Version INT PRIMARY KEY,
+        Name VARCHAR(255) NOT NULL,
+        AppliedAt DATETIME NOT NULL
+    )
+    """)
+
+def applied_versions(cur):
+    """Returns the set of the migration versions already applied"""
+    create_migrations_table(cur)
+    cur.execute(f"SELECT Version FROM {MIGRATIONS_TABLE}")
+    return set(row[0] for row in cur.fetchall())
+
+def index_exists(cur, table, index_name):
+    cur.execute("SELECT COUNT(*) FROM information_schema.STATISTICS\
+                 WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s", (table, index_name))
+    return cur.fetchone()[0] > 0
+
+def count_duplicates(cur, table, columns):
+    """Number of column combinations found in more than one row of the table"""
+    columns_str = ', '.join(f'`{column}`' for column in columns)
+    cur.execute(f"SELECT COUNT(*) FROM (SELECT 1 FROM `{table}` GROUP BY {columns_str} HAVING COUNT(*) > 1) AS Duplicates")
+    return cur.fetchone()[0]
+
+def add_index(cur, table, index_name, columns, unique=False):
+    """
+    Adds an index to a table unless it already exists. A unique key is only added
+    when no rows share its columns, otherwise the duplicates have to be removed first.
+
+    Parameters:
+    - cur: A MySQL cursor.
+    - table: Name of the table.
+    - index_name: Name of the index.
+    - columns: Columns of the index, in order.
+    - unique: Add a unique key instead of an index.
+
+    Returns:
+    - added: True if the index was added, False if it already existed.
+    """
+    if index_exists(cur, table, index_name):
+        return False
+
+    if unique:
+        duplicates = count_duplicates(cur, table, columns)
+        if duplicates:
+            raise ValueError(f"{duplicates} ({', '.join(columns)}) combinations are in more than one row of {table}, "
+                             f"remove them before adding {index_name}")
+
+    columns_str = ', '.join(f'`{column}`' for column in columns)
+    kind = 'UNIQUE INDEX' if unique else 'INDEX'
+    cur.execute(f"ALTER TABLE `{table}` ADD {kind} `{index_name}` ({columns_str})")
+    return True
+
+def migrate(conn, migrations=MIGRATIONS):
+    """
+    Applies every migration not applied yet, in version order. MySQL commits every
+    ALTER TABLE by itself, so a migration is recorded once all its indexes exist and
+    the run stops at the first failing one.
+
+    Parameters:
+    - conn: A MySQL database connection object.
+    - migrations: List of (version, name, indexes) migrations.
+
+    Returns:
+    - applied: List of the versions applied by this run.
+    """
+    applied = []
+    cur = conn.cursor()
+    try:
+        done = applied_versions(cur)
+        for version, name, indexes in sorted(migrations):
+            if version in done:
+                continue
+            for table, index_name, columns, unique in indexes:
+                added = add_index(cur, table, index_name, columns, unique)
+                print(f"{version}: {index_name} on {table} {'added' if added else 'already exists'}")
+            cur.execute(f"INSERT INTO {MIGRATIONS_TABLE} (Version, Name, AppliedAt) VALUES (%s, %s, NOW())", (version, name))
+            conn.commit()
+            applied.append(version)
+    finally:
+        cur.close()
+    return applied
+
+def print_status(conn, migrations=MIGRATIONS):
+    cur = conn.cursor()
+    try:
+        done = applied_versions(cur)
+    finally:
+        cur.close()
+    for version, name, indexes in sorted(migrations):
+        print(f"{version:>3}  {'applied' if version in done else 'pending':<8}  {name}")
+
+def full_scans(conn):
+    """
+    Runs EXPLAIN on the query of every view of the catalog and finds the tables
+    they read in full. Derived tables are left out, they are built by the query.
+
+    Parameters:
+    - conn: A MySQL database connection object.
+
+    Returns:
+    - scans: List of (view name, table, rows) of every full table scan.
+    """
+    scans = []
+    cur = conn.cursor()
+    try:
+        statements = catalog_view_sql(cur)
+    finally:
+        cur.close()
+
+    cur = conn.cursor(dictionary=True)
+    try:
+        for view_name, statement in statements:
+            # The query of the view is what follows 'CREATE OR REPLACE VIEW <name> AS'
+            query = statement.split(' AS\n', 1)[1].strip().rstrip(';')
+            cur.execute('EXPLAIN ' + query)
+            for row in cur.fetchall():
+                table = row.get('table') or ''
+                if row.get('type') == 'ALL' and not table.startswith('<'):
+                    scans.append((view_name, table, row.get('rows')))
+    finally:
+        cur.close()
+    return scans
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command not in ('migrate', 'status', 'explain'):
+        print("Usage: python migrations.py migrate | status | explain")
+        sys.exit(1)
+
+    conn = connect_to_db()
+    if not conn:
+        print("Failed to connect to the database")
+        sys.exit(1)
+
+    try:
+        if command == 'migrate':
+            applied = migrate(conn)
+            print(f"Applied {len(applied)} migrations." if applied else "Every migration is already applied.")
+        elif command == 'status':
+            print_status(conn)
+        else:
+            scans = full_scans(conn)
+            for view_name, table, rows in scans:
+                print(f"{view_name:<55}{table:<12}{rows or 0:>10} rows")
+            print(f"{len(scans)} full table scans in the efficiency views.")
+    except (mysql.connector.Error, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
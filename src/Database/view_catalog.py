@@ -0,0 +1,179 @@
+"""
+File: view_catalog.py
+
+Description:
+Catalog of the efficiency views read by the scouting reports, one entry per view:
+
+    (view name, primary plays, secondary plays, players)
+
+Plays are lists of (PlayType, Direction, Play_Action) descriptions where None matches
+any value, so ('PNR', 'High', None) stands for every high pick and roll. They are
+resolved to the PlayIDs of the PlayDescriptions table when the views are created,
+since the PlayIDs are assigned by the database.
+
+One-player views (players = 1) credit the play to the primary player, or to the
+secondary player when the play has one, and only use the primary plays for both.
+Two-player views (players = 2) count the plays of a primary and secondary player
+pair whose plays match both lists.
+
+"""
+
+ALL_PLAYS = [(None, None, None)]
+
+CUTS = [('Cuts', None, None)]
+ISO = [('Iso', None, None)]
+PNR = [('PNR', None, None)]
+POST = [('Post', None, None)]
+ROLL_MAN = [('P&R Roll Man', None, None)]
+SPOT_UP_DRIVES = [('Spot Ups', None, 'Drive')]
+SPOT_UP_JUMPERS = [('Spot Ups', None, 'Shot')]
+
+ONE_PLAYER_VIEWS = [
+    ('playerefficiency', ALL_PLAYS),
+    ('playerefficiencyleft', [(None, 'Left', None)]),
+    ('playerefficiencyright', [(None, 'Right', None)]),
+
+    ('player_cut_efficiency', CUTS),
+    ('player_cut_basket_efficiency', [('Cuts', None, 'Basket')]),
+    ('player_cut_flash_efficiency', [('Cuts', None, 'Flash')]),
+    ('player_cut_screen_efficiency', [('Cuts', None, 'Screen')]),
+
+    ('player_handoffs_efficiency', [('Hand Offs', None, None)]),
+    ('player_handoffs_dribble_efficiency', [('Hand Offs', None, 'Dribble')]),
+    ('player_handoffs_stationary_efficiency', [('Hand Offs', None, 'Stationary')]),
+    ('player_handoffs_bhleft_efficiency', [('Hand Offs', 'Left', None)]),
+    ('player_handoffs_bhleft_dribble_efficiency', [('Hand Offs', 'Left', 'Dribble')]),
+    ('player_handoffs_bhleft_stationary_efficiency', [('Hand Offs', 'Left', 'Stationary')]),
+    ('player_handoffs_bhright_efficiency', [('Hand Offs', 'Right', None)]),
+    ('player_handoffs_bhright_dribble_efficiency', [('Hand Offs', 'Right', 'Dribble')]),
+    ('player_handoffs_bhright_stationary_efficiency', [('Hand Offs', 'Right', 'Stationary')]),
+    ('player_handoffs_top_efficiency', [('Hand Offs', 'Top', None)]),
+    ('player_handoffs_top_dribble_efficiency', [('Hand Offs', 'Top', 'Dribble')]),
+    ('player_handoffs_top_stationary_efficiency', [('Hand Offs', 'Top', 'Stationary')]),
+
+    ('player_iso_efficiency', ISO),
+    ('player_iso_left_efficiency', [('Iso', 'Left', None)]),
+    ('player_iso_right_efficiency', [('Iso', 'Right', None)]),
+    ('player_iso_top_efficiency', [('Iso', 'Top', None)]),
+
+    ('player_misc_efficiency', [('Misc', None, None)]),
+
+    ('player_offscreens_efficiency', [('Off Screens', None, None)]),
+    ('player_offscreens_curl_efficiency', [('Off Screens', None, 'Curl')]),
+    ('player_offscreens_flare_efficiency', [('Off Screens', None, 'Flare')]),
+    ('player_offscreens_straight_efficiency', [('Off Screens', None, 'Straight')]),
+    ('player_offscreens_leftshoulder_efficiency', [('Off Screens', 'Left', None)]),
+    ('player_offscreens_leftshoulder_curl_efficiency', [('Off Screens', 'Left', 'Curl')]),
+    ('player_offscreens_leftshoulder_straight_efficiency', [('Off Screens', 'Left', 'Straight')]),
+    ('player_offscreens_rightshoulder_efficiency', [('Off Screens', 'Right', None)]),
+    ('player_offscreens_rightshoulder_curl_efficiency', [('Off Screens', 'Right', 'Curl')]),
+    ('player_offscreens_rightshoulder_flare_efficiency', [('Off Screens', 'Right', 'Flare')]),
+    ('player_offscreens_rightshoulder_straight_efficiency', [('Off Screens', 'Right', 'Straight')]),
+
+    ('player_pnr_efficiency', PNR),
+    ('player_pnr_offpick_efficiency', [('PNR', None, 'Off')]),
+    ('player_pnr_rejectpick_efficiency', [('PNR', None, 'Away')]),
+    ('player_pnr_bhhigh_efficiency', [('PNR', 'High', None)]),
+    ('player_pnr_bhhigh_offpick_efficiency', [('PNR', 'High', 'Off')]),
+    ('player_pnr_bhhigh_rejectpick_efficiency', [('PNR', 'High', 'Away')]),
+    ('player_pnr_bhleft_efficiency', [('PNR', 'Left', None)]),
+    ('player_pnr_bhleft_offpick_efficiency', [('PNR', 'Left', 'Off')]),
+    ('player_pnr_bhleft_rejectpick_efficiency', [('PNR', 'Left', 'Away')]),
+    ('player_pnr_bhright_efficiency', [('PNR', 'Right', None)]),
+    ('player_pnr_bhright_offpick_efficiency', [('PNR', 'Right', 'Off')]),
+    ('player_pnr_bhright_rejectpick_efficiency', [('PNR', 'Right', 'Away')]),
+
+    ('player_post_efficiency', POST),
+    ('player_post_faceup_efficiency', [('Post', None, 'Face Up')]),
+    ('player_post_leftshoulder_efficiency', [('Post', None, 'Left Shoulder')]),
+    ('player_post_rightshoulder_efficiency', [('Post', None, 'Right Shoulder')]),
+    ('player_post_leftblock_efficiency', [('Post', 'Left', None)]),
+    ('player_post_leftblock_faceup_efficiency', [('Post', 'Left', 'Face Up')]),
+    ('player_post_leftblock_leftshoulder_efficiency', [('Post', 'Left', 'Left Shoulder')]),
+    ('player_post_leftblock_rightshoulder_efficiency', [('Post', 'Left', 'Right Shoulder')]),
+    ('player_post_middle_efficiency', [('Post', 'Middle', None)]),
+    ('player_post_middle_faceup_efficiency', [('Post', 'Middle', 'Face Up')]),
+    ('player_post_middle_leftshoulder_efficiency', [('Post', 'Middle', 'Left Shoulder')]),
+    ('player_post_middle_rightshoulder_efficiency', [('Post', 'Middle', 'Right Shoulder')]),
+    ('player_post_rightblock_efficiency', [('Post', 'Right', None)]),
+    ('player_post_rightblock_faceup_efficiency', [('Post', 'Right', 'Face Up')]),
+    ('player_post_rightblock_leftshoulder_efficiency', [('Post', 'Right', 'Left Shoulder')]),
+    ('player_post_rightblock_rightshoulder_efficiency', [('Post', 'Right', 'Right Shoulder')]),
+
+    ('player_rollman_efficiency', ROLL_MAN),
+    ('player_rollman_pop_efficiency', [('P&R Roll Man', None, 'Pop')]),
+    ('player_rollman_roll_efficiency', [('P&R Roll Man', None, 'Roll')]),
+    ('player_rollman_slip_efficiency', [('P&R Roll Man', None, 'Slips')]),
+    ('player_rollman_leftdrive_efficiency', [('P&R Roll Man', 'Left', None)]),
+    ('player_rollman_leftdrive_pop_efficiency', [('P&R Roll Man', 'Left', 'Pop')]),
+    ('player_rollman_leftdrive_slip_efficiency', [('P&R Roll Man', 'Left', 'Slips')]),
+    ('player_rollman_rightdrive_efficiency', [('P&R Roll Man', 'Right', None)]),
+    ('player_rollman_rightdrive_pop_efficiency', [('P&R Roll Man', 'Right', 'Pop')]),
+    ('player_rollman_rightdrive_slip_efficiency', [('P&R Roll Man', 'Right', 'Slips')]),
+
+    ('player_spotup_efficiency', [('Spot Ups', None, None)]),
+    ('player_spotup_drive_efficiency', SPOT_UP_DRIVES),
+    ('player_spotup_jumpshot_efficiency', SPOT_UP_JUMPERS),
+    ('player_spotup_leftdrive_efficiency', [('Spot Ups', 'Left', 'Drive')]),
+    ('player_spotup_rightdrive_efficiency', [('Spot Ups', 'Right', 'Drive')]),
+    ('player_spotup_straightdrive_efficiency', [('Spot Ups', 'Straight', 'Drive')]),
+
+    ('player_transition_bh_efficiency', [('Transition', None, 'Ball Handler')]),
+    ('player_transition_leakouts_efficiency', [('Transition', None, 'Leak Outs')]),
+    ('player_transition_leftwing_efficiency', [('Transition', None, 'Left Wing')]),
+    ('player_transition_rightwing_efficiency', [('Transition', None, 'Right Wing')]),
+    ('player_transition_trailer_efficiency', [('Transition', None, 'Trailer')]),
+]
+
+TWO_PLAYER_VIEWS = [
+    ('twoplayer_iso_cut_efficiency', ISO, CUTS),
+    ('twoplayer_iso_spotupdrives_efficiency', ISO, SPOT_UP_DRIVES),
+    ('twoplayer_iso_spotupjumpers_efficiency', ISO, SPOT_UP_JUMPERS),
+
+    ('twoplayer_pnr_cut_efficiency', PNR, CUTS),
+    ('twoplayer_pnr_spotupdrives_efficiency', PNR, SPOT_UP_DRIVES),
+    ('twoplayer_pnr_spotupsdrives_efficiency', PNR, SPOT_UP_DRIVES),
+    ('twoplayer_pnr_spotupsjumpers_efficiency', PNR, SPOT_UP_JUMPERS),
+    ('twoplayer_bhhigh_rollmanpops_efficiency', [('PNR', 'High', None)], [('P&R Roll Man', None, 'Pop')]),
+
+    ('twoplayer_post_cut_efficiency', POST, CUTS),
+    ('twoplayer_post_spotupdrive_efficiency', POST, SPOT_UP_DRIVES),
+    ('twoplayer_post_spotupjumper_efficiency', POST, SPOT_UP_JUMPERS),
+]
+
+# Every ball handler side of the pick and roll against every kind of partner
+for _direction in ['High', 'Left', 'Right']:
+    _ball_handler = [('PNR', _direction, None)]
+    _side = 'pnrbh' + _direction.lower()
+    TWO_PLAYER_VIEWS += [
+        (f'twoplayer_{_side}_cuts_efficiency', _ball_handler, CUTS),
+        (f'twoplayer_{_side}_rollman_efficiency', _ball_handler, ROLL_MAN),
+        (f'twoplayer_{_side}_rollmanpops_efficiency', _ball_handler, [('P&R Roll Man', None, 'Pop')]),
+        (f'twoplayer_{_side}_rollmanrolls_efficiency', _ball_handler, [('P&R Roll Man', None, 'Roll')]),
+        (f'twoplayer_{_side}_rollmanslips_efficiency', _ball_handler, [('P&R Roll Man', None, 'Slips')]),
+        (f'twoplayer_{_side}_spotupdrives_efficiency', _ball_handler, SPOT_UP_DRIVES),
+        (f'twoplayer_{_side}_spotupjumper_efficiency', _ball_handler, SPOT_UP_JUMPERS),
+    ]
+
+VIEW_CATALOG = ([(view_name, plays, None, 1) for view_name, plays in ONE_PLAYER_VIEWS] +
+                [(view_name, plays, secondary_plays, 2) for view_name, plays, secondary_plays in TWO_PLAYER_VIEWS])
+
+
+def match_plays(descriptions, plays):
+    """
+    Resolves play descriptions to PlayIDs.
+
+    Args:
+        descriptions (list of tuple): (PlayID, PlayType, Direction, Play_Action) rows of PlayDescriptions.
+        plays (list of tuple): (PlayType, Direction, Play_Action) patterns, None matches any value.
+
+    Returns:
+        list of int: Sorted PlayIDs matching any of the patterns.
+    """
+    def same(pattern, value):
+        # Compared the way MySQL's case-insensitive collation does
+        return pattern is None or (value is not None and str(value).rstrip().lower() == pattern.lower())
+
+    return sorted(set(playid for playid, *description in descriptions
+                      for pattern in plays
+                      if all(same(part, value) for part, value in zip(pattern, description))))
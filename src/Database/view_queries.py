@@ -0,0 +1,193 @@
+"""
+File: view_queries.py
+
+Description:
+Queries of the efficiency views of view_catalog.py. create_edit_view.py creates the
+views from them, and efficiency_tables.py runs them with extra conditions on plays to
+refresh only some groups of a summary table, since MySQL cannot push a condition on
+the view down through its UNION ALL and GROUP BY.
+
+"""
+
+
+def load_play_descriptions(cur):
+    """Returns the (PlayID, PlayType, Direction, Play_Action) rows of PlayDescriptions"""
+    cur.execute("SELECT PlayID, PlayType, Direction, Play_Action FROM PlayDescriptions")
+    return cur.fetchall()
+
+def two_player_query(play_numbers, secondary_play_numbers, condition=None):
+    """
+    Builds the query of a two-player efficiency view.
+
+    Args:
+        play_numbers (list of int): Play numbers of the primary player.
+        secondary_play_numbers (list of int): Play numbers of the secondary player.
+        condition (str): Optional extra condition on the columns of plays.
+
+    Returns:
+        str: The query.
+    """
+    play_numbers_str = ', '.join(map(str, play_numbers))
+    secondary_play_numbers_str = ', '.join(map(str, secondary_play_numbers))
+    pair_filter = f"\n            AND {condition}" if condition else ''
+
+    return f"""
+    SELECT 
+        Player1 AS PrimaryPlayer,
+        Player2 AS SecondaryPlayer,
+        Team,
+        SUM(TotalPlays) AS TotalPlays,
+        SUM(Total3ptShots) AS Total3ptShots,
+        SUM(Total3ptMakes) AS Total3ptMakes,
+        (SUM(Total3ptMakes) / NULLIF(SUM(Total3ptShots), 0)) * 100 AS "3pt%",
+        SUM(Total2ptShots) AS Total2ptShots,
+        SUM(Total2ptMakes) AS Total2ptMakes,
+        (SUM(Total2ptMakes) / NULLIF(SUM(Total2ptShots), 0)) * 100 AS "2pt%",
+        SUM(TotalMidRangeShots) AS TotalMidRangeShots,
+        SUM(TotalMidRangeMakes) AS TotalMidRangeMakes,
+        (SUM(TotalMidRangeMakes) / NULLIF(SUM(TotalMidRangeShots), 0)) * 100 AS "MidRange%",
+        (
+            (SUM(Total2ptMakes) + (1.5 * SUM(Total3ptMakes))) / 
+            NULLIF((SUM(Total2ptShots) + SUM(Total3ptShots)), 0)
+        ) * 100 AS "EFG%",
+        SUM(TurnoverCount) AS Turnover,  -- New column to count turnovers
+        SUM(FoulCount) AS Foul           -- New column to count fouls
+    FROM (
+        SELECT 
+            PrimaryPlayer AS Player1,
+            SecondaryPlayer AS Player2,
+            OffensivePossession AS Team,
+            COUNT(*) AS TotalPlays,
+            SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
+            SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
+            SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,        
+            SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
+            SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
+            SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
+            SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS TurnoverCount,  -- New calculation for turnovers
+            SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS FoulCount            -- New calculation for fouls
+        FROM plays
+        WHERE 
+            PlayID IN ({play_numbers_str})
+            AND SecondaryPlayID IN ({secondary_play_numbers_str})  -- Only include plays where PlayID is in the specified set
+            AND PrimaryPlayer <> 'N/A'
+            AND SecondaryPlayer <> 'N/A'{pair_filter}
+        GROUP BY 
+            PrimaryPlayer, SecondaryPlayer, OffensivePossession
+    ) AS CombinedStats
+    GROUP BY 
+        PrimaryPlayer, SecondaryPlayer, Team
+    ORDER BY 
+        TotalPlays DESC"""
+
+def two_player_view_sql(view_name, play_numbers, secondary_play_numbers):
+    """
+    Builds the CREATE OR REPLACE VIEW statement of a two-player efficiency view.
+
+    Args:
+        view_name (str): The name of the view.
+        play_numbers (list of int): Play numbers of the primary player.
+        secondary_play_numbers (list of int): Play numbers of the secondary player.
+
+    Returns:
+        str: The statement.
+    """
+    query = two_player_query(play_numbers, secondary_play_numbers)
+    return f"\n    CREATE OR REPLACE VIEW {view_name} AS{query};\n    "
+
+def one_player_query(play_numbers, player_condition=None):
+    """
+    Builds the query of a one-player efficiency view.
+
+    Args:
+        play_numbers (list of int): Play numbers credited to the player.
+        player_condition (str): Optional extra condition on the columns of plays, added to
+            both halves of the UNION ALL. {player} stands for the column of the credited
+            player, PrimaryPlayer in the first half and SecondaryPlayer in the second, so
+            its values are passed once for each half.
+
+    Returns:
+        str: The query.
+    """
+    play_numbers_str = ', '.join(map(str, play_numbers))
+    primary_filter = f" AND {player_condition.format(player='PrimaryPlayer')}" if player_condition else ''
+    secondary_filter = f" AND {player_condition.format(player='SecondaryPlayer')}" if player_condition else ''
+
+    return f"""
+    SELECT 
+        Player,
+        Team,
+        SUM(TotalPlays) AS TotalPlays,
+        SUM(Total3ptShots) AS Total3ptShots,
+        SUM(Total3ptMakes) AS Total3ptMakes,
+        (SUM(Total3ptMakes) / NULLIF(SUM(Total3ptShots), 0)) * 100 AS "3pt%",
+        SUM(Total2ptShots) AS Total2ptShots,
+        SUM(Total2ptMakes) AS Total2ptMakes,
+        (SUM(Total2ptMakes) / NULLIF(SUM(Total2ptShots), 0)) * 100 AS "2pt%",
+        SUM(TotalMidRangeShots) AS TotalMidRangeShots,
+        SUM(TotalMidRangeMakes) AS TotalMidRangeMakes,
+        (SUM(TotalMidRangeMakes) / NULLIF(SUM(TotalMidRangeShots), 0)) * 100 AS "MidRange%",
+        (
+            (SUM(Total2ptMakes) + (1.5 * SUM(Total3ptMakes))) / 
+            NULLIF((SUM(Total2ptShots) + SUM(Total3ptShots)), 0)
+        ) * 100 AS "EFG%",
+        SUM(TurnoverCount) AS Turnover,  -- New column to count turnovers
+        SUM(FoulCount) AS Foul           -- New column to count fouls
+    FROM (
+        SELECT 
+            PrimaryPlayer AS Player,
+            OffensivePossession AS Team,
+            COUNT(0) AS TotalPlays,
+            SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
+            SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
+            SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,        
+            SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
+            SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
+            SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
+            SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS TurnoverCount,  -- New calculation for turnovers
+            SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS FoulCount            -- New calculation for fouls
+        FROM plays
+        WHERE 
+            SecondaryPlayer = 'N/A' AND PlayID in ({play_numbers_str}){primary_filter}
+        GROUP BY 
+            PrimaryPlayer, Team
+        
+        UNION ALL
+        
+        SELECT 
+            SecondaryPlayer AS Player,
+            OffensivePossession AS Team,
+            COUNT(0) AS TotalPlays,
+            SUM(CASE WHEN Outcome IN ('3pmi', '3pma') THEN 1 ELSE 0 END) AS Total3ptShots,
+            SUM(CASE WHEN Outcome = '3pMa' THEN 1 ELSE 0 END) AS Total3ptMakes,
+            SUM(CASE WHEN (ShotLevel IN (1, 2, 3) AND Outcome NOT IN ('Turnover', 'Foul')) THEN 1 ELSE 0 END) AS Total2ptShots,        
+            SUM(CASE WHEN (Outcome IN ('2pMa', 'And1') AND ShotLevel IN (1, 2, 3)) THEN 1 ELSE 0 END) AS Total2ptMakes,
+            SUM(CASE WHEN ShotLevel IN (2, 3) THEN 1 ELSE 0 END) AS TotalMidRangeShots,
+            SUM(CASE WHEN (ShotLevel IN (2, 3) AND Outcome IN ('And1', '2pMa')) THEN 1 ELSE 0 END) AS TotalMidRangeMakes,
+            SUM(CASE WHEN Outcome = 'Turnover' THEN 1 ELSE 0 END) AS TurnoverCount,  -- New calculation for turnovers
+            SUM(CASE WHEN Outcome = 'Foul' THEN 1 ELSE 0 END) AS FoulCount            -- New calculation for fouls
+            
+        FROM plays
+        WHERE 
+            SecondaryPlayer <> 'N/A' AND SecondaryPlayID in ({play_numbers_str}){secondary_filter}
+        GROUP BY 
+            SecondaryPlayer, Team
+    ) AS CombinedStats
+    GROUP BY 
+        Player, Team
+    ORDER BY 
+        TotalPlays DESC"""
+
+def view_sql(view_name, play_numbers):
+    """
+    Builds the CREATE OR REPLACE VIEW statement of a one-player efficiency view.
+
+    Args:
+        view_name (str): The name of the view.
+        play_numbers (list of int): Play numbers credited to the player.
+
+    Returns:
+        str: The statement.
+    """
+    query = one_player_query(play_numbers)
+    return f"\n    CREATE OR REPLACE VIEW {view_name} AS{query};\n    "